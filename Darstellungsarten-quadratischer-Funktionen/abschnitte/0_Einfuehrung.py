@@ -0,0 +1,21 @@
+import streamlit as st
+
+# Einführung
+st.markdown("""
+## Einführung
+
+In diesem interaktiven Tool lernst du die drei verschiedenen Darstellungsformen einer quadratischen Funktion kennen:
+
+1. **Scheitelpunktform**: $f(x)=a\\cdot(x−d)^2+e$
+2. **Faktorisierte Form** - auch Nullstellenform genannt: $f(x)=a\\cdot(x−x_1)\\cdot(x−x_2)$
+3. **Polynomform** - auch allgemeine Form genannt: $f(x)=ax^2+bx+c$
+
+Jede Form hat ihre eigenen Stärken und zeigt unterschiedliche Eigenschaften der Parabel!
+
+### Am Ende dieses Kapitels solltest du folgendes gelernt haben:
+
+1. Ich kann die drei Darstellungsarten quadratischer Funktionen aufschreiben.
+2. Ich kann die Bedeutung der Parameter in jeder Darstellungsform erklären.
+3. Ich kann die Eigenschaften einer Parabel aus jeder Darstellungsform ablesen.
+4. Ich kann den Scheitelpunkt aus jeder Darstellungsform bestimmen.
+""")
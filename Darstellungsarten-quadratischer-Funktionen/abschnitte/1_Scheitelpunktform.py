@@ -0,0 +1,61 @@
+import streamlit as st
+
+from parabel import messung
+from parabel.render import render_bild
+
+interaktiv = st.session_state.interaktiv
+bild = st.session_state.bildformat
+
+# ==================================================
+# 1. SCHEITELPUNKTFORM
+# ==================================================
+
+st.header("1. Die Scheitelpunktform")
+st.latex(r"f(x)=a\cdot(x−d)^2+e")
+
+st.markdown("**Aufgabe:** Verändere die Funktionsgleichung durch Bewegen der Slider. Welches Muster erkennst du in der Funktionsgleichung?")
+
+# Jedes Slider-Panel ist ein Fragment: Ein Zug am Slider rendert nur dieses Panel neu
+@st.fragment
+def scheitelpunktform_panel():
+    col1, col2 = st.columns([1, 2])
+
+    with col1:
+        a_sp = st.slider("Parameter a:", -3.0, 3.0, 1.0, 0.1, key="a_sp")
+        d_sp = st.slider("Parameter d:", -5.0, 5.0, 0.0, 0.5, key="d_sp")
+        e_sp = st.slider("Parameter e:", -5.0, 5.0, 0.0, 0.5, key="e_sp")
+        zoom_sp = st.select_slider("Zoom:", options=[1, 2, 4], value=1, format_func=lambda z: f"{z}×",
+                                   key="zoom_sp")
+        schar_sp = st.selectbox("Kurvenschar:", [None, "a", "d", "e"], key="schar_sp",
+                                format_func=lambda p: "aus" if p is None else f"alle Werte von {p}")
+
+    with col2, messung.messen("Scheitelpunktform: Plot"):
+        if schar_sp is None:
+            st.image(render_bild("scheitelpunktform", bild, a=a_sp, d=d_sp, e=e_sp, zoom=zoom_sp),
+                     width="stretch")
+        else:
+            # Alle Parabeln, die der gewählte Regler einstellen kann, in einem Bild
+            st.image(render_bild("kurvenschar", bild, form="scheitelpunktform", parameter=schar_sp,
+                                 a=a_sp, d=d_sp, e=e_sp, zoom=zoom_sp), width="stretch")
+
+
+if interaktiv:
+    # Slider und Plot laufen komplett im Browser; Altair wird erst hier geladen
+    from parabel.interaktiv import scheitelpunktform_chart
+
+    st.altair_chart(scheitelpunktform_chart(), width="stretch")
+else:
+    scheitelpunktform_panel()
+
+with st.expander("✅ Lösung anzeigen: Was kann man aus der Scheitelpunktform direkt ablesen?"):
+    st.markdown(r"""
+**Lösung:**
+
+- **Scheitelpunkt**: $S(d|e)$
+- **Öffnung**:
+    - $a>0$ → nach oben
+    - $a<0$ → nach unten
+- **Streckung**: 
+    - $|a|>1$ → gestreckt
+    - $|a|<1$ → gestaucht
+    """)
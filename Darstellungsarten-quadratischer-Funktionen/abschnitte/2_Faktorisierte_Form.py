@@ -0,0 +1,347 @@
+import streamlit as st
+
+from parabel import messung
+from parabel.render import render_bild, statisches_bild
+
+interaktiv = st.session_state.interaktiv
+bild = st.session_state.bildformat
+
+# ==================================================
+# 2. FAKTORISIERTE FORM (NULLSTELLENFORM)
+# ==================================================
+
+st.header("2. Die faktorisierte Form (Nullstellenform)")
+st.latex(r"f(x) = a\cdot(x-x_1)\cdot(x-x_2)")
+
+# 2.1 Wiederholung: Nullstellen
+st.subheader("2.1 Wiederholung des Begriffs **Nullstelle**")
+
+# Hängt von keiner Eingabe ab: einmal pro Prozess gerendert, danach nur noch ausgeliefert
+st.image(statisches_bild("nullstellen_uebersicht", bild), width="stretch")
+
+with st.expander("💡 Frage: Was versteht man unter den Nullstellen einer Parabel?"):
+    st.markdown("""
+**Lösung:**
+
+Die *Nullstellen* einer Parabel sind die Stellen, an denen die Parabel die **x-Achse schneidet oder berührt**.
+    """)
+
+with st.expander("💡 Frage: Wie viele Nullstellen kann eine Parabel haben?"):
+    st.markdown("""
+**Lösung:**
+
+Eine Parabel hat entweder
+- **keine Nullstellen**, wenn die Parabel vollständig ober- oder unterhalb der x-Achse verläuft.
+- **eine Nullstelle**, wenn der Scheitelpunkt auf der x-Achse liegt.
+- **zwei Nullstellen**, sonst.
+    """)
+
+with st.expander("💡 Frage: Wie berechnet man die Nullstellen einer Parabel?"):
+    st.markdown(r"""
+**Lösung:**
+
+Man setzt $f(x)=0$ und löst die daraus entstehende Gleichung (man setzt die *Funktionsgleichung* $=0$ und löst diese Gleichung dann nach x auf).
+
+D.h. die Nullstellen sind diejenigen x-Werte, für die die Funktionsgleichung $0$ ergibt.
+    """)
+
+st.divider()
+
+# 2.2 Ablesbare Eigenschaften
+st.subheader("2.2 Ablesbare Eigenschaften der Parabel")
+
+st.markdown("**Aufgabe:** Verändere die Funktionsgleichung durch Bewegen der Slider. Welches Muster erkennst du in der Funktionsgleichung?")
+
+@st.fragment
+def faktorisierte_form_panel():
+    col3, col4 = st.columns([1, 2])
+
+    with col3:
+        a_fak = st.slider("Parameter a:", -3.0, 3.0, 1.0, 0.1, key="a_fak")
+        x1_fak = st.slider("Nullstelle x₁:", -8.0, 8.0, -2.0, 0.5, key="x1_fak")
+        x2_fak = st.slider("Nullstelle x₂:", -8.0, 8.0, 2.0, 0.5, key="x2_fak")
+        zoom_fak = st.select_slider("Zoom:", options=[1, 2, 4], value=1, format_func=lambda z: f"{z}×",
+                                    key="zoom_fak")
+        schar_fak = st.selectbox("Kurvenschar:", [None, "a", "x1", "x2"], key="schar_fak",
+                                 format_func=lambda p: "aus" if p is None else f"alle Werte von {p}")
+
+    with col4, messung.messen("Faktorisierte Form: Plot"):
+        if schar_fak is None:
+            st.image(render_bild("faktorisierte_form", bild, a=a_fak, x1=x1_fak, x2=x2_fak, zoom=zoom_fak),
+                     width="stretch")
+        else:
+            # Alle Parabeln, die der gewählte Regler einstellen kann, in einem Bild
+            st.image(render_bild("kurvenschar", bild, form="faktorisierte_form", parameter=schar_fak,
+                                 a=a_fak, x1=x1_fak, x2=x2_fak, zoom=zoom_fak), width="stretch")
+
+
+if interaktiv:
+    # Slider und Plot laufen komplett im Browser; Altair wird erst hier geladen
+    from parabel.interaktiv import faktorisierte_form_chart
+
+    st.altair_chart(faktorisierte_form_chart(), width="stretch")
+else:
+    faktorisierte_form_panel()
+
+with st.expander("✅ Frage: Was kann man aus der faktorisierten Form (Nullstellenform) direkt ablesen?"):
+    st.markdown(r"""
+**Lösung:**
+
+- **Nullstellen**: $x_1$ und $x_2$
+- **Öffnung**:
+    - $a>0$ → nach oben
+    - $a<0$ → nach unten
+- **Streckung**: 
+    - $|a|>1$ → gestreckt
+    - $|a|<1$ → gestaucht
+    """)
+
+st.divider()
+
+# Spezialfall: Eine Nullstelle
+st.markdown("### Spezialfall: Eine Nullstelle")
+
+@st.fragment
+def eine_nullstelle_panel():
+    col_help1, col_help2 = st.columns([1, 2])
+    
+    with col_help1:
+        a_eine = st.slider("Parameter a:", -3.0, 3.0, 1.0, 0.1, key="a_eine")
+        x0_eine = st.slider("Nullstelle x₀:", -8.0, 8.0, 2.0, 0.5, key="x0_eine")
+        zoom_eine = st.select_slider("Zoom:", options=[1, 2, 4], value=1, format_func=lambda z: f"{z}×",
+                                     key="zoom_eine")
+    
+    with col_help2, messung.messen("Eine Nullstelle: Plot"):
+        st.image(render_bild("eine_nullstelle", bild, a=a_eine, x0=x0_eine, zoom=zoom_eine), width="stretch")
+
+
+# Ein Toggle statt Expander: Der Inhalt eines Expanders läuft bei jedem Rerun mit,
+# auch zugeklappt. So wird der Plot erst gerendert, wenn die Frage aufgeklappt ist.
+with st.container(border=True):
+    if st.toggle("💡 Frage: Wie sieht die faktorisierte Form aus, wenn es nur **eine Nullstelle** gibt?",
+                 key="frage_eine_nullstelle"):
+        st.markdown(r"""
+$x_0$ ist die Nullstelle. Bewege den Slider und achte auf die Funktionsgleichung.
+""")
+
+        eine_nullstelle_panel()
+
+        st.markdown("---")
+        st.markdown(r"""
+**Lösung:**
+
+Wenn es nur eine Nullstelle $x_{0}$ gibt, dann liegt der Scheitelpunkt auf der x-Achse.
+Aus diesem Grund sind in diesem Fall die Scheitelpunktform und die faktorisierte Form (Nullstellenform) identisch:
+
+$$f(x)=a\cdot (x - x_{0})^2$$
+        """)
+
+with st.expander("💡 Frage: Wie sieht die faktorisierte Form aus, wenn es **keine Nullstellen** gibt?"):
+    st.markdown("""
+**Lösung:**
+
+Wenn es keine Nullstellen gibt, dann gibt es auch keine Funktionsgleichung in faktorisierter Form.
+    """)
+
+st.divider()
+
+# Zusammenfassung Nullstellenform
+st.markdown("""
+#### Zusammenfassung: Eigenschaften der Parabel ausgehend von der Nullstellenform
+
+An einer Funktionsgleichung, die in Nullstellenform gegeben ist,
+""")
+st.latex(r"f(x) = a \cdot (x - x_{1}) \cdot (x - x_{2})")
+st.markdown("""
+können wir folgendes direkt ablesen:
+
+- **Nullstellen**: $x_1$ und $x_2$ (*oder evtl. nur eine Nullstelle*)
+- **Öffnung**:
+    - $a>0$ → nach oben
+    - $a<0$ → nach unten
+- **Streckung**: 
+    - $|a|>1$ → gestreckt
+    - $|a|<1$ → gestaucht
+""")
+
+st.divider()
+
+# 2.3 Bestimmung des Scheitelpunkts
+st.subheader("2.3 Bestimmung des Scheitelpunkts ausgehend von der Nullstellenform")
+
+@st.fragment
+def scheitel_aus_nullstellen_panel():
+    col_sp1, col_sp2 = st.columns([1, 2])
+    
+    with col_sp1:
+        a_sp_null = st.slider("Parameter a:", -3.0, 3.0, 1.0, 0.1, key="a_sp_null")
+        x1_sp_null = st.slider("Nullstelle x₁:", -8.0, 8.0, -2.0, 0.5, key="x1_sp_null")
+        x2_sp_null = st.slider("Nullstelle x₂:", -8.0, 8.0, 2.0, 0.5, key="x2_sp_null")
+        zoom_sp_null = st.select_slider("Zoom:", options=[1, 2, 4], value=1, format_func=lambda z: f"{z}×",
+                                        key="zoom_sp_null")
+    
+    with col_sp2, messung.messen("Scheitel aus Nullstellen: Plot"):
+        st.image(render_bild("scheitel_aus_nullstellen", bild, a=a_sp_null, x1=x1_sp_null, x2=x2_sp_null,
+                             zoom=zoom_sp_null),
+                 width="stretch")
+
+
+with st.container(border=True):
+    if st.toggle("💡 Frage: Wo liegt die **x-Koordinate des Scheitelpunkts** in Bezug auf die Nullstellen?",
+                 key="frage_scheitel_aus_nullstellen"):
+        st.markdown("""
+**Hilfestellung**
+
+Bewege die Slider. Achte auf die Lage der Nullstellen und die Lage des Scheitelpunkts.
+""")
+
+        scheitel_aus_nullstellen_panel()
+
+        st.markdown("---")
+        st.markdown("""
+**Lösung:**
+
+Die x-Koordinate des Scheitelpunkts $d$ liegt immer **in der Mitte der beiden Nullstellen**.
+        """)
+
+with st.expander("💡 Frage: Wie bestimmen wir die **y-Koordinate e des Scheitelpunkts**?"):
+    st.markdown(r"""
+**Lösung:**
+
+Immer wenn wir zu einem gegebenen x-Wert den dazugehörigen y-Wert bestimmen möchten, gehen wir wie folgt vor:
+
+1. Wir setzen den x-Wert (in diesem Fall wäre das $d$) in die Funktionsgleichung ein.
+2. Wir rechnen alles aus. Das Ergebnis ist der dazugehörige y-Wert (in diesem Fall wäre das $e$).
+    """)
+
+st.markdown("""
+#### Zusammenfassung: Bestimmung des Scheitelpunkts ausgehend von der Nullstellenform
+
+Um den Scheitelpunkt $S(d|e)$ ausgehend von einer Funktionsgleichung in Nullstellenform zu bestimmen, gehen wir wie folgt vor:
+
+**1. Wir bestimmen die x-Koordinate $d$ des Scheitelpunkts**
+
+Da der Scheitelpunkt immer in der Mitte zwischen den beiden Nullstellen liegt, können wir seine x-Koordinate folgendermaßen berechnen:
+""")
+st.latex(r"d = \frac{x_{1} + x_{2}}{2}")
+
+st.markdown("""
+**2. Wir bestimmen die y-Koordinate $e$ des Scheitelpunkts**
+
+Wir setzen $d$ in die Funktionsgleichung ein und berechnen dadurch $e$:
+""")
+st.latex(r"e = f(d)")
+
+st.divider()
+
+# 2.4 Übungen
+st.subheader("2.4 Übungen")
+
+# Übung 1
+with st.expander("📝 Übung 1: $f(x) = 2 \\cdot (x - 1) \\cdot (x + 3)$"):
+    st.markdown(r"""
+**Aufgabe:**
+
+Gegeben ist $f(x) = 2 \cdot (x - 1) \cdot (x + 3)$
+
+Bestimme:
+
+1. Die **Nullstellen** der Parabel
+2. Die **Öffnungsrichtung** der Parabel
+3. Die **Streckung** der Parabel
+4. Den **Scheitelpunkt** der Parabel
+    """)
+    
+    if st.button("✅ Lösung anzeigen", key="loesung1"):
+        st.markdown(r"""
+**Lösung:**
+
+1. **Nullstellen**: $x_1 = 1$ und $x_2 = -3$
+2. **Öffnungsrichtung**: Nach oben (da $a = 2 > 0$)
+3. **Streckung**: Gestreckt (da $|a| = 2 > 1$)
+4. **Scheitelpunkt**: 
+   - $d = \frac{1 + (-3)}{2} = \frac{-2}{2} = -1$
+   - $e = f(-1) = 2 \cdot (-1-1) \cdot (-1+3) = 2 \cdot (-2) \cdot 2 = -8$
+   - Also: $S(-1|-8)$
+        """)
+
+# Übung 2
+with st.expander("📝 Übung 2: $g(x) = -3(x+2)(x-4)$"):
+    st.markdown(r"""
+**Aufgabe:**
+
+Gegeben ist $g(x) = -3(x+2)(x-4)$
+
+Bestimme:
+
+1. Die **Nullstellen** der Parabel
+2. Die **Öffnungsrichtung** der Parabel
+3. Die **Streckung** der Parabel
+4. Den **Scheitelpunkt** der Parabel
+    """)
+    
+    if st.button("✅ Lösung anzeigen", key="loesung2"):
+        st.markdown(r"""
+**Lösung:**
+
+1. **Nullstellen**: $x_1 = -2$ und $x_2 = 4$
+2. **Öffnungsrichtung**: Nach unten (da $a = -3 < 0$)
+3. **Streckung**: Gestreckt (da $|a| = 3 > 1$)
+4. **Scheitelpunkt**: 
+   - $d = \frac{-2 + 4}{2} = \frac{2}{2} = 1$
+   - $e = f(1) = -3 \cdot (1+2) \cdot (1-4) = -3 \cdot 3 \cdot (-3) = 27$
+   - Also: $S(1|27)$
+        """)
+
+# Übung 3
+with st.expander("📝 Übung 3: $h(x)=\\frac{1}{2}(x-5)(x+1)$"):
+    st.markdown(r"""
+**Aufgabe:**
+
+Gegeben ist $h(x)=\frac{1}{2}(x-5)(x+1)$
+
+Bestimme:
+
+1. Die **Nullstellen** der Parabel
+2. Die **Öffnungsrichtung** der Parabel
+3. Die **Streckung** der Parabel
+4. Den **Scheitelpunkt** der Parabel
+    """)
+    
+    if st.button("✅ Lösung anzeigen", key="loesung3"):
+        st.markdown(r"""
+**Lösung:**
+
+1. **Nullstellen**: $x_1 = 5$ und $x_2 = -1$
+2. **Öffnungsrichtung**: Nach oben (da $a = \frac{1}{2} > 0$)
+3. **Streckung**: Gestaucht (da $|a| = \frac{1}{2} < 1$)
+4. **Scheitelpunkt**: 
+   - $d = \frac{5 + (-1)}{2} = \frac{4}{2} = 2$
+   - $e = f(2) = \frac{1}{2} \cdot (2-5) \cdot (2+1) = \frac{1}{2} \cdot (-3) \cdot 3 = -\frac{9}{2} = -4.5$
+   - Also: $S(2|-4.5)$
+        """)
+
+# Übung 4
+with st.expander("📝 Übung 4: $k(x)=-2(x-3)^2$"):
+    st.markdown(r"""
+**Aufgabe:**
+
+Gegeben ist $k(x)=-2(x-3)^2$
+
+Bestimme:
+
+1. Die **Nullstellen** der Parabel
+2. Die **Öffnungsrichtung** der Parabel
+3. Die **Streckung** der Parabel
+4. Den **Scheitelpunkt** der Parabel
+    """)
+    
+    if st.button("✅ Lösung anzeigen", key="loesung4"):
+        st.markdown(r"""
+**Lösung:**
+
+1. **Nullstellen**: Nur eine Nullstelle: $x_0 = 3$
+2. **Öffnungsrichtung**: Nach unten (da $a = -2 < 0$)
+3. **Streckung**: Gestreckt (da $|a| = 2 > 1$)
+4. **Scheitelpunkt**: Da dies die Scheitelpunktform ist mit nur einer Nullstelle, liegt der Scheitelpunkt auf der x-Achse: $S(3|0)$
+        """)
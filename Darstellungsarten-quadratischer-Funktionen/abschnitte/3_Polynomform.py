@@ -0,0 +1,361 @@
+import streamlit as st
+
+from parabel import messung
+from parabel.render import render_bild, statisches_bild
+
+interaktiv = st.session_state.interaktiv
+bild = st.session_state.bildformat
+
+# ==================================================
+# 3. POLYNOMFORM
+# ==================================================
+
+st.header("3. Die Polynomform (allgemeine Form)")
+st.latex(r"f(x) = ax^2 + bx + c")
+
+# 3.1 Wiederholung: y-Achsenabschnitt
+st.subheader("3.1 Wiederholung des Begriffs **y-Achsenabschnitt**")
+
+# Hängt von keiner Eingabe ab: einmal pro Prozess gerendert, danach nur noch ausgeliefert
+st.image(statisches_bild("y_achsenabschnitt", bild), width="stretch")
+
+with st.expander("💡 Aufgabe: Was versteht man unter dem y-Achsenabschnitt einer Parabel?"):
+    st.markdown(r"""
+**Lösung:**
+
+Der *y-Achsenabschnitt* einer Parabel ist der $f(x)$-Wert (bzw. $y$-Wert), an dem die Parabel die **y-Achse schneidet**.
+    """)
+
+with st.expander("💡 Aufgabe: Wie berechnet man den y-Achsenabschnitt einer Parabel?"):
+    st.markdown(r"""
+**Lösung:**
+
+Man berechnet den Wert für $f(0)$.
+
+D.h. man setzt für jedes $x$ in der Funktionsgleichung den Wert $0$ ein.
+    """)
+
+st.divider()
+
+st.markdown("### 3.2 Ablesbare Eigenschaften der Parabel")
+st.markdown("**Aufgabe:** Verändere die Parameter und beobachte die Veränderungen. Finde das Muster in der Funktionsgleichung.")
+
+@st.fragment
+def polynomform_panel():
+    col5, col6 = st.columns([1, 2])
+
+    with col5:
+        a_poly = st.slider("Parameter a:", -3.0, 3.0, 1.0, 0.1, key="a_poly")
+        b_poly = st.slider("Parameter b:", -10.0, 10.0, 0.0, 0.5, key="b_poly")
+        c_poly = st.slider("Parameter c:", -10.0, 10.0, 0.0, 0.5, key="c_poly")
+        zoom_poly = st.select_slider("Zoom:", options=[1, 2, 4], value=1, format_func=lambda z: f"{z}×",
+                                     key="zoom_poly")
+        schar_poly = st.selectbox("Kurvenschar:", [None, "a", "b", "c"], key="schar_poly",
+                                  format_func=lambda p: "aus" if p is None else f"alle Werte von {p}")
+
+    with col6, messung.messen("Polynomform: Plot"):
+        if schar_poly is None:
+            st.image(render_bild("polynomform", bild, a=a_poly, b=b_poly, c=c_poly, zoom=zoom_poly),
+                     width="stretch")
+        else:
+            # Alle Parabeln, die der gewählte Regler einstellen kann, in einem Bild
+            st.image(render_bild("kurvenschar", bild, form="polynomform", parameter=schar_poly,
+                                 a=a_poly, b=b_poly, c=c_poly, zoom=zoom_poly), width="stretch")
+
+
+if interaktiv:
+    # Slider und Plot laufen komplett im Browser; Altair wird erst hier geladen
+    from parabel.interaktiv import polynomform_chart
+
+    st.altair_chart(polynomform_chart(), width="stretch")
+else:
+    polynomform_panel()
+
+with st.expander("✅ Lösung anzeigen: Was kann man aus der Polynomform direkt ablesen?"):
+    st.markdown(r"""
+**Lösung:**
+
+- **y-Achsenabschnitt**: $c$
+- **Öffnung**:
+    - $a>0$ → nach oben
+    - $a<0$ → nach unten
+- **Streckung**: 
+    - $|a|>1$ → gestreckt
+    - $|a|<1$ → gestaucht
+    """)
+
+
+st.divider()
+
+
+# 2.3 Bestimmung des Scheitelpunkts ausgehend von der Polynomform
+st.subheader("2.3 Bestimmung des Scheitelpunkts ausgehend von der Polynomform")
+
+st.markdown("""
+Die Bestimmung des Scheitelpunkts ausgehend von der Polynomform ist nicht unbedingt trivial. 
+Um uns das Leben in Zukunft zu vereinfachen, werden wir die **allgemeine Polynomform schrittweise 
+in die Scheitelpunktform umformen**. Aus dieser Umformung können wir dann eine **Formel für die 
+x-Koordinate des Scheitelpunkts** direkt ablesen. Die **y-Koordinate** bestimmen wir anschließend 
+wie gewohnt durch Einsetzen in die Funktionsgleichung.
+
+Los geht's! 🚀
+""")
+
+st.markdown("---")
+
+st.markdown("#### Schritt-für-Schritt Umformung")
+
+st.markdown("""
+**Gegeben:** Die allgemeine Polynomform
+""")
+st.latex(r"f(x) = ax^2 + bx + c")
+
+st.markdown("""
+**Ziel:** Umformung in die Scheitelpunktform
+""")
+st.latex(r"f(x) = a(x-d)^2 + e")
+
+st.markdown("---")
+
+# Umformungsschritte
+st.markdown("##### 📐 Umformung durch quadratische Ergänzung")
+
+st.markdown("**Schritt 1:** Faktor $a$ ausklammern")
+st.latex(r"f(x) = a\left(x^2 + \frac{b}{a}x\right) + c")
+
+st.markdown("**Schritt 2:** Quadratische Ergänzung vorbereiten")
+st.markdown(r"""
+Wir ergänzen den Term in der Klammer so, dass eine binomische Formel entsteht.
+Dafür addieren und subtrahieren wir $\left(\frac{b}{2a}\right)^2$:
+""")
+st.latex(r"f(x) = a\left(x^2 + \frac{b}{a}x + \left(\frac{b}{2a}\right)^2 - \left(\frac{b}{2a}\right)^2\right) + c")
+
+st.markdown("**Schritt 3:** Binomische Formel anwenden")
+st.markdown(r"Die ersten drei Terme ergeben ein Binom:")
+st.latex(r"f(x) = a\left[\left(x + \frac{b}{2a}\right)^2 - \left(\frac{b}{2a}\right)^2\right] + c")
+
+st.markdown("**Schritt 4:** Ausmultiplizieren und zusammenfassen")
+st.latex(r"f(x) = a\left(x + \frac{b}{2a}\right)^2 - a\left(\frac{b}{2a}\right)^2 + c")
+
+st.latex(r"f(x) = a\left(x + \frac{b}{2a}\right)^2 - \frac{b^2}{4a} + c")
+
+st.markdown("**Schritt 5:** In Scheitelpunktform schreiben")
+st.markdown(r"Vergleichen wir mit $f(x) = a(x-d)^2 + e$, erkennen wir:")
+st.latex(r"f(x) = a\left(x - \left(-\frac{b}{2a}\right)\right)^2 + \left(c - \frac{b^2}{4a}\right)")
+
+st.markdown("---")
+
+# Formeln hervorheben
+st.markdown("#### 🎯 Abgelesene Formeln für den Scheitelpunkt")
+
+col_form1, col_form2 = st.columns(2)
+
+with col_form1:
+    st.markdown("**x-Koordinate des Scheitelpunkts:**")
+    st.latex(r"d = -\frac{b}{2a}")
+
+with col_form2:
+    st.markdown("**y-Koordinate des Scheitelpunkts:**")
+    st.latex(r"e = f(d) = ad^2 + bd + c")
+
+st.info("""
+💡 **Merke:** 
+- Die **x-Koordinate** $d$ des Scheitelpunkts können wir direkt mit der Formel $d = -\\frac{b}{2a}$ berechnen.
+- Die **y-Koordinate** $e$ erhalten wir durch Einsetzen von $d$ in die ursprüngliche Funktionsgleichung.
+""")
+
+st.markdown("---")
+
+# Beispielrechnung
+st.markdown("#### 📝 Beispiel zur Anwendung")
+
+with st.expander("🔍 Beispiel: Scheitelpunkt von $f(x) = 2x^2 - 8x + 5$ bestimmen"):
+    st.markdown(r"""
+**Gegeben:** $f(x) = 2x^2 - 8x + 5$
+
+Das bedeutet: $a = 2$, $b = -8$, $c = 5$
+
+**Schritt 1: x-Koordinate berechnen**
+""")
+    st.latex(r"d = -\frac{b}{2a} = -\frac{-8}{2 \cdot 2} = -\frac{-8}{4} = 2")
+    
+    st.markdown(r"""
+**Schritt 2: y-Koordinate berechnen**
+
+Wir setzen $d = 2$ in die Funktionsgleichung ein:
+""")
+    st.latex(r"e = f(2) = 2 \cdot 2^2 - 8 \cdot 2 + 5 = 2 \cdot 4 - 16 + 5 = 8 - 16 + 5 = -3")
+    
+    st.markdown(r"""
+**Ergebnis:** Der Scheitelpunkt liegt bei $S(2|-3)$
+
+**Probe:** Die Scheitelpunktform lautet also:
+""")
+    st.latex(r"f(x) = 2(x-2)^2 - 3")
+    
+    st.success("✅ Wenn wir diese Form ausmultiplizieren, erhalten wir wieder die ursprüngliche Polynomform!")
+
+st.markdown("---")
+
+# Zusammenfassung
+st.markdown("""
+#### 📋 Zusammenfassung: Scheitelpunkt aus Polynomform bestimmen
+
+Um den Scheitelpunkt $S(d|e)$ einer quadratischen Funktion in Polynomform $f(x) = ax^2 + bx + c$ zu bestimmen:
+
+**1. Berechne die x-Koordinate mit der Formel:**
+""")
+st.latex(r"d = -\frac{b}{2a}")
+
+st.markdown("""
+**2. Berechne die y-Koordinate durch Einsetzen:**
+""")
+st.latex(r"e = f(d)")
+
+st.markdown("""
+**Fertig!** Der Scheitelpunkt ist $S(d|e)$.
+""")
+
+
+st.divider()
+
+
+
+# 3.3 Übungen
+st.subheader("3.3 Übungen")
+
+st.markdown("""
+Übe nun das Ablesen und Berechnen von Eigenschaften quadratischer Funktionen in Polynomform!
+""")
+
+# Übung 1
+with st.expander("📝 Übung 1: $f(x) = x^2 + 4x + 3$"):
+    st.markdown(r"""
+**Aufgabe:**
+
+Gegeben ist $f(x) = x^2 + 4x + 3$
+
+Bestimme:
+
+1. Den **y-Achsenabschnitt** der Parabel
+2. Die **Öffnungsrichtung** der Parabel
+3. Die **Streckung** der Parabel
+4. Den **Scheitelpunkt** der Parabel
+    """)
+    
+    if st.button("✅ Lösung anzeigen", key="loesung_poly1"):
+        st.markdown(r"""
+**Lösung:**
+
+Zunächst identifizieren wir die Parameter: $a = 1$, $b = 4$, $c = 3$
+
+1. **y-Achsenabschnitt**: $c = 3$
+   
+2. **Öffnungsrichtung**: Nach oben (da $a = 1 > 0$)
+   
+3. **Streckung**: Keine Streckung (da $|a| = 1$)
+   
+4. **Scheitelpunkt**: 
+   - $d = -\frac{b}{2a} = -\frac{4}{2 \cdot 1} = -\frac{4}{2} = -2$
+   - $e = f(-2) = (-2)^2 + 4 \cdot (-2) + 3 = 4 - 8 + 3 = -1$
+   - Also: $S(-2|-1)$
+        """)
+
+# Übung 2
+with st.expander("📝 Übung 2: $g(x) = -2x^2 + 8x - 5$"):
+    st.markdown(r"""
+**Aufgabe:**
+
+Gegeben ist $g(x) = -2x^2 + 8x - 5$
+
+Bestimme:
+
+1. Den **y-Achsenabschnitt** der Parabel
+2. Die **Öffnungsrichtung** der Parabel
+3. Die **Streckung** der Parabel
+4. Den **Scheitelpunkt** der Parabel
+    """)
+    
+    if st.button("✅ Lösung anzeigen", key="loesung_poly2"):
+        st.markdown(r"""
+**Lösung:**
+
+Zunächst identifizieren wir die Parameter: $a = -2$, $b = 8$, $c = -5$
+
+1. **y-Achsenabschnitt**: $c = -5$
+   
+2. **Öffnungsrichtung**: Nach unten (da $a = -2 < 0$)
+   
+3. **Streckung**: Gestreckt (da $|a| = 2 > 1$)
+   
+4. **Scheitelpunkt**: 
+   - $d = -\frac{b}{2a} = -\frac{8}{2 \cdot (-2)} = -\frac{8}{-4} = 2$
+   - $e = f(2) = -2 \cdot 2^2 + 8 \cdot 2 - 5 = -2 \cdot 4 + 16 - 5 = -8 + 16 - 5 = 3$
+   - Also: $S(2|3)$
+        """)
+
+# Übung 3
+with st.expander("📝 Übung 3: $h(x) = 0.5x^2 - 3x + 2$"):
+    st.markdown(r"""
+**Aufgabe:**
+
+Gegeben ist $h(x) = 0.5x^2 - 3x + 2$
+
+Bestimme:
+
+1. Den **y-Achsenabschnitt** der Parabel
+2. Die **Öffnungsrichtung** der Parabel
+3. Die **Streckung** der Parabel
+4. Den **Scheitelpunkt** der Parabel
+    """)
+    
+    if st.button("✅ Lösung anzeigen", key="loesung_poly3"):
+        st.markdown(r"""
+**Lösung:**
+
+Zunächst identifizieren wir die Parameter: $a = 0.5$, $b = -3$, $c = 2$
+
+1. **y-Achsenabschnitt**: $c = 2$
+   
+2. **Öffnungsrichtung**: Nach oben (da $a = 0.5 > 0$)
+   
+3. **Streckung**: Gestaucht (da $|a| = 0.5 < 1$)
+   
+4. **Scheitelpunkt**: 
+   - $d = -\frac{b}{2a} = -\frac{-3}{2 \cdot 0.5} = -\frac{-3}{1} = 3$
+   - $e = f(3) = 0.5 \cdot 3^2 - 3 \cdot 3 + 2 = 0.5 \cdot 9 - 9 + 2 = 4.5 - 9 + 2 = -2.5$
+   - Also: $S(3|-2.5)$
+        """)
+
+# Übung 4
+with st.expander("📝 Übung 4: $k(x) = 3x^2 + 12x + 7$"):
+    st.markdown(r"""
+**Aufgabe:**
+
+Gegeben ist $k(x) = 3x^2 + 12x + 7$
+
+Bestimme:
+
+1. Den **y-Achsenabschnitt** der Parabel
+2. Die **Öffnungsrichtung** der Parabel
+3. Die **Streckung** der Parabel
+4. Den **Scheitelpunkt** der Parabel
+    """)
+    
+    if st.button("✅ Lösung anzeigen", key="loesung_poly4"):
+        st.markdown(r"""
+**Lösung:**
+
+Zunächst identifizieren wir die Parameter: $a = 3$, $b = 12$, $c = 7$
+
+1. **y-Achsenabschnitt**: $c = 7$
+   
+2. **Öffnungsrichtung**: Nach oben (da $a = 3 > 0$)
+   
+3. **Streckung**: Gestreckt (da $|a| = 3 > 1$)
+   
+4. **Scheitelpunkt**: 
+   - $d = -\frac{b}{2a} = -\frac{12}{2 \cdot 3} = -\frac{12}{6} = -2$
+   - $e = f(-2) = 3 \cdot (-2)^2 + 12 \cdot (-2) + 7 = 3 \cdot 4 - 24 + 7 = 12 - 24 + 7 = -5$
+   - Also: $S(-2|-5)$
+        """)
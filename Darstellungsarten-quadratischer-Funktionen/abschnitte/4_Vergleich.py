@@ -0,0 +1,26 @@
+import streamlit as st
+
+# ==================================================
+# 4. VERGLEICH
+# ==================================================
+
+st.header("4. Vergleich: Welche Form für welchen Zweck?")
+
+# Tabelle als Markdown
+st.markdown("""
+| Darstellungsform | Direkt ablesbar | Beste Anwendung |
+|------------------|-----------------|-----------------|
+| **Scheitelpunktform** $a(x-d)^2 + e$ | Scheitelpunkt $S(d\|e)$ | Graph zeichnen, Verschiebungen verstehen |
+| **Faktorisierte Form** $a(x-x_1)(x-x_2)$ | Nullstellen $x_1, x_2$ | Schnittpunkte mit x-Achse finden |
+| **Polynomform** $ax^2 + bx + c$ | y-Achsenabschnitt $c$ | Funktionswerte berechnen, Ableitungen, ... |
+""")
+
+st.success("🎉 Herzlichen Glückwunsch! Du hast alle drei Darstellungsformen kennengelernt und geübt!")
+
+# Footer
+st.divider()
+st.markdown("""
+---
+*Interaktives Lerntool für Quadratische Funktionen*  
+Erstellt mit Streamlit 🎈
+""")
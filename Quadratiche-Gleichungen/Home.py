@@ -1,5 +1,15 @@
+import sys
+from pathlib import Path
+
 import streamlit as st
 
+# Gemeinsame Module (parabel/) liegen im Wurzelverzeichnis des Repos
+ROOT = str(Path(__file__).resolve().parents[1])
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from parabel import seite
+
 # Seitenkonfiguration
 st.set_page_config(
     page_title="Quadratische Gleichungen",
@@ -7,6 +17,9 @@ st.set_page_config(
     layout="wide"
 )
 
+# cProfile und Zeitmessung für diesen Rerun (siehe parabel/seite.py)
+seite.einrichten("Home")
+
 # Sidebar
 with st.sidebar:
     st.title("Quadratische Gleichungen")
@@ -105,4 +118,7 @@ st.markdown("---")
 
 # Footer
 st.subheader("🚀 Bereit anzufangen?")
-st.write("Wähle ein Thema aus der Seitenleiste und starte deine Lernreise!")
\ No newline at end of file
+st.write("Wähle ein Thema aus der Seitenleiste und starte deine Lernreise!")
+
+# Profil und Messwerte dieses Reruns (?profile=1&token=... bzw. ?debug=1)
+seite.abschliessen()
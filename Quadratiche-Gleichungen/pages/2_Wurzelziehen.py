@@ -1,5 +1,14 @@
+import sys
+from pathlib import Path
+
 import streamlit as st
-import sympy as sp
+
+# Gemeinsame Module (parabel/) liegen im Wurzelverzeichnis des Repos
+ROOT = str(Path(__file__).resolve().parents[2])
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from parabel import seite
 
 # Seitenkonfiguration
 st.set_page_config(
@@ -8,6 +17,9 @@ st.set_page_config(
     layout="wide"
 )
 
+# cProfile und Zeitmessung für diesen Rerun (siehe parabel/seite.py)
+seite.einrichten("Wurzelziehen")
+
 st.title("Wurzelziehen - ein Tool zum Lösen quadratischer Gleichungen")
 st.markdown("---")
 
@@ -207,4 +219,7 @@ with col2:
         \\end{align*}
         $$
         """)
-        st.success("**Lösungsmenge:** $\\mathbb{L} = \\{-1-\\sqrt{7}; -1+\\sqrt{7}\\}$")
\ No newline at end of file
+        st.success("**Lösungsmenge:** $\\mathbb{L} = \\{-1-\\sqrt{7}; -1+\\sqrt{7}\\}$")
+
+# Profil und Messwerte dieses Reruns (?profile=1&token=... bzw. ?debug=1)
+seite.abschliessen()
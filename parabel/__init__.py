@@ -0,0 +1,7 @@
+"""Gemeinsame Bausteine der Mathe-Streamlit-Apps.
+
+Das Paket enthält keinen Streamlit-Code (bis auf ``parabel.seite``, das
+Profil und Debug-Panel jeder Seite einrichtet): Die Plots werden aus einfachen
+Parametern (Plot-Art, Koeffizienten, Zielwert, Bildausschnitt) erzeugt und als
+fertige Bild-Bytes zurückgegeben. Die Seiten zeigen diese Bytes nur noch an.
+"""
@@ -0,0 +1,224 @@
+"""Prüft Antworten auf mathematische Gleichwertigkeit statt auf exakt gleichen Text.
+
+Jede Antwort wird auf eine kanonische Form gebracht:
+
+* Gleichungen (``art="gleichung"``): ``links - rechts`` als ausmultipliziertes
+  Polynom mit rationalen Koeffizienten, normiert auf Leitkoeffizient 1. Damit
+  sind ``0,002v²-0,18v+8,55=7``, ``7=0.002*v^2-0.18*v+8.55`` und
+  ``2v^2-180v+1550=0`` dieselbe Antwort.
+* Lösungsmengen (``art="loesungen"``): Menge der auf zwei Nachkommastellen
+  gerundeten Werte, z.B. ``x=3,73 oder x=0,27`` oder ``x=2±√3``; ``nicht lösbar``
+  ist die leere Menge.
+
+Die kanonischen Formen der richtigen Antworten werden einmal pro Prozess
+berechnet, die der Eingaben liegen in einem LRU-Cache: Dieselben (falschen)
+Antworten kommen in einer Unterrichtsstunde hundertfach vor und werden nur
+beim ersten Mal mit sympy geparst.
+
+Geparst wird nie im Streamlit-Prozess, sondern im ``AUSWERTUNG``-Pool (siehe
+``parabel.auswertung``). Vorher sortiert eine billige Vorprüfung Eingaben aus,
+die zu lang, zu tief verschachtelt oder mit zu großen Exponenten sind.
+Nicht auswertbare Eingaben gelten als falsch.
+"""
+
+import functools
+import re
+import threading
+import time
+
+from parabel import metriken
+from parabel.auswertung import Ausgefallen, Auswertungspool, Ueberlastet, Zeitueberschreitung
+
+NACHKOMMASTELLEN = 2
+
+# Vorprüfung: Schulantworten sind kurz, flach und haben kleine Exponenten
+MAX_LAENGE = 100
+MAX_TIEFE = 6
+MAX_EXPONENT = 10
+
+AUSWERTUNG = Auswertungspool(vorladen=("sympy",))
+
+# Nur Zahlen, Variablen aus einem Buchstaben, sqrt und Rechenzeichen; alles andere
+# (Unterstriche, Anführungszeichen, Funktionsaufrufe, ...) erreicht sympy gar nicht
+_ERLAUBT = re.compile(r"[0-9a-z.+\-*/^()=]*")
+_NAMEN = re.compile(r"[a-z]+")
+_VARIABLE = re.compile(r"[a-z]")
+_FUNKTIONEN = {"sqrt"}
+
+_ERSETZUNGEN = {"**": "^", "²": "^2", "³": "^3", "·": "*", "×": "*", "−": "-", "√": "sqrt", ",": "."}
+
+_UNLOESBAR = {"nichtlösbar", "keinelösung", "l={}", "{}"}
+
+
+def bereinigen(text):
+    """Kleinschreibung ohne Leerzeichen und Anführungszeichen, Dezimalkomma als Punkt.
+
+    Ein Komma, das nicht zwischen zwei Ziffern steht, trennt Lösungen
+    (``x=5, x=2``) und wird zu ``;``.
+    """
+    text = re.sub(r"[\s'\"]", "", text.lower())
+    text = re.sub(r"(?<!\d),|,(?!\d)", ";", text)
+    for alt, neu in _ERSETZUNGEN.items():
+        text = text.replace(alt, neu)
+    # √3 -> sqrt3 -> sqrt(3)
+    return re.sub(r"sqrt(\d+(?:\.\d+)?)", r"sqrt(\1)", text)
+
+
+_abgelehnt = 0
+_abgelehnt_lock = threading.Lock()
+
+
+def ist_richtig(antwort, richtige_antworten, art):
+    """``True``, wenn ``antwort`` zu einer der richtigen Antworten gleichwertig ist.
+
+    ``None``, wenn der Auswertungspool gerade überlastet oder ausgefallen ist und
+    die Antwort nicht geprüft werden konnte.
+    """
+    start = time.perf_counter()
+    try:
+        form = kanonisch(art, bereinigen(antwort))
+        richtig = form is not None and form in _referenzen(art, tuple(richtige_antworten))
+    except (Ueberlastet, Ausgefallen):
+        # Nicht im Cache: beim nächsten Klick wird wieder geprüft
+        richtig = None
+    metriken.antwort(art, time.perf_counter() - start, richtig)
+    return richtig
+
+
+@functools.cache
+def _referenzen(art, richtige_antworten):
+    return frozenset(kanonisch(art, bereinigen(richtig)) for richtig in richtige_antworten) - {None}
+
+
+@functools.lru_cache(maxsize=4096)
+def kanonisch(art, text):
+    """Kanonische Form einer bereinigten Antwort, ``None`` wenn nicht auswertbar.
+
+    ``Ueberlastet`` und ``Ausgefallen`` gehen an den Aufrufer; Ausnahmen merkt
+    sich der Cache nicht, die Eingabe wird beim nächsten Mal wieder geprüft.
+    """
+    global _abgelehnt
+    if zu_komplex(text):
+        with _abgelehnt_lock:
+            _abgelehnt += 1
+        return None
+    try:
+        return AUSWERTUNG.auswerten(_KANONISCH[art], text)
+    except Zeitueberschreitung:
+        return None  # bleibt im Cache: dieselbe Eingabe wird nicht noch einmal gerechnet
+
+
+def zu_komplex(text):
+    if len(text) > MAX_LAENGE:
+        return True
+
+    tiefe = 0
+    for zeichen in text:
+        tiefe += {"(": 1, ")": -1}.get(zeichen, 0)
+        if tiefe > MAX_TIEFE:
+            return True
+
+    # Nur Zahlen als Exponenten, keine Potenztürme wie 9^9^9; eine Klammer
+    # gehört nur dazu, wenn sie direkt nach dem ^ aufgeht: ^(2), aber (v^2)
+    for exponent in re.finditer(r"\^(?:\((-?\d*\.?\d*)\)|(-?\d*\.?\d*))(\^?)", text):
+        in_klammern, ohne_klammern, weiter = exponent.groups()
+        zahl = ohne_klammern if in_klammern is None else in_klammern
+        if not zahl.strip("-.") or weiter or abs(float(zahl)) > MAX_EXPONENT:
+            return True
+    return False
+
+
+def statistik():
+    """Zähler der Vorprüfung, des Eingabe-Caches und des Auswertungspools."""
+    cache = kanonisch.cache_info()
+    return {
+        "abgelehnt": _abgelehnt,
+        "cache_hits": cache.hits,
+        "cache_misses": cache.misses,
+        "cache_eintraege": cache.currsize,
+        **{f"pool_{name}": wert for name, wert in AUSWERTUNG.statistik().items()},
+    }
+
+
+def gleichung_kanonisch(text):
+    """Normiertes Polynom zu ``links = rechts`` oder ``None``, wenn es keine Gleichung ist."""
+    seiten = text.split("=")
+    if len(seiten) != 2:
+        return None
+    links, rechts = (_ausdruck(seite) for seite in seiten)
+    if links is None or rechts is None:
+        return None
+
+    import sympy
+
+    differenz = sympy.expand(links - rechts)
+    variablen = sorted(differenz.free_symbols, key=str)
+    if not variablen:
+        return None
+    try:
+        polynom = sympy.Poly(differenz, *variablen)
+    except sympy.PolynomialError:
+        return None
+    return tuple(map(str, variablen)), tuple(polynom.monic().terms())
+
+
+def loesungen_kanonisch(text):
+    """Gerundete Lösungsmenge zu ``x=a oder x=b`` oder ``None``, wenn nicht lesbar."""
+    if text in _UNLOESBAR:
+        return frozenset()
+
+    werte = set()
+    for teil in re.split(r"oder|und|;|\|", text):
+        # Genau ein "=", auf einer Seite die Variable, auf der anderen die Zahl
+        seiten = teil.split("=")
+        if len(seiten) != 2:
+            return None
+        links, rechts = seiten
+        if _VARIABLE.fullmatch(links):
+            zahl = rechts
+        elif _VARIABLE.fullmatch(rechts):
+            zahl = links
+        else:
+            return None
+        # "x=2±√3" steht für zwei Lösungen
+        for vorzeichen in ("+", "-") if "±" in zahl else ("",):
+            wert = _zahl(zahl.replace("±", vorzeichen))
+            if wert is None:
+                return None
+            werte.add(round(wert, NACHKOMMASTELLEN) + 0.0)
+    return frozenset(werte)
+
+
+_KANONISCH = {"gleichung": gleichung_kanonisch, "loesungen": loesungen_kanonisch}
+
+
+def _ausdruck(text):
+    if not text or not _ERLAUBT.fullmatch(text):
+        return None
+    if any(len(name) > 1 and name not in _FUNKTIONEN for name in _NAMEN.findall(text)):
+        return None
+
+    from sympy.parsing.sympy_parser import (
+        convert_xor,
+        implicit_multiplication,
+        parse_expr,
+        rationalize,
+        standard_transformations,
+    )
+
+    try:
+        return parse_expr(text, transformations=standard_transformations
+                          + (implicit_multiplication, convert_xor, rationalize))
+    except (SyntaxError, TypeError, ValueError, ZeroDivisionError):
+        return None
+
+
+def _zahl(text):
+    ausdruck = _ausdruck(text)
+    if ausdruck is None or ausdruck.free_symbols:
+        return None
+    try:
+        wert = complex(ausdruck)
+    except TypeError:
+        return None
+    return wert.real if wert.imag == 0 else None
@@ -0,0 +1,48 @@
+"""Parameter und richtige Antworten der Übungen auf der Seite „Grafisches Lösungsverfahren“.
+
+Eigenes Modul ohne matplotlib: Die Seite braucht nur die Parameter, gezeichnet
+wird im Renderpool (``AufgabePlot`` in ``parabel.plots``). Die richtigen
+Antworten stehen hier, damit ``parabel.aufwaermen`` ihre kanonischen Formen
+schon vor der ersten Sitzung berechnen kann.
+"""
+
+AUFGABEN = {
+    1: dict(a=1, b=-4, c=5, funktion='x² - 4x + 5', titel='Aufgabe 1: x² - 4x + 5 = 1',
+            xlim=(-2, 6), ylim=(-2, 10), xticks=(-2, 7), yticks=(-2, 11)),
+    2: dict(a=1, b=-4, c=3, funktion='x² - 4x + 3', titel='Aufgabe 2: x² - 4x + 3 = 2',
+            xlim=(-2, 6), ylim=(-2, 10), xticks=(-2, 7), yticks=(-2, 11)),
+    3: dict(a=1, b=4, c=7, funktion='x² + 4x + 7', titel='Aufgabe 3: x² + 4x + 7 = 2',
+            xlim=(-8, 4), ylim=(-2, 8), xticks=(-6, 2), yticks=(-2, 10)),
+}
+
+# Mögliche richtige Antworten; jede dazu gleichwertige Antwort wird ebenfalls akzeptiert
+# (umgestellt, mit einer Zahl multipliziert, mit Dezimalkomma, ...)
+RICHTIGE_ANTWORTEN = {
+    "kraftstoff": [
+        "0.002v²-0.18v+8.55=7",
+        "0.002v^2-0.18v+8.55=7",
+        "0.002*v^2-0.18*v+8.55=7",
+        "7=0.002v²-0.18v+8.55",  # Auch umgekehrt akzeptieren
+        "7=0.002v^2-0.18v+8.55",
+        "7=0.002*v^2-0.18*v+8.55",
+    ],
+    1: [
+        "x=2",
+        "2=x",
+        "x = 2",
+        "2 = x"
+    ],
+    2: [
+        "x=0,27 oder x=3,73",
+        "x=0.27 oder x=3.73",
+        "x = 0,27 oder x = 3,73",
+        "x = 0.27 oder x = 3.73",
+    ],
+    3: [
+        "nicht lösbar",
+        "'nicht lösbar'"
+    ],
+}
+
+# Art der Antwort für parabel.antworten.ist_richtig
+ANTWORT_ARTEN = {"kraftstoff": "gleichung", 1: "loesungen", 2: "loesungen", 3: "loesungen"}
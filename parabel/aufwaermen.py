@@ -0,0 +1,109 @@
+"""Aufwärmphase vor dem ersten Besucher.
+
+Ein frischer Prozess zahlt beim ersten Bild für den Font-Cache von matplotlib,
+die Suche nach den fetten Titel-Schriften und den Mathtext-Parser der
+Legenden, dazu für jeden Plot-Slot seine Figure. Beim ersten Prüfen einer
+Antwort kommen sympy und die kanonischen Formen der richtigen Antworten dazu.
+``aufwaermen()`` erledigt das alles, bevor der Server Anfragen annimmt
+(siehe ``werkzeuge/start.py``):
+
+* Renderpool und Auswertungspool starten. Jeder Renderprozess zeichnet dabei
+  jede Plot-Art einmal in ihrer Standardstellung (``renderprozess``), jeder
+  Auswertungsprozess prüft je eine Gleichung und eine Lösungsmenge
+  (``auswertungsprozess``).
+* Die Bilder der Standardstellungen aller Slider im Standard-Bildformat
+  (``parabel.bildformat.STANDARD``) in ``CACHE`` legen.
+* Die kanonischen Formen aller richtigen Antworten aus ``parabel.aufgaben``
+  berechnen.
+
+Die Dauer jedes Schritts landet im Log, in ``parabel.metriken`` und im
+Rückgabewert.
+"""
+
+import json
+import logging
+import threading
+import time
+
+from parabel import antworten, metriken
+from parabel.aufgaben import ANTWORT_ARTEN, AUFGABEN, RICHTIGE_ANTWORTEN
+from parabel.render import BILDER_URL, RENDERPOOL, bild_bytes, statisches_bild
+
+log = logging.getLogger(__name__)
+
+# Startwerte der Slider auf den Seiten, also die Bilder, die jeder Besucher zuerst sieht
+STANDARDBILDER = [
+    ("kraftstoff", {"ziel": 4.0}),
+    *(("aufgabe", {**AUFGABEN[nr], "ziel": 0.0}) for nr in sorted(AUFGABEN)),
+    ("nutzer", {"a": 1, "b": 1, "c": 1, "ziel": 1}),
+    ("scheitelpunktform", {"a": 1.0, "d": 0.0, "e": 0.0, "zoom": 1}),
+    ("faktorisierte_form", {"a": 1.0, "x1": -2.0, "x2": 2.0, "zoom": 1}),
+    ("eine_nullstelle", {"a": 1.0, "x0": 2.0, "zoom": 1}),
+    ("scheitel_aus_nullstellen", {"a": 1.0, "x1": -2.0, "x2": 2.0, "zoom": 1}),
+    ("polynomform", {"a": 1.0, "b": 0.0, "c": 0.0, "zoom": 1}),
+]
+STATISCHE_BILDER = ("nullstellen_uebersicht", "y_achsenabschnitt")
+
+
+def renderprozess():
+    """Im Renderprozess: jede Plot-Art einmal in ihrer Standardstellung zeichnen."""
+    from parabel.render import _render
+
+    # Je Art die erste Stellung; die übrigen Slots legt aufwaermen() an
+    for art, params in dict(STANDARDBILDER[::-1]).items():
+        _render(art, dict(params))
+    for art in STATISCHE_BILDER:
+        _render(art, {})
+
+
+def auswertungsprozess():
+    """Im Auswertungsprozess: sympy-Parser und Vereinfachung einmal durchlaufen."""
+    antworten.gleichung_kanonisch(antworten.bereinigen(RICHTIGE_ANTWORTEN["kraftstoff"][0]))
+    antworten.loesungen_kanonisch(antworten.bereinigen(RICHTIGE_ANTWORTEN[2][0]))
+
+
+def _bilder():
+    # Bytes statt render_bild: Binden die Seiten die Bilder per URL ein
+    # (PARABEL_BILDER_URL), liest der Bild-Endpunkt ebenfalls aus CACHE
+    for art, params in STANDARDBILDER:
+        bild_bytes(art, **params)
+    for art in STATISCHE_BILDER:
+        if BILDER_URL:
+            bild_bytes(art)
+        else:
+            statisches_bild(art)
+
+
+def _antworten():
+    for aufgabe, richtige in RICHTIGE_ANTWORTEN.items():
+        antworten.ist_richtig(richtige[0], richtige, art=ANTWORT_ARTEN[aufgabe])
+
+
+def aufwaermen():
+    """Wärmt Pools und Caches auf; liefert die Dauer jedes Schritts in Sekunden."""
+    # Erst hier die Hooks setzen: Ohne Aufwärmphase soll der erste Auftrag nicht
+    # auf alle Standardbilder warten. Ersetzt ein Pool später abgestürzte
+    # Prozesse, wärmen die neuen wieder auf.
+    RENDERPOOL.aufwaermen = f"{__name__}:renderprozess"
+    antworten.AUSWERTUNG.aufwaermen = f"{__name__}:auswertungsprozess"
+
+    bericht = {}
+    start = time.perf_counter()
+
+    def schritt(name, funktion):
+        beginn = time.perf_counter()
+        funktion()
+        bericht[name] = round(time.perf_counter() - beginn, 3)
+
+    # Beide Pools gleichzeitig starten, ihre Prozesse wärmen parallel auf
+    auswertung = threading.Thread(target=schritt, args=("auswertungspool", antworten.AUSWERTUNG.starten))
+    auswertung.start()
+    schritt("renderpool", RENDERPOOL.starten)
+    auswertung.join()
+    schritt("bilder", _bilder)
+    schritt("antworten", _antworten)
+    bericht["gesamt"] = round(time.perf_counter() - start, 3)
+
+    log.info("Aufgewärmt: %s", json.dumps(bericht))
+    metriken.aufwaermen(bericht)
+    return bericht
@@ -0,0 +1,238 @@
+"""Kleiner Prozess-Pool, der Schülereingaben abgeschottet und zeitbegrenzt auswertet.
+
+Eine Eingabe wie ``9^9^9^9`` oder ein tief verschachtelter Ausdruck kann sympy
+beliebig lange rechnen lassen. Im Streamlit-Thread würde das den Thread und
+über den GIL alle anderen Sitzungen des Prozesses blockieren. Deshalb läuft
+jede Auswertung in einem eigenen Arbeitsprozess mit Speicherlimit, und der
+Aufrufer wartet höchstens ``timeout`` Sekunden. Hängt ein Prozess, wird der
+Pool ersetzt; Aufträge, die dabei mit abgebrochen wurden, laufen einmal neu.
+Der neue Pool startet in einem eigenen Thread (``Poolstart``). Wer darauf
+länger als ``timeout`` wartet, bekommt ``Ausgefallen`` und kann es gleich noch
+einmal versuchen.
+
+Damit eine Welle von Eingaben nicht alle Sitzungen ausbremst, werden neue
+Aufträge abgelehnt, solange schon ``max_warteschlange`` offen sind.
+"""
+
+import contextlib
+import importlib
+import logging
+import multiprocessing
+import sys
+import threading
+import types
+from concurrent.futures import BrokenExecutor, CancelledError, Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+log = logging.getLogger(__name__)
+
+
+class Ueberlastet(Exception):
+    """Es warten schon zu viele Aufträge auf einen Arbeitsprozess."""
+
+
+class Zeitueberschreitung(Exception):
+    """Die Auswertung hat länger als ``timeout`` Sekunden gedauert."""
+
+
+class Ausgefallen(Exception):
+    """Die Arbeitsprozesse starten nicht oder sind auch nach einem Neustart defekt."""
+
+
+def _arbeiter_starten(max_speicher, vorladen, aufwaermen=None):
+    try:
+        import resource
+    except ImportError:  # kein Unix: ohne Speicherlimit
+        pass
+    else:
+        resource.setrlimit(resource.RLIMIT_AS, (max_speicher, max_speicher))
+    vorbereiten(vorladen, aufwaermen)
+
+
+def vorbereiten(vorladen, aufwaermen=None):
+    """Im neuen Arbeitsprozess: Module importieren und ``aufwaermen`` ("modul:funktion") aufrufen."""
+    for modul in vorladen:
+        importlib.import_module(modul)
+    if aufwaermen:
+        modul, _, funktion = aufwaermen.partition(":")
+        getattr(importlib.import_module(modul), funktion)()
+
+
+def _bereit():
+    return True
+
+
+@contextlib.contextmanager
+def _ohne_hauptmodul():
+    # Während eines Skriptlaufs ist sys.modules["__main__"] bei Streamlit die Seite
+    # selbst. "spawn" würde sie in jedem neuen Prozess als __mp_main__ erneut
+    # ausführen; ein Modul ohne __file__ lässt den Prozess das überspringen.
+    hauptmodul = sys.modules["__main__"]
+    sys.modules["__main__"] = types.ModuleType("__main__")
+    try:
+        yield
+    finally:
+        sys.modules["__main__"] = hauptmodul
+
+
+def prozesspool_starten(prozesse, initializer=None, initargs=()):
+    """``ProcessPoolExecutor`` mit "spawn", dessen Prozesse alle schon laufen.
+
+    "spawn" statt fork, weil Streamlit mit vielen Threads läuft. Start und
+    Imports der Prozesse passieren hier, nicht im ersten Auftrag. Wirft
+    ``BrokenExecutor``, wenn die Prozesse nicht starten.
+    """
+    pool = ProcessPoolExecutor(
+        max_workers=prozesse,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=initializer,
+        initargs=initargs,
+    )
+    # Der Pool startet bei jedem submit einen weiteren Prozess, bis alle laufen
+    with _ohne_hauptmodul():
+        bereit = [pool.submit(_bereit) for _ in range(prozesse)]
+    for future in bereit:
+        future.result()
+    return pool
+
+
+class Poolstart:
+    """Hält einen Prozesspool und startet ihn bei Bedarf in einem eigenen Thread.
+
+    Start und Aufwärmen der Prozesse dauern Sekunden. Sie laufen außerhalb
+    aller Locks, damit Aufrufer, Statistik und Metriken derweil nicht stehen.
+    """
+
+    def __init__(self, name, starten):
+        self.name = name
+        # Funktion ohne Argumente, die den Pool liefert oder BrokenExecutor wirft
+        self._starten = starten
+        self._lock = threading.Lock()
+        self._pool = None
+        self._start = None
+
+    def pool(self, timeout=None):
+        """Der laufende Pool, ``None`` wenn er nicht starten konnte.
+
+        Läuft er nach ``timeout`` Sekunden noch nicht, kommt ``TimeoutError``
+        (``concurrent.futures``); der Start läuft weiter.
+        """
+        with self._lock:
+            if self._pool is not None:
+                return self._pool
+            if self._start is None:
+                self._start = Future()
+                threading.Thread(target=self._starten_und_melden, args=(self._start,), name=self.name,
+                                 daemon=True).start()
+            start = self._start
+        return start.result(timeout=timeout)
+
+    def _starten_und_melden(self, start):
+        try:
+            pool = self._starten()
+        except BrokenExecutor:
+            log.exception("%s: Prozesse konnten nicht gestartet werden", self.name)
+            pool = None
+        with self._lock:
+            self._pool = pool
+            self._start = None
+        start.set_result(pool)
+
+    def ersetzen(self, pool):
+        """Beendet ``pool``, wenn er noch der laufende ist; wahr, wenn das so war."""
+        with self._lock:
+            if pool is None or self._pool is not pool:
+                return False  # Start fehlgeschlagen oder schon von einem anderen Thread ersetzt
+            self._pool = None
+        # Ein hängender Prozess beendet sich nicht von selbst
+        for prozess in list((pool._processes or {}).values()):
+            prozess.kill()
+        pool.shutdown(wait=False, cancel_futures=True)
+        return True
+
+
+class Auswertungspool:
+    def __init__(self, prozesse=2, timeout=2.0, max_speicher=1024**3, max_warteschlange=32,
+                 vorladen=(), aufwaermen=None):
+        self.prozesse = prozesse
+        self.timeout = timeout
+        self.max_speicher = max_speicher
+        self.max_warteschlange = max_warteschlange
+        self.vorladen = tuple(vorladen)
+        # "modul:funktion", wird in jedem Arbeitsprozess nach dem Vorladen aufgerufen
+        self.aufwaermen = aufwaermen
+        self._poolstart = Poolstart("parabel-auswertung", self._pool_starten)
+        self._lock = threading.Lock()
+        self._zaehler = dict.fromkeys(
+            ("anfragen", "timeouts", "ueberlastet", "fehler", "neustarts"), 0)
+        self._offen = 0
+        self._max_offen = 0
+
+    def auswerten(self, funktion, *args):
+        """Ergebnis von ``funktion(*args)`` aus einem Arbeitsprozess.
+
+        ``funktion`` muss auf Modulebene definiert sein (wird per Name an den
+        Prozess übergeben). Wirft ``Zeitueberschreitung``, ``Ueberlastet`` oder
+        ``Ausgefallen``.
+        """
+        with self._lock:
+            self._zaehler["anfragen"] += 1
+            if self._offen >= self.max_warteschlange:
+                self._zaehler["ueberlastet"] += 1
+                raise Ueberlastet
+            self._offen += 1
+            self._max_offen = max(self._max_offen, self._offen)
+        try:
+            return self._ausfuehren(funktion, args)
+        finally:
+            with self._lock:
+                self._offen -= 1
+
+    def _ausfuehren(self, funktion, args, versuche=2):
+        try:
+            pool = self._poolstart.pool(timeout=self.timeout)
+        except FutureTimeoutError:
+            # Der Pool startet gerade (neu): lieber nicht prüfen als alle Sitzungen warten lassen
+            with self._lock:
+                self._zaehler["fehler"] += 1
+            raise Ausgefallen from None
+        try:
+            if pool is None:
+                raise BrokenExecutor
+            return pool.submit(funktion, *args).result(timeout=self.timeout)
+        except FutureTimeoutError:
+            with self._lock:
+                self._zaehler["timeouts"] += 1
+            log.warning("Auswertung nach %.1f s abgebrochen: %s%r", self.timeout, funktion.__name__, args)
+            self._ersetzen(pool)
+            raise Zeitueberschreitung from None
+        except (BrokenExecutor, CancelledError):
+            # Der Pool wurde wegen eines anderen Auftrags ersetzt (oder ein Prozess
+            # ist am Speicherlimit gestorben): einmal auf dem neuen Pool versuchen
+            self._ersetzen(pool)
+            if versuche > 1:
+                return self._ausfuehren(funktion, args, versuche - 1)
+            with self._lock:
+                self._zaehler["fehler"] += 1
+            raise Ausgefallen from None
+
+    def _pool_starten(self):
+        return prozesspool_starten(self.prozesse, _arbeiter_starten,
+                                   (self.max_speicher, self.vorladen, self.aufwaermen))
+
+    def starten(self):
+        """Startet die Arbeitsprozesse jetzt statt beim ersten Auftrag; wahr, wenn sie laufen."""
+        return self._poolstart.pool() is not None
+
+    def _ersetzen(self, pool):
+        if self._poolstart.ersetzen(pool):
+            with self._lock:
+                self._zaehler["neustarts"] += 1
+
+    def statistik(self):
+        with self._lock:
+            return {
+                **self._zaehler,
+                "warteschlange": self._offen,
+                "max_warteschlange": self._max_offen,
+            }
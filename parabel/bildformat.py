@@ -0,0 +1,111 @@
+"""Format und Auflösung der Plot-Bilder, pro Deployment und pro Besucher.
+
+Jeder Zug an einem Slider schickt ein neues Bild an den Browser; mit 30
+Geräten an einem Access Point im Klassenzimmer zählt jedes Kilobyte.
+``Bildformat`` legt fest, was ``parabel.render`` liefert:
+
+* ``format``: ``png``, ``webp`` oder ``svg``
+* ``breite``: größte Breite in Pixeln (PNG und WebP). Für schmalere Bilder wird
+  mit entsprechend weniger dpi gezeichnet, nicht nur verkleinert.
+* ``palette``: PNG mit höchstens 256 Farben. Die Plots bestehen aus wenigen
+  Farben, das Bild wird etwa viermal kleiner und sieht gleich aus.
+
+Die Voreinstellung des Deployments (``STANDARD``) kommt aus den
+Umgebungsvariablen ``PARABEL_BILDFORMAT``, ``PARABEL_BILDBREITE`` und
+``PARABEL_BILDPALETTE`` (``0`` oder ``1``), ohne sie Paletten-PNG in voller
+Breite. ``waehlen`` passt sie pro Besucher an:
+
+* ``?bild=png|webp|svg`` und ``?palette=0|1`` in der URL
+* Breite des Browserfensters in CSS-Pixeln mal Pixeldichte, aus
+  ``?breite=...&dpr=...`` oder aus den Client Hints ``Sec-CH-Viewport-Width``
+  und ``Sec-CH-DPR``. Die schickt ein Browser nur, wenn die Antwort ihn mit
+  ``Accept-CH`` darum bittet; das kann z.B. der Reverse Proxy tun. Die Breite
+  wird auf eine der ``BREITEN`` aufgerundet, damit sich ähnliche Geräte die
+  Bilder im Cache teilen.
+
+``st.image`` lässt nur PNG mit Alpha- oder Palettenkanal unverändert, alles
+andere kodiert es bei jedem Aufruf neu, meist als JPEG. WebP und SVG gibt
+``fuer_st_image`` deshalb als ``data:``-URL weiter, die Streamlit unverändert
+an den Browser schickt; Base64 macht sie ein Drittel größer.
+"""
+
+import base64
+import logging
+import math
+import os
+from typing import NamedTuple
+
+log = logging.getLogger(__name__)
+
+FORMATE = {"png": "image/png", "webp": "image/webp", "svg": "image/svg+xml"}
+
+# Größte Breite, die st.image unverändert lässt (streamlit.elements.lib.image_utils.MAXIMUM_CONTENT_WIDTH)
+MAX_BREITE = 2 * 730
+
+# Erlaubte Bildbreiten in Pixeln, z.B. Handy, Tablet, Laptop, Anzeigebreite von Streamlit
+BREITEN = (480, 730, 1095, MAX_BREITE)
+
+
+class Bildformat(NamedTuple):
+    format: str = "png"
+    breite: int = MAX_BREITE
+    palette: bool = True
+
+
+def _ja(wert):
+    return wert.strip().lower() in ("1", "true", "ja", "on")
+
+
+def _stufe(pixel):
+    """Kleinste der ``BREITEN``, die ``pixel`` fasst."""
+    return next((breite for breite in BREITEN if breite >= pixel), MAX_BREITE)
+
+
+def _aus_umgebung():
+    format = os.environ.get("PARABEL_BILDFORMAT", "png").lower()
+    if format not in FORMATE:
+        log.warning("PARABEL_BILDFORMAT=%s unbekannt, nehme png", format)
+        format = "png"
+    breite = _stufe(int(os.environ.get("PARABEL_BILDBREITE", MAX_BREITE)))
+    return Bildformat(format, breite, _ja(os.environ.get("PARABEL_BILDPALETTE", "1")))
+
+
+STANDARD = _aus_umgebung()
+
+
+def _zahl(*werte):
+    """Erster Wert, der sich als positive Zahl lesen lässt, sonst ``None``."""
+    for wert in werte:
+        try:
+            zahl = float(wert)
+        except (TypeError, ValueError):
+            continue
+        if math.isfinite(zahl) and zahl > 0:
+            return zahl
+    return None
+
+
+def waehlen(query_params, headers):
+    """Das Bildformat für einen Besucher, aus Query-Parametern und Request-Headern."""
+    format = query_params.get("bild", STANDARD.format)
+    if format not in FORMATE:
+        format = STANDARD.format
+    palette = STANDARD.palette
+    if "palette" in query_params:
+        palette = _ja(query_params["palette"])
+
+    breite = STANDARD.breite
+    fenster = _zahl(query_params.get("breite"), headers.get("Sec-CH-Viewport-Width"),
+                    headers.get("Viewport-Width"))
+    if fenster is not None:
+        dichte = _zahl(query_params.get("dpr"), headers.get("Sec-CH-DPR"), headers.get("DPR")) or 1.0
+        # Breiter als das Fenster wird ein Bild nie angezeigt
+        breite = min(_stufe(fenster * dichte), STANDARD.breite)
+    return Bildformat(format, breite, palette)
+
+
+def fuer_st_image(daten, format):
+    """``daten`` so, dass ``st.image`` sie unverändert ausliefert."""
+    if format == "png":
+        return daten
+    return f"data:{FORMATE[format]};base64,{base64.b64encode(daten).decode('ascii')}"
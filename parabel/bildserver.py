@@ -0,0 +1,230 @@
+"""HTTP-Endpunkt, der Plots als Bilder ausliefert, ohne Streamlit-Skript.
+
+Jeder Plot hat eine feste Adresse aus Plot-Art, Format und Parametern::
+
+    /bild/scheitelpunktform.png?a=1&d=2&e=-3&zoom=1
+    /bild/aufgabe.webp?nr=2&ziel=1.5&breite=730
+    /bild/kurvenschar.svg?form=polynomform&parameter=b&a=1&b=0&c=0
+
+Die Parameter heißen wie in ``parabel.plots``; ``aufgabe`` bekommt statt der
+ganzen Aufgabe ihre Nummer aus ``parabel.aufgaben``. Zahlen behalten ihren Typ
+(``a=1`` ist wie auf den Seiten eine ganze Zahl, ``a=1.0`` nicht), denn die
+Beschriftungen der Plots unterscheiden sie. ``breite`` und
+``palette`` wählen Bildbreite und Farbpalette (siehe ``parabel.bildformat``).
+Gerendert wird wie auf den Seiten über ``parabel.render`` (Cache, vorgerenderte
+Bilder, Renderpool). Ist der Renderpool ausgelastet, kommt ``503`` mit
+``Retry-After`` und dem Platzhalterbild.
+
+Dieselben Parameter ergeben immer dieselben Bytes. Jede Antwort hat daher einen
+starken ETag (Hash der Bytes; ``If-None-Match`` ergibt ``304``). Adressen mit
+``v=<VERSION>`` ändern sich nie und werden mit ``Cache-Control: immutable``
+ausgeliefert, Browser und Reverse Proxy fragen dann gar nicht mehr nach.
+``VERSION`` ist ein Hash über die Render-Einstellungen, den Code der Plots und
+die matplotlib-Version, neue Bilder bekommen also neue Adressen. Ohne oder mit
+veraltetem ``v`` muss der Cache jedes Mal nachfragen (``no-cache``).
+
+Zwei Betriebsarten:
+
+* eigener Dienst für beide Apps und für Arbeitsblätter:
+  ``python -m parabel.bildserver --port 8503``
+* im Streamlit-Prozess, mit ``PARABEL_BILDER_PORT`` (Adresse über
+  ``PARABEL_BILDER_HOST``); startet mit dem ersten Bild
+
+Mit ``PARABEL_BILDER_URL`` (öffentliche, absolute Adresse des Endpunkts, z.B.
+hinter dem Reverse Proxy) geben ``render_bild`` und ``statisches_bild`` nur
+noch die Adresse an ``st.image`` weiter (``url``). Ein Rerun rendert dann
+nichts mehr, der Browser holt das Bild selbst und hat es beim nächsten Mal
+im Cache.
+"""
+
+import argparse
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import math
+import threading
+from importlib import metadata
+from pathlib import Path
+from urllib.parse import urlencode
+
+import tornado.web
+from tornado.ioloop import IOLoop
+
+from parabel import metriken
+from parabel.aufgaben import AUFGABEN
+from parabel.bildformat import FORMATE, STANDARD, Bildformat, _ja, _stufe
+from parabel.render import EINSTELLUNGEN, GRENZE, besetzt_bild, bild_bytes
+from parabel.renderpool import Besetzt
+
+log = logging.getLogger(__name__)
+
+# Parameter, die kein Plot-Parameter sind
+BILDPARAMETER = ("v", "breite", "palette")
+# Plot-Parameter, die Text statt Zahl sind (KurvenscharPlot)
+TEXTPARAMETER = ("form", "parameter")
+# Ein Jahr: länger hält kaum ein Cache etwas fest
+UNVERAENDERLICH = "public, max-age=31536000, immutable"
+
+
+def _version():
+    inhalt = hashlib.sha256(json.dumps(EINSTELLUNGEN, sort_keys=True).encode())
+    inhalt.update(metadata.version("matplotlib").encode())
+    for modul in ("plots.py", "abtastung.py", "loeser.py", "aufgaben.py", "textcache.py"):
+        inhalt.update((Path(__file__).parent / modul).read_bytes())
+    return inhalt.hexdigest()[:12]
+
+
+VERSION = _version()
+
+
+def _text(wert):
+    if isinstance(wert, float):
+        return repr(round(wert, 6))
+    return str(wert)
+
+
+def url(basis, art, bild, params):
+    """Unveränderliche Adresse des Plots ``art`` mit ``params`` beim Endpunkt unter ``basis``."""
+    params = dict(params)
+    if art == "aufgabe":
+        nr = next(nr for nr, aufgabe in AUFGABEN.items()
+                  if all(params.get(name) == wert for name, wert in aufgabe.items()))
+        params = {name: wert for name, wert in params.items() if name not in AUFGABEN[nr]}
+        params["nr"] = nr
+    abfrage = {name: _text(wert) for name, wert in sorted(params.items())}
+    abfrage.update(breite=bild.breite, palette=int(bild.palette), v=VERSION)
+    return f"{basis}/bild/{art}.{bild.format}?{urlencode(abfrage)}"
+
+
+def parameter_lesen(art, argumente):
+    """Plot-Parameter aus den Query-Argumenten (Name -> Text); ``ValueError`` bei ungültigen Werten."""
+    params = {}
+    for name, wert in argumente.items():
+        if name in BILDPARAMETER:
+            continue
+        if art == "aufgabe" and name == "nr":
+            if not wert.isdigit() or int(wert) not in AUFGABEN:
+                raise ValueError(f"Keine Aufgabe {wert}")
+            params.update(AUFGABEN[int(wert)])
+        elif name in TEXTPARAMETER:
+            params[name] = wert
+        else:
+            zahl = _zahl(wert)
+            if not math.isfinite(zahl) or abs(zahl) > GRENZE:
+                raise ValueError(f"{name}={wert} liegt außerhalb von ±{GRENZE}")
+            params[name] = zahl
+    return params
+
+
+def _zahl(text):
+    """Ganze Zahl wie auf den Seiten (``1``), sonst Fließkommazahl (``1.0``); so passt es zu ``_text``."""
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def bildformat_lesen(format, argumente):
+    """Das ``Bildformat`` zu Dateiendung und Query-Argumenten."""
+    breite = STANDARD.breite
+    if "breite" in argumente:
+        breite = min(_stufe(int(argumente["breite"])), STANDARD.breite)
+    palette = _ja(argumente["palette"]) if "palette" in argumente else STANDARD.palette
+    return Bildformat(format, breite, palette)
+
+
+class BildHandler(tornado.web.RequestHandler):
+    # ETag: Tornado hasht den Antwortkörper (compute_etag) und beantwortet If-None-Match selbst mit 304
+
+    async def get(self, art, format):
+        self._art = "ungueltig"
+        argumente = {name: self.get_argument(name) for name in self.request.arguments}
+        try:
+            params = parameter_lesen(art, argumente)
+            bild = bildformat_lesen(format, argumente)
+        except ValueError as fehler:
+            raise tornado.web.HTTPError(400, "%s", fehler) from None
+        try:
+            rendern = functools.partial(bild_bytes, art, bild, **params)
+            daten = await IOLoop.current().run_in_executor(None, rendern)
+        except (KeyError, TypeError, ValueError) as fehler:
+            # Unbekannte Plot-Art, fehlende oder überzählige Parameter
+            raise tornado.web.HTTPError(400, "%s: %r", art, fehler) from None
+        except Besetzt:
+            # Platzhalter statt kaputtem Bild; nicht cachen, der Browser fragt gleich wieder
+            self._art = art
+            self.set_status(503)
+            self.set_header("Retry-After", "1")
+            self.set_header("Content-Type", FORMATE["png"])
+            self.set_header("Cache-Control", "no-store")
+            self.write(besetzt_bild())
+            return
+        self._art = art
+        self._gesendet = len(daten)
+        self.set_header("Content-Type", FORMATE[format])
+        self.set_header("Cache-Control", UNVERAENDERLICH if argumente.get("v") == VERSION else "no-cache")
+        self.write(daten)
+
+    def write_error(self, status_code, **kwargs):
+        # Fehlermeldung als Text, damit man beim Einbauen in ein Arbeitsblatt sieht, was nicht stimmt
+        fehler = kwargs.get("exc_info", (None, None))[1]
+        self.set_header("Content-Type", "text/plain; charset=utf-8")
+        if getattr(fehler, "log_message", None):
+            self.finish(fehler.log_message % fehler.args)
+        else:
+            self.finish(self._reason)
+
+    def on_finish(self):
+        # Bei 304 schickt Tornado keinen Körper
+        gesendet = getattr(self, "_gesendet", 0) if self.get_status() == 200 else 0
+        metriken.bildserver(getattr(self, "_art", "ungueltig"), self.get_status(), self.path_args[1], gesendet)
+
+
+def anwendung():
+    return tornado.web.Application([(r"/bild/([a-z_]+)\.(png|webp|svg)", BildHandler)])
+
+
+async def _dienen(port, adresse, bereit=None):
+    try:
+        anwendung().listen(port, address=adresse)
+    except OSError:
+        log.exception("Bild-Endpunkt %s:%s konnte nicht gestartet werden", adresse, port)
+        return
+    finally:
+        if bereit is not None:
+            bereit.set()
+    log.info("Bilder unter http://%s:%s/bild/ (Version %s)", adresse, port, VERSION)
+    await asyncio.Event().wait()
+
+
+_gestartet = False
+_lock = threading.Lock()
+
+
+def starten(port, adresse="127.0.0.1"):
+    """Startet den Endpunkt in einem eigenen Thread mit eigener Event-Loop, z.B. im Streamlit-Prozess."""
+    global _gestartet
+    with _lock:
+        if _gestartet:
+            return
+        _gestartet = True
+    bereit = threading.Event()
+    threading.Thread(target=asyncio.run, args=(_dienen(port, adresse, bereit),), name="parabel-bildserver",
+                     daemon=True).start()
+    bereit.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8503)
+    parser.add_argument("--adresse", default="127.0.0.1")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+    asyncio.run(_dienen(args.port, args.adresse))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Prozessweiter LRU-Cache für fertig gerenderte Plot-Bilder.
+
+Die Schieberegler der Apps sind diskret (z.B. 0,1er-Schritte von -2 bis 8), daher
+wiederholen sich die Plot-Zustände über alle Sitzungen hinweg sehr häufig.
+Der Cache wird von allen Sitzungen (= Threads) eines Streamlit-Prozesses
+geteilt und verdrängt die am längsten nicht genutzten Einträge, sobald die
+maximale Anzahl oder Gesamtgröße überschritten ist.
+"""
+
+import threading
+from collections import OrderedDict
+
+
+def schluessel(art, params):
+    """Hashbarer Cache-Schlüssel aus Plot-Art und Parametern.
+
+    Fließkommazahlen werden gerundet, damit z.B. 0.30000000000000004 und 0.3
+    (Slider-Werte aus dem Browser) auf denselben Eintrag zeigen.
+    """
+    return (art, tuple(sorted((name, _normalisiere(wert)) for name, wert in params.items())))
+
+
+def _normalisiere(wert):
+    if isinstance(wert, float):
+        return round(wert, 6)
+    if isinstance(wert, (list, tuple)):
+        return tuple(_normalisiere(w) for w in wert)
+    return wert
+
+
+class RenderCache:
+    def __init__(self, max_eintraege=2048, max_bytes=256 * 1024**2):
+        self.max_eintraege = max_eintraege
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._daten = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            daten = self._daten.get(key)
+            if daten is None:
+                self.misses += 1
+                return None
+            self._daten.move_to_end(key)
+            self.hits += 1
+            return daten
+
+    def put(self, key, daten):
+        with self._lock:
+            if key in self._daten:
+                self._bytes -= len(self._daten.pop(key))
+            self._daten[key] = daten
+            self._bytes += len(daten)
+
+            while self._daten and (len(self._daten) > self.max_eintraege
+                                   or self._bytes > self.max_bytes):
+                _, alt = self._daten.popitem(last=False)
+                self._bytes -= len(alt)
+
+    def get_or_render(self, key, render):
+        """Liefert die Bytes aus dem Cache oder rendert sie mit ``render()``.
+
+        Gerendert wird außerhalb des Locks, damit eine langsame Figur nicht
+        alle anderen Sitzungen blockiert.
+        """
+        daten = self.get(key)
+        if daten is None:
+            daten = render()
+            self.put(key, daten)
+        return daten
+
+    def statistik(self):
+        with self._lock:
+            anfragen = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / anfragen if anfragen else 0.0,
+                "eintraege": len(self._daten),
+                "bytes": self._bytes,
+            }
+
+    def leeren(self):
+        with self._lock:
+            self._daten.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
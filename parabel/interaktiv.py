@@ -0,0 +1,155 @@
+"""Interaktive Variante der Slider-Plots als Vega-Lite-Diagramme (Altair).
+
+Die Schieberegler sind hier Vega-Lite-Parameter, die direkt unter dem
+Diagramm angezeigt werden. Kurve, Scheitelpunkt, Nullstellen und Ziellinie
+berechnet der Browser aus diesen Parametern: Das Verschieben eines Reglers
+löst keinen Streamlit-Rerun aus und kostet den Server keine Rechenzeit.
+
+Die Parameter heißen wie die Slider-Keys der Seiten (``a_sp``, ``ziel_verbrauch``, ...),
+Wertebereiche und Schrittweiten entsprechen den Slidern.
+"""
+
+import functools
+
+import altair as alt
+
+HOEHE = 450
+
+
+def _regler(name, label, minimum, maximum, start, schritt):
+    return alt.param(name=name, value=start,
+                     bind=alt.binding_range(min=minimum, max=maximum, step=schritt, name=label))
+
+
+def _eine_zeile():
+    """Datenquelle mit genau einer Zeile, für Punkte und Texte aus Parametern."""
+    return alt.Data(values=[{}])
+
+
+def _kurve(formel, farbe, xlim, ylim, x_titel='x', y_titel='f(x)'):
+    schritt = (xlim[1] - xlim[0]) / 400
+    return alt.Chart(alt.sequence(xlim[0], xlim[1] + schritt, schritt, as_='x')).transform_calculate(
+        y=formel
+    ).mark_line(color=farbe, strokeWidth=2.5, clip=True).encode(
+        x=alt.X('x:Q', scale=alt.Scale(domain=list(xlim), nice=False), title=x_titel),
+        y=alt.Y('y:Q', scale=alt.Scale(domain=list(ylim), nice=False), title=y_titel),
+    )
+
+
+def _punkte(ausdruecke, farbe, bedingung='true'):
+    """Punkte (x, y) aus Vega-Ausdrücken; ``bedingung`` blendet ungültige Punkte aus."""
+    x, y = ausdruecke[-1]
+    for i in reversed(range(len(ausdruecke) - 1)):
+        px, py = ausdruecke[i]
+        x = f'datum.i == {i} ? ({px}) : ({x})'
+        y = f'datum.i == {i} ? ({py}) : ({y})'
+    werte = [{'i': i} for i in range(len(ausdruecke))]
+    return alt.Chart(alt.Data(values=werte)).transform_calculate(
+        x=x, y=y
+    ).transform_filter(bedingung).mark_point(
+        filled=True, size=160, color=farbe, opacity=1, clip=True
+    ).encode(x='x:Q', y='y:Q')
+
+
+def _text(ausdruck, zeile=0, farbe='black'):
+    """Textzeile oben links im Diagramm (wie die Eigenschaften-Box der Bilder)."""
+    return alt.Chart(_eine_zeile()).transform_calculate(text=ausdruck).mark_text(
+        align='left', baseline='top', fontSize=13, color=farbe
+    ).encode(x=alt.value(8), y=alt.value(8 + 18 * zeile), text='text:N')
+
+
+def _achsen():
+    null = alt.Chart(alt.Data(values=[{'null': 0}]))
+    return (null.mark_rule(color='black', strokeWidth=0.8).encode(y='null:Q')
+            + null.mark_rule(color='black', strokeWidth=0.8).encode(x='null:Q'))
+
+
+_EIGENSCHAFTEN = (
+    "'Öffnung: ' + ({a} > 0 ? 'nach oben' : 'nach unten') + "
+    "',  Streckung: ' + (abs({a}) > 1 ? 'gestreckt' : abs({a}) < 1 ? 'gestaucht' : 'keine Streckung')"
+)
+
+
+def _diagramm(*ebenen, params, titel):
+    return alt.layer(*ebenen).add_params(*params).properties(
+        title=titel, height=HOEHE
+    )
+
+
+@functools.cache
+def scheitelpunktform_chart():
+    params = [
+        _regler('a_sp', 'Parameter a: ', -3.0, 3.0, 1.0, 0.1),
+        _regler('d_sp', 'Parameter d: ', -5.0, 5.0, 0.0, 0.5),
+        _regler('e_sp', 'Parameter e: ', -5.0, 5.0, 0.0, 0.5),
+    ]
+    return _diagramm(
+        _achsen(),
+        _kurve('a_sp * pow(datum.x - d_sp, 2) + e_sp', 'blue', (-10, 10), (-10, 10)),
+        _punkte([('d_sp', 'e_sp')], 'red'),
+        _text("'f(x) = ' + a_sp + '(x-(' + d_sp + '))² + (' + e_sp + ')'"),
+        _text("'Scheitelpunkt S(' + d_sp + '|' + e_sp + ')'", zeile=1, farbe='red'),
+        _text(_EIGENSCHAFTEN.format(a='a_sp'), zeile=2, farbe='gray'),
+        params=params, titel='Scheitelpunktform',
+    )
+
+
+@functools.cache
+def faktorisierte_form_chart():
+    params = [
+        _regler('a_fak', 'Parameter a: ', -3.0, 3.0, 1.0, 0.1),
+        _regler('x1_fak', 'Nullstelle x₁: ', -8.0, 8.0, -2.0, 0.5),
+        _regler('x2_fak', 'Nullstelle x₂: ', -8.0, 8.0, 2.0, 0.5),
+    ]
+    return _diagramm(
+        _achsen(),
+        _kurve('a_fak * (datum.x - x1_fak) * (datum.x - x2_fak)', 'green', (-10, 10), (-10, 10)),
+        _punkte([('x1_fak', '0'), ('x2_fak', '0')], 'red'),
+        _text("'f(x) = ' + a_fak + ' · (x-(' + x1_fak + ')) · (x-(' + x2_fak + '))'"),
+        _text("'Nullstellen: x₁=' + x1_fak + ', x₂=' + x2_fak", zeile=1, farbe='red'),
+        _text(_EIGENSCHAFTEN.format(a='a_fak'), zeile=2, farbe='gray'),
+        params=params, titel='Faktorisierte Form - Nullstellenform',
+    )
+
+
+@functools.cache
+def polynomform_chart():
+    params = [
+        _regler('a_poly', 'Parameter a: ', -3.0, 3.0, 1.0, 0.1),
+        _regler('b_poly', 'Parameter b: ', -10.0, 10.0, 0.0, 0.5),
+        _regler('c_poly', 'Parameter c: ', -10.0, 10.0, 0.0, 0.5),
+    ]
+    return _diagramm(
+        _achsen(),
+        _kurve('a_poly * datum.x * datum.x + b_poly * datum.x + c_poly', 'red', (-10, 10), (-10, 10)),
+        _punkte([('0', 'c_poly')], 'blue'),
+        _text("'f(x) = ' + a_poly + 'x² + ' + b_poly + 'x + ' + c_poly"),
+        _text("'y-Achsenabschnitt: c=' + c_poly", zeile=1, farbe='blue'),
+        _text(_EIGENSCHAFTEN.format(a='a_poly'), zeile=2, farbe='gray'),
+        params=params, titel='Polynomform (Normalform)',
+    )
+
+
+@functools.cache
+def kraftstoff_chart():
+    params = [_regler('ziel_verbrauch', 'Kraftstoffverbrauch K (Liter/100km): ', 4.0, 9.0, 4.0, 0.1)]
+    # 0,002v² - 0,18v + (8,55 - K) = 0
+    disk = '(0.0324 - 0.008 * (8.55 - ziel_verbrauch))'
+    v1 = f'(0.18 + sqrt({disk})) / 0.004'
+    v2 = f'(0.18 - sqrt({disk})) / 0.004'
+    ziellinie = alt.Chart(_eine_zeile()).transform_calculate(y='ziel_verbrauch').mark_rule(
+        color='red', strokeDash=[6, 4], strokeWidth=2
+    ).encode(y='y:Q')
+    return _diagramm(
+        _kurve('0.002 * datum.x * datum.x - 0.18 * datum.x + 8.55', 'blue', (40, 120), (3, 9),
+               x_titel='Geschwindigkeit v (km/h)', y_titel='Kraftstoffverbrauch K (Liter/100 km)'),
+        ziellinie,
+        # Nur Lösungen für v > 40 anzeigen
+        _punkte([(v1, 'ziel_verbrauch'), (v2, 'ziel_verbrauch')], 'green',
+                bedingung=f'{disk} >= 0 && datum.x > 40'),
+        _text(f"{disk} < 0 ? 'Keine Lösung' : "
+              f"'Lösung: v = ' + format({v1}, '.1f') + ' km/h'"
+              f" + ({v2} > 40 && {disk} > 0 ? ',  Lösung 2: v = ' + format({v2}, '.1f') + ' km/h' : '')",
+              farbe='darkgreen'),
+        params=params, titel='Kraftstoffverbrauch in Abhängigkeit von der Geschwindigkeit',
+    )
@@ -0,0 +1,102 @@
+"""Löst quadratische Gleichungen a·x² + b·x + c = 0 für ganze NumPy-Arrays auf einmal.
+
+Alle Plots und Auswertungen rechnen Nullstellen und Scheitelpunkt hierüber
+statt mit eigenen Kopien der Mitternachtsformel. Die Nullstellen werden ohne
+Auslöschung berechnet: Statt ``(-b ± √D) / 2a`` (bei b² ≫ 4ac ziehen sich für
+eine der beiden Lösungen zwei fast gleiche Zahlen voneinander ab) wird
+
+    q = -(b + sign(b)·√D) / 2,   x = q / a   und   x = c / q
+
+verwendet. Sonderfälle werden ausdrücklich behandelt statt durch 0 zu teilen:
+
+* ``a = 0, b ≠ 0``: lineare Gleichung, eine Lösung ``-c / b``, kein Scheitelpunkt
+* ``a = b = 0``: keine Lösung (``c ≠ 0``) oder jede Zahl ist Lösung (``c = 0``,
+  ``anzahl == UNENDLICH``)
+
+Micro-Benchmark::
+
+    python -m parabel.loeser [--anzahl 1000000]
+"""
+
+import argparse
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+UNENDLICH = -1
+
+
+class Loesung(NamedTuple):
+    """Ergebnis von ``loesen``; jedes Feld hat die (gebroadcastete) Form der Koeffizienten.
+
+    ``x1 <= x2`` sind die Nullstellen (NaN, wenn es sie nicht gibt; bei einer
+    doppelten Nullstelle oder linearer Gleichung ist ``x1 == x2``).
+    ``scheitel_x``/``scheitel_y`` sind NaN, wenn ``a = 0``. Ist ``faktorisierbar``
+    wahr, gilt ``a·x² + b·x + c = a·(x - x1)·(x - x2)``.
+    """
+    diskriminante: np.ndarray
+    anzahl: np.ndarray
+    x1: np.ndarray
+    x2: np.ndarray
+    scheitel_x: np.ndarray
+    scheitel_y: np.ndarray
+    faktorisierbar: np.ndarray
+
+
+def loesen(a, b, c):
+    """Nullstellen, Scheitelpunkt und faktorisierte Form von a·x² + b·x + c."""
+    a, b, c = np.broadcast_arrays(*(np.asarray(k, dtype=float) for k in (a, b, c)))
+    quadratisch = a != 0
+    linear = ~quadratisch & (b != 0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        diskriminante = b * b - 4 * a * c
+
+        # Auslöschungsfreie Nullstellen der quadratischen Gleichungen
+        q = -0.5 * (b + np.where(b < 0, -1.0, 1.0) * np.sqrt(diskriminante))
+        erste = q / a
+        zweite = np.where(q != 0, c / q, erste)  # q = 0 nur bei b = c = 0: doppelte Nullstelle 0
+        x1 = np.where(quadratisch, np.fmin(erste, zweite), -c / b)
+        x2 = np.where(quadratisch, np.fmax(erste, zweite), -c / b)
+
+        scheitel_x = np.where(quadratisch, -b / (2 * a), np.nan)
+        scheitel_y = np.where(quadratisch, c - b * b / (4 * a), np.nan)
+
+    anzahl = np.select(
+        [quadratisch & (diskriminante > 0), quadratisch & (diskriminante == 0), linear,
+         ~quadratisch & (b == 0) & (c == 0)],
+        [2, 1, 1, UNENDLICH],
+        default=0,
+    )
+    keine = (anzahl == 0) | (anzahl == UNENDLICH)
+    # "+ 0.0" macht aus -0.0 eine 0.0, damit Beschriftungen nicht "-0.00" zeigen
+    x1 = np.where(keine, np.nan, x1) + 0.0
+    x2 = np.where(keine, np.nan, x2) + 0.0
+    scheitel_x = scheitel_x + 0.0
+
+    return Loesung(diskriminante, anzahl, x1, x2, scheitel_x, scheitel_y,
+                   faktorisierbar=quadratisch & (diskriminante >= 0))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-Benchmark für parabel.loeser.loesen")
+    parser.add_argument("--anzahl", type=int, default=1_000_000, help="Gleichungen pro Durchlauf")
+    parser.add_argument("--durchlaeufe", type=int, default=5)
+    args = parser.parse_args()
+
+    zufall = np.random.default_rng(0)
+    a, b, c = zufall.uniform(-10, 10, (3, args.anzahl))
+    zeiten = []
+    for _ in range(args.durchlaeufe):
+        start = time.perf_counter()
+        loesen(a, b, c)
+        zeiten.append(time.perf_counter() - start)
+
+    beste = min(zeiten)
+    print(f"{args.anzahl} Gleichungen in {beste * 1000:.1f} ms "
+          f"({args.anzahl / beste / 1e6:.1f} Mio. Gleichungen/s)")
+
+
+if __name__ == "__main__":
+    main()
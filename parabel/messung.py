@@ -0,0 +1,195 @@
+"""Zeitmessung pro Rerun: Welcher Abschnitt und welcher Plot hat wie lange gedauert?
+
+Eine Seite ruft zu Beginn ``starten(seite)`` und am Ende ``beenden()`` auf und
+markiert ihre Abschnitte mit ``abschnitt(name)`` (typischerweise neben
+``st.header``). Ein Abschnitt dauert bis zur nächsten Markierung. Plots und
+andere teure Blöcke stehen in ``with messen(name):``. ``parabel.render`` meldet
+jedes ausgelieferte Bild mit ``bild(...)`` an den gerade offenen Block:
+
+* ``quelle``: ``cache``, ``vorgerendert`` oder ``gerendert``, bzw. ``url``, wenn die
+  Seite nur die Adresse beim Bild-Endpunkt weitergibt (``parabel.bildserver``),
+  ``besetzt`` für das Platzhalterbild bei ausgelastetem Renderpool
+* ``rechnen_ms``: Linien und Beschriftungen des Plot-Slots aktualisieren
+* ``zeichnen_ms``: Zeichnen auf den Hintergrund des Slots, Verkleinern auf die
+  Anzeigebreite und Kodierung (SVG: ``savefig``)
+* ``warten_ms``: Zeit im Renderpool ohne Rechnen und Zeichnen (Warteschlange, Übertragung)
+* ``format``: ``png``, ``webp`` oder ``svg`` (siehe ``parabel.bildformat``)
+* ``bytes``: Größe des an ``st.image`` übergebenen Bildes, bei WebP und SVG
+  also der ``data:``-URL, bei ``url`` nur die der Adresse
+
+Was sonst im Block passiert (v.a. ``st.image`` selbst), steht in ``ausgeben_ms``.
+
+``beenden()`` schreibt eine JSON-Zeile pro Rerun in das Log ``parabel.messung``
+(Stufe über ``PARABEL_MESSUNG_LOG``, z.B. ``WARNING`` zum Abschalten) und
+liefert denselben Bericht für das Debug-Panel der Seiten zurück.
+
+Gemessen wird pro Thread, also pro laufendem Skript. Läuft ein Fragment allein
+(Slider in einem ``st.fragment``), gibt es kein ``starten``; der Block wird dann
+als eigener Rerun mit ``"fragment": true`` geloggt. Ein abgebrochener Rerun
+(neuer Slider-Wert, bevor das Skript fertig war) wird beim nächsten
+``starten`` mit ``"abgebrochen": true`` geloggt.
+
+Jeder Bericht geht außerdem an ``parabel.metriken``.
+"""
+
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+
+from parabel import metriken
+
+log = logging.getLogger(__name__)
+if not log.handlers:
+    # Eigener Handler: Streamlit richtet nur seine eigenen Logger ein
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(message)s"))
+    log.addHandler(_handler)
+    log.setLevel(os.environ.get("PARABEL_MESSUNG_LOG", "INFO").upper())
+    log.propagate = False
+
+_lokal = threading.local()
+
+# Block -> Seite, auf der er zuletzt gemessen wurde; für Fragment-Reruns, die
+# in einem neuen Thread laufen und ihre Seite sonst nicht kennen
+_SEITEN = {}
+
+_BILDZEITEN = ("rechnen_ms", "zeichnen_ms", "warten_ms")
+
+
+def _ms(sekunden):
+    return round(sekunden * 1000, 1)
+
+
+class Rerun:
+    def __init__(self, seite, fragment=False):
+        self.seite = seite
+        self.fragment = fragment
+        self.start = time.perf_counter()
+        self.abschnitte = []
+        self.block = None
+        self.abschnitt("Seitenanfang")
+
+    def abschnitt(self, name):
+        jetzt = time.perf_counter()
+        if self.abschnitte:
+            self.abschnitte[-1]["ms"] = _ms(jetzt - self.abschnitte[-1].pop("_start"))
+        self.abschnitte.append({"name": name, "ms": 0.0, "bloecke": [], "_start": jetzt})
+
+    def bild(self, art, daten, gesamt, quelle, rechnen=0.0, zeichnen=0.0, format="png"):
+        block = self.block
+        if block is None:
+            # Bild außerhalb von messen(): als eigener Block nach der Plot-Art benannt
+            block = self._neuer_block(art)
+            block["ms"] = _ms(gesamt)
+        block["bilder"].append({
+            "art": art,
+            "quelle": quelle,
+            "format": format,
+            "bytes": len(daten),
+            "rechnen_ms": _ms(rechnen),
+            "zeichnen_ms": _ms(zeichnen),
+            "warten_ms": _ms(gesamt - rechnen - zeichnen) if quelle == "gerendert" else 0.0,
+            "gesamt_ms": _ms(gesamt),
+        })
+
+    def _neuer_block(self, name):
+        block = {"name": name, "ms": 0.0, "bilder": []}
+        self.abschnitte[-1]["bloecke"].append(block)
+        return block
+
+    def bericht(self, abgebrochen=False):
+        jetzt = time.perf_counter()
+        offen = self.abschnitte[-1]
+        offen["ms"] = _ms(jetzt - offen.pop("_start"))
+        bericht = {
+            "seite": self.seite,
+            "fragment": self.fragment,
+            "abgebrochen": abgebrochen,
+            "gesamt_ms": _ms(jetzt - self.start),
+            "bytes": sum(bild["bytes"] for abschnitt in self.abschnitte
+                         for block in abschnitt["bloecke"] for bild in block["bilder"]),
+            "abschnitte": self.abschnitte,
+        }
+        if not self.fragment:
+            for abschnitt in self.abschnitte:
+                for block in abschnitt["bloecke"]:
+                    _SEITEN[block["name"]] = self.seite
+        log.info("%s", json.dumps(bericht, ensure_ascii=False))
+        metriken.rerun(bericht)
+        return bericht
+
+
+def starten(seite):
+    """Beginnt die Messung eines Reruns im aktuellen Thread."""
+    alt = getattr(_lokal, "rerun", None)
+    if alt is not None:
+        alt.bericht(abgebrochen=True)
+    _lokal.rerun = Rerun(seite)
+
+
+def beenden():
+    """Beendet die Messung, loggt sie und liefert den Bericht (``None`` ohne ``starten``)."""
+    rerun = getattr(_lokal, "rerun", None)
+    if rerun is None:
+        return None
+    _lokal.rerun = None
+    return rerun.bericht()
+
+
+def abschnitt(name):
+    """Ab hier zählt die Zeit zum Abschnitt ``name``."""
+    rerun = getattr(_lokal, "rerun", None)
+    if rerun is not None:
+        rerun.abschnitt(name)
+
+
+@contextlib.contextmanager
+def messen(name):
+    """Misst den Block ``name`` (z.B. einen Plot) samt der darin ausgelieferten Bilder."""
+    rerun = getattr(_lokal, "rerun", None)
+    allein = rerun is None
+    if allein:
+        # Fragment-Rerun: Das Skript drumherum läuft nicht, also eigener Bericht
+        rerun = _lokal.rerun = Rerun(seite=_SEITEN.get(name), fragment=True)
+        rerun.abschnitte[-1]["name"] = name
+
+    aussen = rerun.block
+    block = rerun.block = rerun._neuer_block(name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        block["ms"] = _ms(time.perf_counter() - start)
+        ausgeliefert = sum(bild["gesamt_ms"] for bild in block["bilder"])
+        block["ausgeben_ms"] = round(max(block["ms"] - ausgeliefert, 0.0), 1) if block["bilder"] else 0.0
+        rerun.block = aussen
+        if allein:
+            _lokal.rerun = None
+            rerun.bericht()
+
+
+def bild(art, daten, gesamt, quelle, rechnen=0.0, zeichnen=0.0, format="png"):
+    """Meldet ein ausgeliefertes Bild an den laufenden Rerun (ohne Messung: nichts)."""
+    rerun = getattr(_lokal, "rerun", None)
+    if rerun is not None:
+        rerun.bild(art, daten, gesamt, quelle, rechnen, zeichnen, format)
+
+
+def tabelle(bericht):
+    """Eine Zeile pro Abschnitt und Block, für ``st.dataframe`` im Debug-Panel."""
+    zeilen = []
+    for abschnitt in bericht["abschnitte"]:
+        zeilen.append({"Abschnitt": abschnitt["name"], "Block": "", "ms": abschnitt["ms"]})
+        for block in abschnitt["bloecke"]:
+            zeile = {"Abschnitt": "", "Block": block["name"], "ms": block["ms"],
+                     "Quelle": ", ".join(sorted({bild["quelle"] for bild in block["bilder"]})),
+                     "Format": ", ".join(sorted({bild["format"] for bild in block["bilder"]})),
+                     "Bytes": sum(bild["bytes"] for bild in block["bilder"])}
+            for zeit in _BILDZEITEN:
+                zeile[zeit] = round(sum(bild[zeit] for bild in block["bilder"]), 1)
+            zeile["ausgeben_ms"] = block.get("ausgeben_ms", 0.0)
+            zeilen.append(zeile)
+    return zeilen
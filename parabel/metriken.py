@@ -0,0 +1,278 @@
+"""Metriken der Apps im Prometheus-Textformat.
+
+Quelle sind die Rerun-Berichte aus ``parabel.messung`` und die Antwortprüfung
+in ``parabel.antworten``:
+
+* ``parabel_reruns_total{seite, fragment}``
+* ``parabel_rerun_dauer_sekunden{seite}`` (Histogramm)
+* ``parabel_bilder_pro_rerun{seite}`` (Histogramm)
+* ``parabel_bilder_total{art, quelle}`` und ``parabel_bild_bytes_total{seite, format}``
+* ``parabel_bild_bytes_pro_rerun{seite}`` (Histogramm)
+* ``parabel_bildserver_antworten_total{art, status}`` und
+  ``parabel_bildserver_bytes_total{format}``: Bild-Endpunkt (``parabel.bildserver``)
+* ``parabel_antwortpruefung_dauer_sekunden{art}`` (Histogramm)
+* ``parabel_antwortpruefung_total{art, ergebnis}``
+* Zähler von Bild-Cache, Renderpool und Antwortprüfung zum Zeitpunkt des Abrufs,
+  darunter ``parabel_bild_cache_hit_ratio`` und ``parabel_antwort_cache_hit_ratio``
+* ``parabel_text_cache_hit_ratio{cache}`` und Zähler der Text-Caches aller
+  Renderprozesse (``masse`` und ``mathtext``, siehe ``parabel.textcache``)
+* ``parabel_abtastung_cache_hit_ratio`` und Zähler des Caches der adaptiven
+  Abtastung aller Renderprozesse (siehe ``parabel.abtastung``)
+* ``parabel_aufwaermen_sekunden{schritt}``: Dauer der Aufwärmphase (``parabel.aufwaermen``)
+
+Exportiert wird nur, wenn eine der Umgebungsvariablen gesetzt ist:
+
+* ``PARABEL_METRIKEN_PORT``: HTTP-Endpunkt ``http://127.0.0.1:<port>/metrics``
+  (Adresse über ``PARABEL_METRIKEN_HOST``). Laufen beide Apps auf einem Server,
+  braucht jede ihren eigenen Port.
+* ``PARABEL_METRIKEN_DATEI``: Datei für den Textfile-Collector des
+  node_exporters, alle 15 Sekunden neu geschrieben.
+
+Der Export startet mit dem ersten gemessenen Rerun bzw. dem ersten Bild des
+Bild-Endpunkts, also nur im Streamlit-Prozess oder im eigenen Bilddienst und
+nicht in den Arbeitsprozessen der Pools.
+"""
+
+import bisect
+import http.server
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+log = logging.getLogger(__name__)
+
+DATEI_INTERVALL = 15
+
+_lock = threading.Lock()
+
+
+class Zaehler:
+    def __init__(self, name, hilfe, labels):
+        self.name = name
+        self.hilfe = hilfe
+        self.labels = labels
+        self._werte = {}
+
+    def erhoehen(self, *labelwerte, um=1):
+        with _lock:
+            self._werte[labelwerte] = self._werte.get(labelwerte, 0) + um
+
+    def zeilen(self):
+        yield f"# HELP {self.name} {self.hilfe}"
+        yield f"# TYPE {self.name} counter"
+        for labelwerte, wert in sorted(self._werte.items()):
+            yield f"{self.name}{_labels(self.labels, labelwerte)} {wert}"
+
+
+class Histogramm:
+    def __init__(self, name, hilfe, labels, grenzen):
+        self.name = name
+        self.hilfe = hilfe
+        self.labels = labels
+        self.grenzen = tuple(grenzen)
+        self._werte = {}
+
+    def beobachten(self, wert, *labelwerte):
+        with _lock:
+            eimer, summe, anzahl = self._werte.get(labelwerte, ([0] * len(self.grenzen), 0.0, 0))
+            index = bisect.bisect_left(self.grenzen, wert)
+            if index < len(eimer):
+                eimer[index] += 1
+            self._werte[labelwerte] = (eimer, summe + wert, anzahl + 1)
+
+    def zeilen(self):
+        yield f"# HELP {self.name} {self.hilfe}"
+        yield f"# TYPE {self.name} histogram"
+        for labelwerte, (eimer, summe, anzahl) in sorted(self._werte.items()):
+            kumuliert = 0
+            for grenze, zahl in zip(self.grenzen, eimer):
+                kumuliert += zahl
+                le = _labels(self.labels + ("le",), labelwerte + (f"{grenze:g}",))
+                yield f"{self.name}_bucket{le} {kumuliert}"
+            le = _labels(self.labels + ("le",), labelwerte + ("+Inf",))
+            yield f"{self.name}_bucket{le} {anzahl}"
+            yield f"{self.name}_sum{_labels(self.labels, labelwerte)} {summe:.6f}"
+            yield f"{self.name}_count{_labels(self.labels, labelwerte)} {anzahl}"
+
+
+def _labels(namen, werte):
+    if not namen:
+        return ""
+    paare = (f'{name}="{_maskieren(wert)}"' for name, wert in zip(namen, werte))
+    return "{" + ",".join(paare) + "}"
+
+
+def _maskieren(wert):
+    return str(wert).replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+RERUNS = Zaehler("parabel_reruns_total", "Gemessene Reruns pro Seite", ("seite", "fragment"))
+RERUN_DAUER = Histogramm("parabel_rerun_dauer_sekunden", "Dauer eines Reruns", ("seite",),
+                         (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10))
+BILDER_PRO_RERUN = Histogramm("parabel_bilder_pro_rerun", "Ausgelieferte Plots pro Rerun", ("seite",),
+                              (0, 1, 2, 3, 4, 6, 8))
+BILDER = Zaehler("parabel_bilder_total", "Ausgelieferte Plots nach Herkunft", ("art", "quelle"))
+BILD_BYTES = Zaehler("parabel_bild_bytes_total", "An st.image übergebene Bildbytes", ("seite", "format"))
+BILD_BYTES_PRO_RERUN = Histogramm("parabel_bild_bytes_pro_rerun", "An st.image übergebene Bildbytes pro Rerun",
+                                  ("seite",), (0, 25e3, 50e3, 100e3, 200e3, 400e3, 800e3, 1.6e6))
+BILDSERVER = Zaehler("parabel_bildserver_antworten_total", "Antworten des Bild-Endpunkts", ("art", "status"))
+BILDSERVER_BYTES = Zaehler("parabel_bildserver_bytes_total", "Vom Bild-Endpunkt gesendete Bildbytes", ("format",))
+ANTWORT_DAUER = Histogramm("parabel_antwortpruefung_dauer_sekunden", "Dauer einer Antwortprüfung", ("art",),
+                           (0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5))
+ANTWORTEN = Zaehler("parabel_antwortpruefung_total", "Geprüfte Antworten", ("art", "ergebnis"))
+
+METRIKEN = (RERUNS, RERUN_DAUER, BILDER_PRO_RERUN, BILDER, BILD_BYTES, BILD_BYTES_PRO_RERUN, BILDSERVER,
+            BILDSERVER_BYTES, ANTWORT_DAUER, ANTWORTEN)
+
+
+def rerun(bericht):
+    """Übernimmt einen Rerun-Bericht aus ``parabel.messung``."""
+    seite = bericht["seite"] or ""
+    bilder = [bild for abschnitt in bericht["abschnitte"] for block in abschnitt["bloecke"]
+              for bild in block["bilder"]]
+    RERUNS.erhoehen(seite, "true" if bericht["fragment"] else "false")
+    RERUN_DAUER.beobachten(bericht["gesamt_ms"] / 1000, seite)
+    BILDER_PRO_RERUN.beobachten(len(bilder), seite)
+    BILD_BYTES_PRO_RERUN.beobachten(bericht["bytes"], seite)
+    for bild in bilder:
+        BILDER.erhoehen(bild["art"], bild["quelle"])
+        BILD_BYTES.erhoehen(seite, bild["format"], um=bild["bytes"])
+    _exporter_starten()
+
+
+def bildserver(art, status, format, gesendet):
+    """Erfasst eine Antwort des Bild-Endpunkts (``gesendet``: Bytes im Körper, 0 bei 304)."""
+    BILDSERVER.erhoehen(art, str(status))
+    if gesendet:
+        BILDSERVER_BYTES.erhoehen(format, um=gesendet)
+    _exporter_starten()
+
+
+def antwort(art, sekunden, richtig):
+    """Erfasst eine Antwortprüfung (``richtig``: True, False oder None, wenn nicht geprüft)."""
+    ANTWORT_DAUER.beobachten(sekunden, art)
+    ANTWORTEN.erhoehen(art, {True: "richtig", False: "falsch", None: "ueberlastet"}[richtig])
+
+
+_AUFWAERMEN = {}
+
+
+def aufwaermen(bericht):
+    """Übernimmt die Schrittdauern aus ``parabel.aufwaermen``."""
+    with _lock:
+        _AUFWAERMEN.update(bericht)
+
+
+def _momentwerte():
+    """Zähler der Caches und Pools, so wie sie gerade stehen."""
+    # Erst hier importieren: render und antworten importieren (über messung) dieses Modul
+    from parabel import antworten
+    from parabel.render import CACHE, RENDERPOOL, abtastung_statistik, textcache_statistik
+
+    bild_cache = CACHE.statistik()
+    antwort_cache = antworten.statistik()
+    renderpool = RENDERPOOL.statistik()
+    textcache = textcache_statistik()
+    abtastung = abtastung_statistik()
+    anfragen = antwort_cache["cache_hits"] + antwort_cache["cache_misses"]
+    werte = [
+        ("parabel_bild_cache_hit_ratio", "gauge", bild_cache["hit_rate"]),
+        ("parabel_bild_cache_hits_total", "counter", bild_cache["hits"]),
+        ("parabel_bild_cache_misses_total", "counter", bild_cache["misses"]),
+        ("parabel_bild_cache_bytes", "gauge", bild_cache["bytes"]),
+        ("parabel_bild_cache_eintraege", "gauge", bild_cache["eintraege"]),
+        ("parabel_antwort_cache_hit_ratio", "gauge", antwort_cache["cache_hits"] / anfragen if anfragen else 0.0),
+        ("parabel_antworten_abgelehnt_total", "counter", antwort_cache["abgelehnt"]),
+        ("parabel_auswertung_timeouts_total", "counter", antwort_cache["pool_timeouts"]),
+        ("parabel_auswertung_ueberlastet_total", "counter", antwort_cache["pool_ueberlastet"]),
+        ("parabel_renderpool_auftraege_total", "counter", renderpool["auftraege"]),
+        ("parabel_renderpool_zusammengelegt_total", "counter", renderpool["zusammengelegt"]),
+        ("parabel_renderpool_in_arbeit", "gauge", renderpool["in_arbeit"]),
+        ("parabel_renderpool_neustarts_total", "counter", renderpool["neustarts"]),
+        ("parabel_renderpool_timeouts_total", "counter", renderpool["timeouts"]),
+        ("parabel_renderpool_besetzt_total", "counter", renderpool["besetzt"]),
+        ("parabel_abtastung_cache_hit_ratio", "gauge", abtastung["hit_rate"]),
+        ("parabel_abtastung_cache_hits_total", "counter", abtastung["hits"]),
+        ("parabel_abtastung_cache_misses_total", "counter", abtastung["misses"]),
+        ("parabel_abtastung_cache_eintraege", "gauge", abtastung["eintraege"]),
+    ]
+    for name, typ, wert in werte:
+        yield f"# TYPE {name} {typ}"
+        yield f"{name} {wert:g}"
+    for name, typ, feld in (("parabel_text_cache_hit_ratio", "gauge", "hit_rate"),
+                            ("parabel_text_cache_hits_total", "counter", "hits"),
+                            ("parabel_text_cache_misses_total", "counter", "misses"),
+                            ("parabel_text_cache_eintraege", "gauge", "eintraege")):
+        yield f"# TYPE {name} {typ}"
+        for cache in ("masse", "mathtext"):
+            yield f"{name}{_labels(('cache',), (cache,))} {textcache[cache][feld]:g}"
+    if _AUFWAERMEN:
+        yield "# TYPE parabel_aufwaermen_sekunden gauge"
+        for schritt, sekunden in _AUFWAERMEN.items():
+            yield f"parabel_aufwaermen_sekunden{_labels(('schritt',), (schritt,))} {sekunden:g}"
+
+
+def text():
+    """Alle Metriken im Prometheus-Textformat."""
+    with _lock:
+        zeilen = [zeile for metrik in METRIKEN for zeile in metrik.zeilen()]
+    zeilen.extend(_momentwerte())
+    return "\n".join(zeilen) + "\n"
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        daten = text().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(daten)))
+        self.end_headers()
+        self.wfile.write(daten)
+
+    def log_message(self, format, *args):
+        pass  # Jeder Scrape wäre sonst eine Zeile auf stderr
+
+
+def _datei_schreiben(datei):
+    while True:
+        try:
+            # Erst vollständig schreiben, dann umbenennen: Der Collector sieht nie eine halbe Datei
+            temp = datei.with_name(datei.name + ".tmp")
+            temp.write_text(text(), encoding="utf-8")
+            temp.replace(datei)
+        except Exception:
+            log.exception("Metrik-Datei %s konnte nicht geschrieben werden", datei)
+        time.sleep(DATEI_INTERVALL)
+
+
+_gestartet = False
+
+
+def _exporter_starten():
+    global _gestartet
+    with _lock:
+        if _gestartet:
+            return
+        _gestartet = True
+
+    port = os.environ.get("PARABEL_METRIKEN_PORT")
+    if port:
+        host = os.environ.get("PARABEL_METRIKEN_HOST", "127.0.0.1")
+        try:
+            server = http.server.ThreadingHTTPServer((host, int(port)), _Handler)
+        except OSError:
+            log.exception("Metrik-Endpunkt %s:%s konnte nicht gestartet werden", host, port)
+        else:
+            server.daemon_threads = True
+            threading.Thread(target=server.serve_forever, name="parabel-metriken", daemon=True).start()
+            log.info("Metriken unter http://%s:%s/metrics", host, port)
+
+    datei = os.environ.get("PARABEL_METRIKEN_DATEI")
+    if datei:
+        threading.Thread(target=_datei_schreiben, args=(Path(datei),), name="parabel-metriken-datei",
+                         daemon=True).start()
@@ -0,0 +1,186 @@
+"""Prüft, dass viele Sitzungen gleichzeitig rendern können, ohne dass sich Bilder vermischen.
+
+Aufruf im Wurzelverzeichnis des Repos::
+
+    python -m parabel.nebenlaeufigkeit [--sitzungen 8] [--auftraege 100] [--vorher]
+
+Streamlit führt jede Sitzung in einem eigenen Thread aus. Früher zeichneten
+alle Seiten über den globalen Zustand von ``matplotlib.pyplot``; parallele
+Sitzungen konnten dabei in die Figure der anderen zeichnen. Heute besitzt jeder
+Plot-Slot seine eigene ``Figure`` mit Agg-Canvas und wird unter seinem Lock
+bemalt.
+
+Das Skript rendert zufällige Slider-Stellungen aller Plot-Arten zuerst
+nacheinander (Referenz) und dann gemischt aus ``--sitzungen`` Threads, jeweils
+am Cache vorbei. Jedes parallel gerenderte Bild muss Byte für Byte seiner
+Referenz entsprechen. Ausgegeben wird der Durchsatz beider Läufe und der
+Speicher, den ein Renderprozess damit braucht (höchster RSS dieses Prozesses
+und die gemerkten Hintergründe der Slots, siehe ``parabel.plots``); der
+Exit-Code ist 1, wenn ein Bild abweicht oder pyplot importiert wurde.
+"""
+
+import argparse
+import functools
+import io
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from parabel.aufgaben import AUFGABEN
+from parabel.plots import HINTERGRUENDE, MAX_HINTERGRUND_BYTES, PLOTS, SCHAREN
+from parabel.render import SAVEFIG_OPTIONEN, _render
+from parabel.vorrendern import slider_werte
+
+ZOOM = (1, 2, 4)
+
+
+def _kurvenschar(z):
+    form = z.choice(list(SCHAREN))
+    regler = SCHAREN[form][1]
+    return dict(form=form, parameter=z.choice(list(regler)), zoom=z.choice(ZOOM),
+                **{name: z.choice(slider_werte(*bereich)) for name, bereich in regler.items()})
+
+
+# Plot-Art -> Funktion, die zufällige Parameter wie aus den Slidern liefert; jede Art in PLOTS
+ZUFALLSPARAMETER = {
+    "kraftstoff": lambda z: dict(ziel=z.choice(slider_werte(4.0, 9.0, 0.1))),
+    "aufgabe": lambda z: dict(AUFGABEN[z.choice(list(AUFGABEN))], ziel=z.choice(slider_werte(-2.0, 8.0, 0.1))),
+    "nutzer": lambda z: dict(a=z.randint(-5, 5), b=z.randint(-5, 5), c=z.randint(-5, 5), ziel=z.randint(-5, 5)),
+    "scheitelpunktform": lambda z: dict(a=z.choice(slider_werte(-3.0, 3.0, 0.1)),
+                                        d=z.choice(slider_werte(-5.0, 5.0, 0.5)),
+                                        e=z.choice(slider_werte(-5.0, 5.0, 0.5)), zoom=z.choice(ZOOM)),
+    "faktorisierte_form": lambda z: dict(a=z.choice(slider_werte(-3.0, 3.0, 0.1)),
+                                         x1=z.choice(slider_werte(-8.0, 8.0, 0.5)),
+                                         x2=z.choice(slider_werte(-8.0, 8.0, 0.5)), zoom=z.choice(ZOOM)),
+    "eine_nullstelle": lambda z: dict(a=z.choice(slider_werte(-3.0, 3.0, 0.1)),
+                                      x0=z.choice(slider_werte(-8.0, 8.0, 0.5)), zoom=z.choice(ZOOM)),
+    "scheitel_aus_nullstellen": lambda z: dict(a=z.choice(slider_werte(-3.0, 3.0, 0.1)),
+                                               x1=z.choice(slider_werte(-8.0, 8.0, 0.5)),
+                                               x2=z.choice(slider_werte(-8.0, 8.0, 0.5)), zoom=z.choice(ZOOM)),
+    "polynomform": lambda z: dict(a=z.choice(slider_werte(-3.0, 3.0, 0.1)),
+                                  b=z.choice(slider_werte(-10.0, 10.0, 0.5)),
+                                  c=z.choice(slider_werte(-10.0, 10.0, 0.5)), zoom=z.choice(ZOOM)),
+    "kurvenschar": _kurvenschar,
+    "nullstellen_uebersicht": lambda z: {},
+    "y_achsenabschnitt": lambda z: {},
+}
+
+
+def auftraege(anzahl, seed=0):
+    """``anzahl`` zufällige Aufträge, darunter mindestens einer je Plot-Art."""
+    zufall = random.Random(seed)
+    arten = list(ZUFALLSPARAMETER)
+    folge = arten + [zufall.choice(arten) for _ in range(anzahl - len(arten))]
+    return [(art, ZUFALLSPARAMETER[art](zufall)) for art in folge]
+
+
+def _rendere(auftrag):
+    art, params = auftrag
+    return _render(art, dict(params))
+
+
+@functools.cache
+def _mit_pyplot(klasse):
+    from matplotlib import pyplot as plt
+
+    return type(klasse.__name__, (klasse,), {"_figure": lambda self: plt.figure(figsize=self.figsize)})
+
+
+def _rendere_vorher(auftrag):
+    """Wie vor den Plot-Slots: neue Figure aus pyplot, ganz zeichnen, schließen."""
+    from matplotlib import pyplot as plt
+
+    art, params = auftrag
+    params = dict(params)
+    klasse = PLOTS[art]
+    statisch = {name: params.pop(name) for name in klasse.statisch}
+    plot = _mit_pyplot(klasse)(**statisch)
+    try:
+        plot.aktualisieren(**params)
+        puffer = io.BytesIO()
+        plot.fig.savefig(puffer, **SAVEFIG_OPTIONEN)
+        return puffer.getvalue()
+    finally:
+        plt.close(plot.fig)
+
+
+def pruefen(sitzungen=8, anzahl=100, vorher=False):
+    """Rendert ``anzahl`` Aufträge nacheinander und parallel; liefert (abweichend, Zeit seriell, Zeit parallel).
+
+    ``vorher``: auf dem alten Weg über pyplot statt mit den Plot-Slots.
+    """
+    rendere = _rendere_vorher if vorher else _rendere
+    liste = auftraege(anzahl)
+    # Jeden Slot einmal aufwärmen, damit der Aufbau der Figures nicht mitgemessen wird
+    # (auf dem alten Weg: Imports und Schriften)
+    for art in ZUFALLSPARAMETER:
+        rendere(next(auftrag for auftrag in liste if auftrag[0] == art))
+
+    start = time.perf_counter()
+    referenz = [rendere(auftrag) for auftrag in liste]
+    seriell = time.perf_counter() - start
+
+    # In anderer Reihenfolge parallel rendern, damit sich Slots abwechselnd in die Quere kommen
+    reihenfolge = list(range(anzahl))
+    random.Random(1).shuffle(reihenfolge)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sitzungen) as pool:
+        bilder = list(pool.map(rendere, (liste[i] for i in reihenfolge)))
+    parallel = time.perf_counter() - start
+
+    abweichend = [liste[i] for i, bild in zip(reihenfolge, bilder) if bild != referenz[i]]
+    return abweichend, seriell, parallel
+
+
+def speicher():
+    """Höchster RSS dieses Prozesses in MB (``None`` ohne ``resource``) und Zähler der Hintergründe."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        max_rss = None
+    else:
+        # ru_maxrss: Linux in KiB, macOS in Bytes
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024**2 if sys.platform == "darwin" else 1024)
+    return max_rss, HINTERGRUENDE.statistik()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sitzungen", type=int, default=8, help="Anzahl paralleler Threads")
+    parser.add_argument("--auftraege", type=int, default=100, help="Anzahl zu rendernder Bilder")
+    parser.add_argument("--vorher", action="store_true", help="zum Vergleich auch über pyplot rendern wie früher")
+    args = parser.parse_args()
+
+    abweichend, seriell, parallel = pruefen(args.sitzungen, args.auftraege)
+    print(f"seriell:  {args.auftraege / seriell:6.1f} Bilder/s")
+    print(f"parallel: {args.auftraege / parallel:6.1f} Bilder/s ({args.sitzungen} Sitzungen)")
+    max_rss, hintergruende = speicher()
+    if max_rss is not None:
+        print(f"RSS max.: {max_rss:6.0f} MB")
+    print(f"Hintergründe: {hintergruende['eintraege']} mit {hintergruende['bytes'] / 1024**2:.0f} MB "
+          f"(höchstens {MAX_HINTERGRUND_BYTES / 1024**2:.0f} MB), Trefferquote {hintergruende['hit_rate']:.0%}")
+
+    fehler = False
+    if abweichend:
+        print(f"{len(abweichend)} Bilder weichen von ihrer Referenz ab, z.B. {abweichend[0]}")
+        fehler = True
+    if "matplotlib.pyplot" in sys.modules:
+        print("matplotlib.pyplot wurde importiert")
+        fehler = True
+    if not fehler:
+        print("alle Bilder identisch, pyplot nicht geladen")
+
+    if args.vorher:
+        # Erst nach der Prüfung oben, die pyplot nicht geladen sehen will; zählt nicht zum Exit-Code
+        abweichend, seriell, parallel = pruefen(args.sitzungen, args.auftraege, vorher=True)
+        print("vorher (pyplot):")
+        print(f"seriell:  {args.auftraege / seriell:6.1f} Bilder/s")
+        print(f"parallel: {args.auftraege / parallel:6.1f} Bilder/s ({args.sitzungen} Sitzungen)")
+        if abweichend:
+            print(f"{len(abweichend)} Bilder weichen von ihrer Referenz ab, z.B. {abweichend[0]}")
+    sys.exit(1 if fehler else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,720 @@
+"""Alle Parabel-Plots der Apps als langlebige Plot-Slots.
+
+Jede Plot-Art ist eine Klasse, die in ``PLOTS`` unter ihrem Namen registriert
+ist. Ein Objekt dieser Klasse ist ein *Slot*: Es besitzt eine eigene Figure,
+deren Achsen, Gitter, Ticks, Titel und (noch leere) Linien genau einmal in
+``aufbauen`` angelegt werden. Bei jeder neuen Slider-Stellung ändert
+``aktualisieren`` nur noch die Daten und Beschriftungen dieser Linien.
+
+Parameter, die in ``statisch`` stehen (Titel, Bildausschnitt, ...), legen den
+Slot fest; alle anderen Parameter werden an ``aktualisieren`` übergeben.
+
+``bild`` zeichnet nicht jedes Mal die ganze Figure: Alles, was sich in
+``aktualisieren`` ändert, wird beim Anlegen als *dynamisch* markiert
+(``_linie``, ``_dynamisch``, dazu die Legende). Der Rest, also Gitter, Ticks,
+Achsen, Beschriftungen und Titel, wird je Bildausschnitt einmal gerastert und
+gemerkt. Danach werden nur noch die dynamischen Artists auf eine Kopie dieses
+Hintergrunds gezeichnet (Blitting). Nur SVG entsteht mit ``savefig`` aus der
+ganzen Figure. Die gemerkten Hintergründe aller Slots eines Prozesses teilen
+sich ``MAX_HINTERGRUND_BYTES`` (``HINTERGRUENDE``); verdrängt wird der am
+längsten nicht benutzte, egal von welchem Slot.
+
+Gemessene und gesetzte Texte teilen sich alle Slots (``parabel.textcache``).
+Parabeln werden passend zum Ausschnitt adaptiv abgetastet (``parabel.abtastung``),
+daher werden die Achsengrenzen immer vor der Kurve gesetzt.
+"""
+
+import io
+import itertools
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from matplotlib import rc_context
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.ticker import MultipleLocator, NullLocator
+from PIL import Image
+
+from parabel import textcache
+from parabel.abtastung import abtasten
+from parabel.loeser import loesen
+
+# Beschriftungen über alle Slots hinweg nur einmal messen und setzen
+textcache.installieren()
+
+# Rand um die Figure wie bei savefig(bbox_inches="tight")
+RAND_ZOLL = 0.1
+
+# Gemerkte Hintergründe aller Slots eines Prozesses zusammen; einer ist bei 200 dpi 6 bis 20 MB groß
+MAX_HINTERGRUND_BYTES = 128 * 1024**2
+
+# Verlustbehaftet, aber Linien und Schrift bleiben sauber; verlustfrei wäre größer als ein Paletten-PNG
+WEBP_QUALITAET = 90
+
+
+class HintergrundCache:
+    """LRU der gerasterten Hintergründe aller Slots, begrenzt auf ``max_bytes``."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._daten = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            eintrag = self._daten.get(key)
+            if eintrag is None:
+                self.misses += 1
+                return None
+            self._daten.move_to_end(key)
+            self.hits += 1
+            return eintrag[0]
+
+    def put(self, key, hintergrund):
+        groesse = memoryview(hintergrund[0]).nbytes
+        with self._lock:
+            if key in self._daten:
+                self._bytes -= self._daten.pop(key)[1]
+            self._daten[key] = (hintergrund, groesse)
+            self._bytes += groesse
+            while self._daten and self._bytes > self.max_bytes:
+                _, (_, alt) = self._daten.popitem(last=False)
+                self._bytes -= alt
+
+    def statistik(self):
+        with self._lock:
+            anfragen = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / anfragen if anfragen else 0.0,
+                "eintraege": len(self._daten),
+                "bytes": self._bytes,
+            }
+
+
+HINTERGRUENDE = HintergrundCache(MAX_HINTERGRUND_BYTES)
+
+# Nummer jedes Slots im Schlüssel von HINTERGRUENDE; anders als id() nie wiederverwendet
+_SLOTNUMMERN = itertools.count()
+
+
+class ParabelPlot:
+    figsize = (10, 6)
+    statisch = ()
+
+    def __init__(self, **statisch):
+        self.fig = self._figure()
+        self.ax = self.fig.add_subplot()
+        # Ein Slot wird von allen Sitzungen geteilt, also immer nur von einem Thread bemalt
+        self.lock = threading.Lock()
+        self._legenden_handles = None
+        self._dynamische = []
+        self._nummer = next(_SLOTNUMMERN)
+        self.aufbauen(**statisch)
+
+    def _figure(self):
+        """Eigene Figure mit Agg-Canvas, unabhängig von ``matplotlib.pyplot``."""
+        fig = Figure(figsize=self.figsize)
+        FigureCanvasAgg(fig)
+        return fig
+
+    def aufbauen(self, **statisch):
+        raise NotImplementedError
+
+    def aktualisieren(self, **params):
+        raise NotImplementedError
+
+    def _dynamisch(self, artist):
+        """``artist`` ändert sich in ``aktualisieren`` und gehört nicht zum Hintergrund."""
+        artist.set_animated(True)
+        self._dynamische.append(artist)
+        return artist
+
+    def _linie(self, *args, **kwargs):
+        linie, = self.ax.plot([], [], *args, **kwargs)
+        return self._dynamisch(linie)
+
+    def _parabel(self, linie, a, b, c):
+        """``linie`` zeigt a·x² + b·x + c, abgetastet für den aktuellen Ausschnitt."""
+        breite, hoehe = self.fig.get_size_inches() * 72
+        position = self.ax.get_position()
+        groesse_pt = (breite * position.width, hoehe * position.height)
+        linie.set_data(*abtasten((a, b, c), self.ax.get_xlim(), self.ax.get_ylim(), groesse_pt))
+        return linie
+
+    def bild(self, format="png", dpi=200, max_breite=None, palette=False):
+        """Bild wie ``savefig(format=format, dpi=dpi, bbox_inches="tight")``.
+
+        PNG und WebP sind höchstens ``max_breite`` Pixel breit; ``palette``
+        reduziert ein PNG auf 256 Farben. SVG zeichnet die ganze Figure mit
+        ``savefig``, ``dpi`` und ``max_breite`` spielen dort keine Rolle.
+        """
+        if format == "svg":
+            return self._svg()
+        bild = self._rastern(dpi)
+        if max_breite is not None and bild.width > max_breite:
+            # Wie Streamlit: bilinear auf die Anzeigebreite verkleinern
+            bild = bild.resize((max_breite, int(1.0 * bild.height * max_breite / bild.width)),
+                               resample=Image.BILINEAR)
+        puffer = io.BytesIO()
+        if format == "webp":
+            bild.save(puffer, format="WEBP", quality=WEBP_QUALITAET)
+        elif palette:
+            bild.quantize(256, method=Image.Quantize.FASTOCTREE).save(puffer, format="PNG")
+        else:
+            # st.image macht aus einem PNG ohne Alpha-Kanal bei jedem Aufruf ein JPEG
+            bild.convert("RGBA").save(puffer, format="PNG")
+        return puffer.getvalue()
+
+    def _rastern(self, dpi):
+        """Die Figure bei ``dpi`` als RGB-Bild, wie bei ``bbox_inches="tight"`` beschnitten."""
+        canvas = self.fig.canvas
+        if self.fig.dpi != dpi:
+            self.fig.set_dpi(dpi)
+        dynamisch = self._dynamische_mit_legende()
+
+        # Ticks, Achsen durch 0 usw. hängen vom Ausschnitt ab
+        key = (self._nummer, self.ax.get_xlim(), self.ax.get_ylim(), dpi)
+        hintergrund = HINTERGRUENDE.get(key)
+        if hintergrund is None:
+            canvas.draw()  # zeichnet alles außer den dynamischen Artists
+            rahmen = self.fig.get_tightbbox(canvas.get_renderer()).padded(RAND_ZOLL)
+            hintergrund = (canvas.copy_from_bbox(self.fig.bbox), rahmen)
+            HINTERGRUENDE.put(key, hintergrund)
+        else:
+            canvas.restore_region(hintergrund[0])
+
+        for artist in sorted(dynamisch, key=lambda artist: artist.get_zorder()):
+            self.ax.draw_artist(artist)
+
+        # Zeilen des Puffers laufen von oben nach unten
+        pixel = np.asarray(canvas.buffer_rgba())
+        hoehe, breite = pixel.shape[:2]
+        x0, y0, x1, y1 = np.round(np.array(hintergrund[1].extents) * dpi).astype(int)
+        x0, y0, x1, y1 = max(x0, 0), max(y0, 0), min(x1, breite), min(y1, hoehe)
+        return Image.fromarray(pixel[hoehe - y1:hoehe - y0, x0:x1]).convert("RGB")
+
+    def _svg(self):
+        self._dynamische_mit_legende()  # savefig zeichnet auch dynamische Artists
+        puffer = io.BytesIO()
+        # Feste IDs und kein Datum: Gleicher Plot, gleiche Bytes
+        with rc_context({"svg.hashsalt": "parabel"}):
+            self.fig.savefig(puffer, format="svg", bbox_inches="tight", pad_inches=RAND_ZOLL,
+                             metadata={"Date": None})
+        return puffer.getvalue()
+
+    def _dynamische_mit_legende(self):
+        legende = self.ax.get_legend()
+        dynamisch = self._dynamische + ([legende] if legende is not None else [])
+        for artist in dynamisch:
+            artist.set_animated(True)  # eine neu angelegte Legende ist es noch nicht
+        return dynamisch
+
+    def _legende(self, **optionen):
+        """Legende anlegen oder, wenn die Einträge gleich bleiben, nur die Texte tauschen."""
+        handles, labels = self.ax.get_legend_handles_labels()
+        legende = self.ax.get_legend()
+        if legende is not None and handles == self._legenden_handles:
+            for text, label in zip(legende.get_texts(), labels):
+                text.set_text(label)
+        else:
+            self.ax.legend(handles, labels, **optionen)
+            self._legenden_handles = handles
+
+
+def _ausblenden(artist):
+    """Artist leeren und aus der Legende nehmen."""
+    artist.set_data([], [])
+    artist.set_label('_ausgeblendet')
+
+
+# ==================================================
+# Quadratiche-Gleichungen: Grafisches Lösungsverfahren
+# ==================================================
+
+# K(v) = 0,002v² - 0,18v + 8,55 als Koeffizienten (a, b, c)
+KRAFTSTOFF = (0.002, -0.18, 8.55)
+
+
+class KraftstoffPlot(ParabelPlot):
+    figsize = (8, 5)
+
+    def aufbauen(self):
+        ax = self.ax
+
+        # Parabel (v > 40); die Punkte kommen erst, wenn der Ausschnitt feststeht
+        kurve = self._linie('b-', linewidth=2.5, label='K(v) = 0,002v² - 0,18v + 8,55')
+
+        # Horizontale Linie für Zielverbrauch
+        self.ziellinie = self._dynamisch(ax.axhline(y=0, color='red', linestyle='--', linewidth=2))
+
+        # Je Lösung ein Punkt mit vertikaler Hilfslinie
+        self.loesungen = []
+        for _ in range(2):
+            punkt = self._linie('go', markersize=12, markeredgewidth=2, markeredgecolor='darkgreen')
+            hilfslinie = self._linie('g--', alpha=0.5, linewidth=1)
+            self.loesungen.append((punkt, hilfslinie))
+
+        # Achsenbeschriftung
+        ax.set_xlabel('Geschwindigkeit v (km/h)', fontsize=13, fontweight='bold')
+        ax.set_ylabel('Kraftstoffverbrauch K (Liter/100 km)', fontsize=13, fontweight='bold')
+        ax.set_title('Kraftstoffverbrauch in Abhängigkeit von der Geschwindigkeit',
+                     fontsize=15, fontweight='bold', pad=20)
+
+        # Gitter
+        ax.grid(True, alpha=0.3, linestyle='-', linewidth=0.5)
+        ax.set_xlim(40, 120)
+        ax.set_ylim(3, 9)
+        self._parabel(kurve, *KRAFTSTOFF)
+
+    def aktualisieren(self, ziel):
+        self.ziellinie.set_ydata([ziel, ziel])
+        self.ziellinie.set_label(f'Zielverbrauch: {ziel} L/100km')
+
+        # Schnittpunkte berechnen
+        # 0.002v² - 0.18v + (8.55 - ziel) = 0
+        loesung = loesen(0.002, -0.18, 8.55 - ziel)
+
+        sichtbar = []
+        if loesung.anzahl > 0:
+            v1, v2 = float(loesung.x2), float(loesung.x1)
+
+            # Nur Lösungen für v > 40 anzeigen
+            if v1 > 40:
+                sichtbar.append((v1, f'Lösung: v = {v1:.1f} km/h'))
+            if v2 > 40 and abs(v1 - v2) > 0.1:  # Zweite Lösung nur wenn verschieden
+                sichtbar.append((v2, f'Lösung 2: v = {v2:.1f} km/h'))
+
+        for i, (punkt, hilfslinie) in enumerate(self.loesungen):
+            if i < len(sichtbar):
+                v_loesung, label = sichtbar[i]
+                punkt.set_data([v_loesung], [ziel])
+                punkt.set_label(label)
+                hilfslinie.set_data([v_loesung, v_loesung], [0, ziel])
+            else:
+                _ausblenden(punkt)
+                hilfslinie.set_data([], [])
+
+        self._legende(loc='upper right', fontsize=11, framealpha=0.9)
+
+
+class GleichungsPlot(ParabelPlot):
+    """Grafisches Lösen von a·x² + b·x + c = ziel mit roter Ziellinie und grünen Lösungen."""
+    figsize = (8, 5)
+
+    def _gleichung_aufbauen(self, titel):
+        ax = self.ax
+        self.kurve = self._linie('b-', linewidth=2.5)
+        self.ziellinie = self._dynamisch(ax.axhline(y=0, color='red', linestyle='--', linewidth=2))
+        self.punkte = self._linie('go', markersize=10, markeredgewidth=2, markeredgecolor='darkgreen')
+        self.hilfslinien = self._linie('g--', alpha=0.5, linewidth=1)
+        # Legende nur für Info
+        self.info = self._linie(' ')
+
+        ax.set_xlabel('x', fontsize=12, fontweight='bold')
+        ax.set_ylabel('y', fontsize=12, fontweight='bold')
+        ax.set_title(titel, fontsize=13, fontweight='bold')
+        ax.grid(True, alpha=0.3)
+        ax.spines['left'].set_position('zero')     # y-Achse durch x=0
+        ax.spines['bottom'].set_position('zero')   # x-Achse durch y=0
+        ax.spines['right'].set_color('none')       # Rechten Rand ausblenden
+        ax.spines['top'].set_color('none')         # Oberen Rand ausblenden
+
+    def _ziel_und_loesungen(self, a, b, c, ziel):
+        self.ziellinie.set_ydata([ziel, ziel])
+        self.ziellinie.set_label(f'y = {ziel}')
+
+        # Schnittpunkte berechnen: a·x² + b·x + (c - ziel) = 0
+        loesung = loesen(a, b, c - ziel)
+
+        if loesung.anzahl == 0:
+            self.punkte.set_data([], [])
+            self.hilfslinien.set_data([], [])
+            self.info.set_label('Keine Lösungen')
+        elif loesung.anzahl < 0:
+            # 0 = 0: die Ziellinie liegt auf der (waagerechten) Kurve
+            self.punkte.set_data([], [])
+            self.hilfslinien.set_data([], [])
+            self.info.set_label('Jedes x ist Lösung')
+        else:
+            x1, x2 = float(loesung.x1), float(loesung.x2)
+
+            if abs(x1 - x2) > 0.01:
+                self.punkte.set_data([x1, x2], [ziel, ziel])
+                # Beide Hilfslinien in einem Artist, getrennt durch NaN
+                self.hilfslinien.set_data([x1, x1, np.nan, x2, x2], [0, ziel, np.nan, 0, ziel])
+                self.info.set_label(f'x₁≈{x1:.2f}, x₂≈{x2:.2f}')
+            else:
+                self.punkte.set_data([x1], [ziel])
+                self.hilfslinien.set_data([x1, x1], [0, ziel])
+                self.info.set_label(f'x≈{x1:.2f}')
+
+        self._legende(loc='upper right', fontsize=10)
+
+
+class AufgabePlot(GleichungsPlot):
+    """Übungsaufgabe a·x² + b·x + c = ziel mit festem Bildausschnitt.
+
+    ``xticks``/``yticks`` sind (Start, Ende) für ``np.arange(Start, Ende, 1)``.
+    """
+    statisch = ('a', 'b', 'c', 'funktion', 'titel', 'xlim', 'ylim', 'xticks', 'yticks')
+
+    def aufbauen(self, a, b, c, funktion, titel, xlim, ylim, xticks, yticks):
+        self.a, self.b, self.c = a, b, c
+        self._gleichung_aufbauen(titel)
+
+        self.ax.set_xlim(*xlim)
+        self.ax.set_ylim(*ylim)
+        self._parabel(self.kurve, a, b, c)
+        self.kurve.set_label(f'f(x) = {funktion}')
+
+        self.ax.set_xticks(np.arange(*xticks, 1))
+        self.ax.set_yticks(np.arange(*yticks, 1))
+
+    def aktualisieren(self, ziel):
+        self._ziel_und_loesungen(self.a, self.b, self.c, ziel)
+
+
+class NutzerPlot(GleichungsPlot):
+    """Gleichung der Schüler*innen; der Bildausschnitt folgt dem Scheitelpunkt."""
+
+    def aufbauen(self):
+        self._gleichung_aufbauen('Grafische Lösung deiner Gleichung')
+
+    def aktualisieren(self, a, b, c, ziel):
+        # Bestimme x-Bereich automatisch (Scheitelpunkt ± Bereich). Für a = 0 gibt es
+        # keinen Scheitelpunkt, dann um die Lösung der linearen Gleichung (oder x = 0)
+        loesung = loesen(a, b, c - ziel)
+        x_mitte = float(loesung.scheitel_x)
+        if np.isnan(x_mitte):
+            x_mitte = float(loesung.x1) if loesung.anzahl > 0 else 0.0
+        x_min = x_mitte - 3
+        x_max = x_mitte + 3
+
+        # Setze Grenzen relativ zum Scheitel
+        y_mitte = a * x_mitte**2 + b * x_mitte + c
+        self.ax.set_xlim(x_min, x_max)
+        self.ax.set_ylim(min(y_mitte - 5, ziel - 2), max(y_mitte + 5, ziel + 2))
+
+        self._parabel(self.kurve, a, b, c)
+        self.kurve.set_label(f'f(x) = {a}x² {b:+}x {c:+}')
+
+        self._ziel_und_loesungen(a, b, c, ziel)
+
+
+# ==================================================
+# Darstellungsarten quadratischer Funktionen
+# ==================================================
+
+# Zoomstufe -> (Abstand der beschrifteten Ticks, Abstand des feinen Gitters)
+ZOOMSTUFEN = {1: (1, None), 2: (1, 0.25), 4: (0.5, 0.1)}
+
+
+class FormPlot(ParabelPlot):
+    """Koordinatensystem [-10, 10] mit Parabel, markierten Punkten und Eigenschaften-Box.
+
+    Mit ``zoom`` > 1 zeigt der Plot nur einen Ausschnitt um die markierten
+    Punkte, mit feinerem Gitter zum genauen Ablesen.
+    """
+
+    def _koordinatensystem(self, titel, ylim=(-10, 10)):
+        ax = self.ax
+        ax.axhline(y=0, color='k', linewidth=0.5)
+        ax.axvline(x=0, color='k', linewidth=0.5)
+        ax.grid(True, alpha=0.3)
+        self.grundansicht = ((-10, 10), ylim)
+        ax.set_xlabel('x', fontsize=12)
+        ax.set_ylabel('f(x)', fontsize=12)
+        ax.set_title(titel, fontsize=14, fontweight='bold')
+
+    def _kurve(self, stil):
+        return self._linie(stil, linewidth=2)
+
+    def _ansicht(self, zoom, punkte):
+        """Ausschnitt für ``zoom``, möglichst um den Schwerpunkt der markierten ``punkte``."""
+        haupt, fein = ZOOMSTUFEN[zoom]
+        for (minimum, maximum), mitte, setzen in zip(self.grundansicht, np.mean(punkte, axis=0),
+                                                     (self.ax.set_xlim, self.ax.set_ylim)):
+            halb = (maximum - minimum) / (2 * zoom)
+            mitte = min(max(mitte, minimum + halb), maximum - halb)
+            setzen(mitte - halb, mitte + halb)
+        for achse in (self.ax.xaxis, self.ax.yaxis):
+            achse.set_major_locator(MultipleLocator(haupt))
+            achse.set_minor_locator(MultipleLocator(fein) if fein else NullLocator())
+        if fein:
+            self.ax.grid(True, which='minor', alpha=0.1)
+        else:
+            self.ax.grid(False, which='minor')
+
+    def _eigenschaften_box(self, farbe):
+        self.box = self._dynamisch(self.ax.text(
+            0.02, 0.98, '', transform=self.ax.transAxes, verticalalignment='top',
+            bbox=dict(boxstyle='round', facecolor=farbe, alpha=0.5), fontsize=10))
+
+    def _eigenschaften(self, a):
+        oeffnung = "nach oben" if a > 0 else "nach unten"
+        if abs(a) > 1:
+            streckung = "gestreckt"
+        elif abs(a) < 1:
+            streckung = "gestaucht"
+        else:
+            streckung = "keine Streckung"
+
+        self.box.set_text(f'Öffnung: {oeffnung}\nStreckung: {streckung}')
+
+
+class ScheitelpunktformPlot(FormPlot):
+
+    def aufbauen(self):
+        self.kurve = self._kurve('b-')
+        self.scheitel = self._linie('ro', markersize=10)
+        self._koordinatensystem('Scheitelpunktform')
+        self._eigenschaften_box('wheat')
+
+    def aktualisieren(self, a, d, e, zoom=1):
+        self._ansicht(zoom, [(d, e)])
+        self._parabel(self.kurve, a, -2 * a * d, a * d**2 + e)  # a·(x-d)² + e
+        self.kurve.set_label(f'$f(x) = {a}(x-({d}))^2 + ({e})$')
+        self.scheitel.set_data([d], [e])
+        self.scheitel.set_label(f'Scheitelpunkt S({d}|{e})')
+        self._legende(fontsize=10)
+        self._eigenschaften(a)
+
+
+class FaktorisierteFormPlot(FormPlot):
+
+    def aufbauen(self):
+        self.kurve = self._kurve('g-')
+        self.nullstellen = self._linie('ro', markersize=10)
+        self._koordinatensystem('Faktorisierte Form - Nullstellenform')
+        self._eigenschaften_box('lightgreen')
+
+    def aktualisieren(self, a, x1, x2, zoom=1):
+        self._ansicht(zoom, [(x1, 0), (x2, 0)])
+        self._parabel(self.kurve, a, -a * (x1 + x2), a * x1 * x2)  # a·(x-x1)·(x-x2)
+        self.kurve.set_label(f'$f(x) = {a} · (x-({x1})) · (x-({x2}))$')
+        self.nullstellen.set_data([x1, x2], [0, 0])
+        self.nullstellen.set_label(f'Nullstellen: x₁={x1}, x₂={x2}')
+        self._legende(fontsize=10)
+        self._eigenschaften(a)
+
+
+class EineNullstellePlot(FormPlot):
+
+    def aufbauen(self):
+        self.kurve = self._kurve('g-')
+        self.nullstelle = self._linie('ro', markersize=10)
+        self._koordinatensystem('Faktorisierte Form - Nullstellenform', ylim=(-2, 10))
+
+    def aktualisieren(self, a, x0, zoom=1):
+        self._ansicht(zoom, [(x0, 0)])
+        self._parabel(self.kurve, a, -2 * a * x0, a * x0**2)  # a·(x-x0)·(x-x0)
+        self.kurve.set_label(f'$f(x) = {a} · (x-({x0})) · (x-({x0})) = {a} · (x-({x0}))^2$')
+        self.nullstelle.set_data([x0], [0])
+        self.nullstelle.set_label(f'Nullstelle: x₀={x0}')
+        self._legende(fontsize=10)
+
+
+class ScheitelAusNullstellenPlot(FormPlot):
+
+    def aufbauen(self):
+        self.kurve = self._kurve('g-')
+        self.nullstellen = self._linie('ro', markersize=10)
+        self.scheitel = self._linie('mo', markersize=10)
+        self._koordinatensystem('Faktorisierte Form (Nullstellenform)')
+
+    def aktualisieren(self, a, x1, x2, zoom=1):
+        koeffizienten = (a, -a * (x1 + x2), a * x1 * x2)  # a·(x-x1)·(x-x2)
+        if a:
+            # Auf 6 Stellen wie die Reglerwerte, damit z.B. -7.749999999999999 als -7.75 beschriftet wird
+            loesung = loesen(*koeffizienten)
+            d, e = (round(float(wert), 6) + 0.0 for wert in (loesung.scheitel_x, loesung.scheitel_y))
+        else:
+            # f = 0 hat keinen Scheitelpunkt; markiert bleibt die Mitte zwischen den Nullstellen
+            d, e = (x1 + x2) / 2, 0.0
+
+        self._ansicht(zoom, [(x1, 0), (x2, 0), (d, e)])
+        self._parabel(self.kurve, *koeffizienten)
+        self.kurve.set_label(f'$f(x) = {a}(x-({x1}))(x-({x2}))$')
+        self.nullstellen.set_data([x1, x2], [0, 0])
+        self.nullstellen.set_label(f'Nullstellen: $x_1={x1}$, $x_2={x2}$')
+        self.scheitel.set_data([d], [e])
+        self.scheitel.set_label(f'Scheitelpunkt S({d:.1f}|{e:.1f})')
+        self._legende(fontsize=10)
+
+
+class PolynomformPlot(FormPlot):
+
+    def aufbauen(self):
+        self.kurve = self._kurve('r-')
+        self.achsenabschnitt = self._linie('bo', markersize=10)
+        self._koordinatensystem('Polynomform (Normalform)')
+        self._eigenschaften_box('lightgreen')
+
+    def aktualisieren(self, a, b, c, zoom=1):
+        self._ansicht(zoom, [(0, c)])
+        self._parabel(self.kurve, a, b, c)
+        self.kurve.set_label(f'$f(x) = {a}x^2 + {b}x + {c}$')
+        self.achsenabschnitt.set_data([0], [c])
+        self.achsenabschnitt.set_label(f'y-Achsenabschnitt: c={c}')
+        self._legende(fontsize=10)
+        self._eigenschaften(a)
+
+
+# Form -> (Titel, Regler wie auf den Seiten: Name -> (Minimum, Maximum, Schrittweite),
+#          Koeffizienten (a, b, c) aus den Reglerwerten)
+SCHAREN = {
+    "scheitelpunktform": (
+        "Scheitelpunktform",
+        {"a": (-3.0, 3.0, 0.1), "d": (-5.0, 5.0, 0.5), "e": (-5.0, 5.0, 0.5)},
+        lambda a, d, e: (a, -2 * a * d, a * d**2 + e),
+    ),
+    "faktorisierte_form": (
+        "Faktorisierte Form",
+        {"a": (-3.0, 3.0, 0.1), "x1": (-8.0, 8.0, 0.5), "x2": (-8.0, 8.0, 0.5)},
+        lambda a, x1, x2: (a, -a * (x1 + x2), a * x1 * x2),
+    ),
+    "polynomform": (
+        "Polynomform",
+        {"a": (-3.0, 3.0, 0.1), "b": (-10.0, 10.0, 0.5), "c": (-10.0, 10.0, 0.5)},
+        lambda a, b, c: (a, b, c),
+    ),
+}
+
+# Gemeinsame x-Werte aller Kurven einer Schar im Ausschnitt (für die Berechnung als ein 2-D-Array)
+SCHAR_PUNKTE = 201
+
+
+class KurvenscharPlot(FormPlot):
+    """Alle Parabeln einer Form, die ein Regler (``parameter``) einstellen kann.
+
+    Die übrigen Regler bleiben auf ihren aktuellen Werten; die Parabel zum
+    aktuellen Wert von ``parameter`` ist hervorgehoben. Alle Kurven werden als
+    ein Array berechnet und als eine ``LineCollection`` gezeichnet.
+    """
+    statisch = ('form', 'parameter')
+
+    def aufbauen(self, form, parameter):
+        titel, regler, self.koeffizienten = SCHAREN[form]
+        self.parameter = parameter
+        minimum, maximum, schritt = regler[parameter]
+        self.werte = np.round(np.linspace(minimum, maximum, round((maximum - minimum) / schritt) + 1), 6)
+
+        self.schar = self._dynamisch(LineCollection([], cmap='coolwarm', linewidths=1, alpha=0.7))
+        self.schar.set_array(self.werte)
+        self.ax.add_collection(self.schar)
+        self.fig.colorbar(self.schar, ax=self.ax, label=parameter, pad=0.02)
+        self.kurve = self._linie('k-', linewidth=2.5)
+        self._koordinatensystem(f'{titel}: alle Werte von {parameter}')
+
+    def aktualisieren(self, zoom=1, **params):
+        a, b, c = self.koeffizienten(**params)
+        loesung = loesen(a, b, c)
+        scheitel = (float(loesung.scheitel_x), float(loesung.scheitel_y)) if a else (0, c)
+        self._ansicht(zoom, [scheitel])
+        self._parabel(self.kurve, a, b, c)
+
+        x = np.linspace(*self.ax.get_xlim(), SCHAR_PUNKTE)
+        # Spalte mit allen Werten von parameter, die übrigen Regler als Zahlen
+        a, b, c = self.koeffizienten(**{**params, self.parameter: self.werte[:, np.newaxis]})
+        y = (a * x + b) * x + c  # eine Zeile pro Kurve
+        self.schar.set_segments(np.stack(np.broadcast_arrays(x, y), axis=-1))
+        self.kurve.set_label(f'{self.parameter} = {params[self.parameter]}')
+        self._legende(fontsize=10)
+
+
+class StatischerPlot(ParabelPlot):
+    """Plot ohne Eingaben: Alles wird in ``aufbauen`` gezeichnet."""
+    figsize = (12, 8)
+
+    def aktualisieren(self):
+        pass
+
+
+class NullstellenUebersichtPlot(StatischerPlot):
+
+    def aufbauen(self):
+        ax = self.ax
+
+        # Drei Parabeln als (Linie, Koeffizienten a, b, c)
+        kurven = [
+            (self._linie('b-', linewidth=2.5, label='Zwei Nullstellen: $f(x) = (x+3)(x-2)$'), (1, 1, -6)),
+            (self._linie('g-', linewidth=2.5, label='Eine Nullstelle: $f(x) = (x-1)^2$'), (1, -2, 1)),
+            (self._linie('r-', linewidth=2.5, label='Keine Nullstellen: $f(x) = x^2 - 4x + 6$'), (1, -4, 6)),
+        ]
+
+        ax.plot([-3, 2], [0, 0], 'bo', markersize=10)
+        ax.plot(1, 0, 'go', markersize=10)
+
+        ax.axhline(y=0, color='k', linewidth=0.8)
+        ax.axvline(x=0, color='k', linewidth=0.8)
+        ax.grid(True, alpha=0.3)
+        ax.set_xlim(-5, 5)
+        ax.set_ylim(-7, 10)
+        for kurve, koeffizienten in kurven:
+            self._parabel(kurve, *koeffizienten)
+        ax.set_xticks(range(-5, 6, 1))
+        ax.set_yticks(range(-7, 11, 1))
+        ax.set_xlabel('x', fontsize=12)
+        ax.set_ylabel('f(x)', fontsize=12)
+        ax.legend(fontsize=11, loc='upper left')
+        ax.set_title('Nullstellen quadratischer Funktionen', fontsize=14, fontweight='bold')
+
+
+class YAchsenabschnittPlot(StatischerPlot):
+
+    def aufbauen(self):
+        ax = self.ax
+
+        c1 = 7
+        c2 = 1
+        c3 = 4
+
+        # (Linie, Koeffizienten a, b, c) der ausmultiplizierten Funktionen
+        kurven = [
+            (self._linie('b-', linewidth=2.5, label=f'Linker Ast: $f(x) = (x-3)^2 - 2$ (c = {c1})'),
+             (1, -6, c1)),
+            (self._linie('g-', linewidth=2.5, label=f'Rechter Ast: $f(x) = -(x+2)^2 + 5$ (c = {c2})'),
+             (-1, -4, c2)),
+            (self._linie('r-', linewidth=2.5, label=f'Scheitelpunkt: $f(x) = -0.5x^2 + 4$ (c = {c3})'),
+             (-0.5, 0, c3)),
+        ]
+
+        ax.plot(0, c1, 'bo', markersize=12, zorder=5)
+        ax.plot(0, c2, 'go', markersize=12, zorder=5)
+        ax.plot(0, c3, 'ro', markersize=12, zorder=5)
+
+        ax.axhline(y=0, color='k', linewidth=0.8)
+        ax.axvline(x=0, color='k', linewidth=1.2)
+        ax.grid(True, alpha=0.3)
+        ax.set_xlim(-6, 6)
+        ax.set_ylim(-4, 8)
+        for kurve, koeffizienten in kurven:
+            self._parabel(kurve, *koeffizienten)
+        ax.set_xticks(range(-6, 7, 1))
+        ax.set_yticks(range(-4, 9, 1))
+        ax.set_xlabel('x', fontsize=12)
+        ax.set_ylabel('f(x)', fontsize=12)
+        ax.legend(fontsize=11, loc='upper right')
+        ax.set_title('y-Achsenabschnitt bei quadratischen Funktionen', fontsize=14, fontweight='bold')
+
+
+PLOTS = {
+    "kraftstoff": KraftstoffPlot,
+    "aufgabe": AufgabePlot,
+    "nutzer": NutzerPlot,
+    "scheitelpunktform": ScheitelpunktformPlot,
+    "faktorisierte_form": FaktorisierteFormPlot,
+    "eine_nullstelle": EineNullstellePlot,
+    "scheitel_aus_nullstellen": ScheitelAusNullstellenPlot,
+    "polynomform": PolynomformPlot,
+    "kurvenschar": KurvenscharPlot,
+    "nullstellen_uebersicht": NullstellenUebersichtPlot,
+    "y_achsenabschnitt": YAchsenabschnittPlot,
+}
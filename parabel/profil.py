@@ -0,0 +1,81 @@
+"""cProfile für einzelne Reruns, eingeschaltet über die URL.
+
+Meldet eine Lehrkraft „die Seite ist langsam“, lädt man dieselbe Seite mit
+``?profile=1&token=<PARABEL_ADMIN_TOKEN>``. Jeder Rerun, solange die Parameter
+in der URL stehen, läuft dann unter cProfile. Die Seite zeigt die teuersten
+Funktionen als Tabelle und bietet das Profil als ``.prof``-Datei zum Download
+an, z.B. für ``python -m pstats rerun.prof`` oder snakeviz.
+
+Ohne gesetzte Umgebungsvariable ``PARABEL_ADMIN_TOKEN`` ist Profiling
+abgeschaltet. Ohne die Parameter kostet ``starten`` nur einen Blick in die
+Query-Parameter.
+
+Profiliert wird nur der Thread des Skripts. Bilder, die der Renderpool
+rendert, und Antworten, die der Auswertungspool prüft, entstehen in eigenen
+Prozessen und erscheinen als Wartezeit in ``Renderpool.ausfuehren`` bzw.
+``Auswertungspool.auswerten``. Wie dort die Zeit verteilt ist, zeigt
+``parabel.messung``.
+"""
+
+import cProfile
+import hmac
+import marshal
+import os
+import pstats
+import threading
+
+TOKEN_VARIABLE = "PARABEL_ADMIN_TOKEN"
+
+_lokal = threading.local()
+
+
+def erlaubt(query_params):
+    """Wahr bei ``?profile=1`` und richtigem ``token``."""
+    if query_params.get("profile") != "1":
+        return False
+    token = os.environ.get(TOKEN_VARIABLE)
+    if not token:
+        return False
+    return hmac.compare_digest(query_params.get("token", "").encode(), token.encode())
+
+
+def starten(query_params):
+    """Startet den Profiler für diesen Rerun, falls die Query-Parameter es erlauben."""
+    alt = getattr(_lokal, "profil", None)
+    if alt is not None:
+        alt.disable()  # Rest eines abgebrochenen Reruns
+        _lokal.profil = None
+    if not erlaubt(query_params):
+        return False
+    _lokal.profil = cProfile.Profile()
+    _lokal.profil.enable()
+    return True
+
+
+def beenden():
+    """Stoppt den Profiler; liefert ``pstats.Stats`` oder ``None``, wenn nicht profiliert wurde."""
+    profil = getattr(_lokal, "profil", None)
+    if profil is None:
+        return None
+    profil.disable()
+    _lokal.profil = None
+    return pstats.Stats(profil)
+
+
+def tabelle(stats, sortierung="cumulative", anzahl=40):
+    """Die ``anzahl`` teuersten Funktionen, für ``st.dataframe``."""
+    zeilen = []
+    for (datei, zeile, funktion), (_, aufrufe, eigen, kumuliert, _) in stats.stats.items():
+        zeilen.append({
+            "Funktion": f"{funktion} ({os.path.basename(datei)}:{zeile})",
+            "Aufrufe": aufrufe,
+            "eigen_ms": round(eigen * 1000, 1),
+            "kumuliert_ms": round(kumuliert * 1000, 1),
+        })
+    schluessel = {"cumulative": "kumuliert_ms", "tottime": "eigen_ms", "calls": "Aufrufe"}[sortierung]
+    return sorted(zeilen, key=lambda z: z[schluessel], reverse=True)[:anzahl]
+
+
+def als_datei(stats):
+    """Inhalt einer ``.prof``-Datei, wie sie ``pstats.Stats.dump_stats`` schreibt."""
+    return marshal.dumps(stats.stats)
@@ -0,0 +1,289 @@
+"""Rendert registrierte Plots zu Bildern, mit prozessweitem Cache.
+
+Bei einem Cache-Miss wird zuerst im vorgerenderten Asset-Verzeichnis
+nachgesehen (siehe ``parabel.vorrendern``). Erst wenn es dort kein Bild gibt,
+wird live gerendert, und zwar im ``RENDERPOOL`` (siehe ``parabel.renderpool``)
+statt im Streamlit-Thread. Dabei wird keine neue Figure gebaut: Jede
+Kombination aus Plot-Art und statischen Parametern hat (pro Prozess) genau
+einen langlebigen Slot, dessen Linien nur aktualisiert und dann auf den
+gemerkten Hintergrund des Slots gezeichnet werden (siehe ``ParabelPlot.bild``).
+
+Format, Breite und Farbpalette der Bilder legt ein ``Bildformat`` fest (siehe
+``parabel.bildformat``), das Teil des Cache-Schlüssels ist. Vorgerendert wird
+nur im ``STANDARD``-Format des Deployments.
+
+Ist ``PARABEL_BILDER_URL`` gesetzt, rendern die Seiten gar nicht selbst: Sie
+bekommen die Adresse des Bildes beim Bild-Endpunkt (``parabel.bildserver``),
+und der Browser holt es dort. ``bild_bytes`` liefert dem Endpunkt die Bytes.
+
+Ist der Renderpool ausgelastet (``Besetzt``), zeigen die Seiten statt des
+Plots ein kleines Platzhalterbild (``besetzt_bild``), das nicht in den Cache
+kommt; beim nächsten Rerun wird es wieder versucht.
+
+Jedes ausgelieferte Bild wird mit Quelle, Größe und Zeiten an
+``parabel.messung`` gemeldet. Mit jedem Bild schickt der Renderprozess auch
+die Zähler seines Text-Caches (``parabel.textcache``) und seiner Abtastung
+(``parabel.abtastung``) mit; ``textcache_statistik`` und ``abtastung_statistik``
+fassen sie über alle Prozesse zusammen.
+
+matplotlib und numpy (über ``parabel.plots``) werden erst beim ersten Slot
+importiert, also in den Prozessen des Renderpools. Der Streamlit-Prozess lädt
+sie gar nicht, solange er nicht selbst rendern muss.
+"""
+
+import functools
+import io
+import json
+import math
+import os
+import threading
+import time
+from pathlib import Path
+
+from parabel import messung
+from parabel.bildformat import MAX_BREITE, STANDARD, fuer_st_image
+from parabel.cache import RenderCache, schluessel
+from parabel.renderpool import Besetzt, Renderpool
+
+# Gleiche Einstellungen wie st.pyplot, damit die Bilder unverändert aussehen.
+# ParabelPlot.bild bildet savefig mit diesen Optionen nach, zeichnet aber nur neu, was sich ändert.
+SAVEFIG_OPTIONEN = {"format": "png", "dpi": 200, "bbox_inches": "tight"}
+
+# Bilder im Asset-Verzeichnis passen nur, wenn sie mit diesen Einstellungen erzeugt wurden
+EINSTELLUNGEN = {"savefig": SAVEFIG_OPTIONEN, "zeichnen": "hintergrund", "bild": STANDARD._asdict()}
+
+VORGERENDERT = Path(__file__).parent / "vorgerendert"
+
+# Größter erlaubter Betrag eines Zahlenparameters, auf den Seiten (Zahlenfelder) wie beim Bild-Endpunkt
+GRENZE = 1000
+
+CACHE = RenderCache()
+
+RENDERPOOL = Renderpool(vorladen=("parabel.render", "parabel.plots"))
+
+_STATISCH = {}
+
+# Prozess-ID -> letzte Zähler von Text-Cache und Abtastung in diesem Renderprozess
+_ZAEHLER = {}
+
+_SLOTS = {}
+_SLOTS_LOCK = threading.Lock()
+
+# Bild-Endpunkt (parabel.bildserver): öffentliche Adresse, unter der die Seiten Bilder einbinden,
+# bzw. Port, auf dem dieser Prozess ihn selbst betreibt
+BILDER_URL = os.environ.get("PARABEL_BILDER_URL", "").rstrip("/")
+BILDER_PORT = os.environ.get("PARABEL_BILDER_PORT")
+_endpunkt_gestartet = False
+
+
+def render_bild(art, bild=STANDARD, **params):
+    """Der Plot ``art`` mit den gegebenen Parametern, fertig für ``st.image``.
+
+    Ein PNG kommt als Bytes, WebP und SVG als ``data:``-URL (siehe
+    ``parabel.bildformat.fuer_st_image``). Mit ``PARABEL_BILDER_URL`` kommt
+    nur die Adresse des Bildes beim Bild-Endpunkt (``parabel.bildserver``).
+    """
+    start = time.perf_counter()
+    _endpunkt_starten()
+    if BILDER_URL:
+        return _als_url(art, bild, params, start)
+    try:
+        daten, zeiten = _bytes(_schluessel(art, params, bild))
+    except Besetzt:
+        return _besetzt(art, start)
+    daten = fuer_st_image(daten, bild.format)
+    messung.bild(art, daten, time.perf_counter() - start, format=bild.format, **zeiten)
+    return daten
+
+
+def bild_bytes(art, bild=STANDARD, **params):
+    """Die Bytes des Plots wie bei ``render_bild``, ohne Umwandlung für ``st.image``; wirft ``Besetzt``."""
+    return _bytes(_schluessel(art, params, bild))[0]
+
+
+def _schluessel(art, params, bild):
+    """Schlüssel für ``CACHE`` und ``RENDERPOOL``: Plot-Art, Parameter, Bildformat und Typen der Parameter.
+
+    Die Typen gehören dazu, weil ``schluessel`` z.B. 1 und 1.0 nicht unterscheidet,
+    die Beschriftungen der Plots aber schon (``1x²`` bzw. ``1.0x²``).
+    """
+    art, werte = schluessel(art, params)
+    return art, werte, bild, tuple(type(wert).__name__ for _, wert in werte)
+
+
+def _bytes(key):
+    """Bild-Bytes aus ``CACHE``, vorgerendert oder aus dem Renderpool, dazu Quelle und Zeiten."""
+    zeiten = {"quelle": "cache"}
+
+    def rendern():
+        daten = _vorgerendert(key)
+        if daten is not None:
+            zeiten["quelle"] = "vorgerendert"
+            return daten
+        daten, zeiten["rechnen"], zeiten["zeichnen"] = _im_pool(key)
+        zeiten["quelle"] = "gerendert"
+        return daten
+
+    # Mit den normalisierten Werten rendern, damit Bild und Schlüssel übereinstimmen
+    return CACHE.get_or_render(key, rendern), zeiten
+
+
+def statisches_bild(art, bild=STANDARD):
+    """Ein Plot ohne Eingaben; wird pro Prozess und Bildformat genau einmal gerendert."""
+    start = time.perf_counter()
+    _endpunkt_starten()
+    if BILDER_URL:
+        return _als_url(art, bild, {}, start)
+    daten = _STATISCH.get((art, bild))
+    if daten is not None:
+        messung.bild(art, daten, time.perf_counter() - start, "cache", format=bild.format)
+        return daten
+    # Gleichzeitige erste Aufrufe legt der Renderpool zu einem Auftrag zusammen
+    try:
+        daten, rechnen, zeichnen = _im_pool(_schluessel(art, {}, bild))
+    except Besetzt:
+        return _besetzt(art, start)
+    daten = _STATISCH[(art, bild)] = fuer_st_image(daten, bild.format)
+    messung.bild(art, daten, time.perf_counter() - start, "gerendert", rechnen, zeichnen, format=bild.format)
+    return daten
+
+
+@functools.cache
+def besetzt_bild():
+    """PNG, das statt eines Plots erscheint, solange der Renderpool ausgelastet ist."""
+    from PIL import Image, ImageDraw, ImageFont
+
+    bild = Image.new("RGBA", (730, 438), (240, 242, 246, 255))
+    zeichnen = ImageDraw.Draw(bild)
+    zeichnen.text((365, 219), "Gerade werden sehr viele Bilder gezeichnet.\nGleich noch einmal versuchen.",
+                  fill=(49, 51, 63, 255), font=ImageFont.load_default(24), anchor="mm", align="center")
+    puffer = io.BytesIO()
+    bild.save(puffer, format="PNG")
+    return puffer.getvalue()
+
+
+def _besetzt(art, start):
+    daten = besetzt_bild()
+    messung.bild(art, daten, time.perf_counter() - start, "besetzt")
+    return daten
+
+
+def _als_url(art, bild, params, start):
+    from parabel.bildserver import url
+
+    adresse = url(BILDER_URL, art, bild, params)
+    messung.bild(art, adresse, time.perf_counter() - start, "url", format=bild.format)
+    return adresse
+
+
+def _endpunkt_starten():
+    global _endpunkt_gestartet
+    if _endpunkt_gestartet or not BILDER_PORT:
+        return
+    _endpunkt_gestartet = True
+    from parabel import bildserver
+
+    bildserver.starten(int(BILDER_PORT), os.environ.get("PARABEL_BILDER_HOST", "127.0.0.1"))
+
+
+def _im_pool(key):
+    """Bild-Bytes aus dem Renderpool samt Rechen- und Zeichenzeit im Arbeitsprozess."""
+    art, params, bild, _ = key
+    daten, rechnen, zeichnen, zaehler = RENDERPOOL.ausfuehren(key, _render_gemessen, art, dict(params), bild)
+    _ZAEHLER[zaehler["prozess"]] = zaehler
+    return daten, rechnen, zeichnen
+
+
+def textcache_statistik():
+    """Zähler der Text-Caches, summiert über alle Prozesse, die bisher gerendert haben."""
+    return _summe(("masse", "mathtext"))
+
+
+def abtastung_statistik():
+    """Zähler des Abtastungs-Caches, summiert über alle Prozesse, die bisher gerendert haben."""
+    summe = _summe(("abtastung",))
+    return {**summe.pop("abtastung"), **summe}
+
+
+def _summe(namen):
+    summe = {}
+    for name in namen:
+        werte = [stand[name] for stand in list(_ZAEHLER.values())]
+        hits = sum(wert["hits"] for wert in werte)
+        misses = sum(wert["misses"] for wert in werte)
+        summe[name] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "eintraege": sum(wert["eintraege"] for wert in werte),
+        }
+    summe["prozesse"] = len(_ZAEHLER)
+    return summe
+
+
+def manifest_name(key):
+    """Eindeutiger Text zu einem Cache-Schlüssel, wie er in ``manifest.json`` steht."""
+    return json.dumps(key, ensure_ascii=False)
+
+
+@functools.cache
+def _manifest():
+    try:
+        manifest = json.loads((VORGERENDERT / "manifest.json").read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    # Mit anderen Render-Einstellungen erzeugte Bilder nicht verwenden
+    if manifest.get("einstellungen") != EINSTELLUNGEN:
+        return {}
+    return manifest["bilder"]
+
+
+def _vorgerendert(key):
+    # manifest_name unterscheidet 1 und 1.0 schon selbst (JSON)
+    art, params, bild, _ = key
+    if bild != STANDARD:
+        return None
+    datei = _manifest().get(manifest_name((art, params)))
+    if datei is None:
+        return None
+    return (VORGERENDERT / datei).read_bytes()
+
+
+def slot(art, statisch):
+    """Der langlebige Plot-Slot für ``art`` mit diesen statischen Parametern."""
+    from parabel.plots import PLOTS
+
+    key = schluessel(art, statisch)
+    with _SLOTS_LOCK:
+        if key not in _SLOTS:
+            _SLOTS[key] = PLOTS[art](**statisch)
+        return _SLOTS[key]
+
+
+def _render(art, params, bild=STANDARD):
+    return _render_gemessen(art, params, bild)[0]
+
+
+def _dpi(breite):
+    """Auflösung für ein Bild, das höchstens ``breite`` Pixel breit ausgeliefert wird.
+
+    In voller Breite wird mit 200 dpi gezeichnet und danach verkleinert, wie es
+    st.image sonst bei jedem Aufruf täte. Für schmalere Bilder sinkt die
+    Auflösung im selben Verhältnis.
+    """
+    return math.ceil(SAVEFIG_OPTIONEN["dpi"] * min(breite, MAX_BREITE) / MAX_BREITE)
+
+
+def _render_gemessen(art, params, bild=STANDARD):
+    from parabel import abtastung, textcache
+    from parabel.plots import PLOTS
+
+    statisch = {name: params.pop(name) for name in PLOTS[art].statisch}
+    plot = slot(art, statisch)
+    with plot.lock:
+        start = time.perf_counter()
+        plot.aktualisieren(**params)
+        gezeichnet = time.perf_counter()
+        daten = plot.bild(bild.format, _dpi(bild.breite), bild.breite, bild.palette)
+    zaehler = {**textcache.statistik(), "abtastung": abtastung.statistik()}
+    return daten, gezeichnet - start, time.perf_counter() - gezeichnet, zaehler
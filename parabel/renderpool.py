@@ -0,0 +1,191 @@
+"""Prozess-Pool, der matplotlib-Arbeit aus den Streamlit-Threads herausholt.
+
+Agg hält beim Zeichnen den GIL: Rendert eine Sitzung ein Bild, stehen alle
+anderen Sitzungen desselben Streamlit-Prozesses still. Deshalb schickt
+``parabel.render`` jeden Cache-Miss als einfache Beschreibung (Plot-Art und
+Parameter) an diesen Pool und bekommt PNG-Bytes zurück; die Streamlit-Threads
+warten nur noch, ohne den GIL zu halten, und ein Server nutzt alle Kerne.
+
+Gegendruck: Es sind höchstens ``max_auftraege`` Bilder gleichzeitig in Arbeit,
+weitere Aufrufer warten, bis ein Platz frei wird. Wird dasselbe Bild schon
+gerendert (z.B. mehrere Klassen am selben Slider), wartet der Aufrufer auf
+diesen Auftrag, statt ein zweites Mal zu rendern.
+
+Kein Warten ist unbegrenzt: Wer länger als ``timeout`` Sekunden auf einen
+Platz, ein Ergebnis, einen zusammengelegten Auftrag oder den Start des Pools
+wartet, bekommt ``Besetzt`` statt eines Bildes. Im eigenen Thread wird nur
+gerendert, wenn die Prozesse gar nicht starten (oder mit ``prozesse=0``);
+sonst käme die Last genau dann zurück in den Streamlit-Prozess, wenn der Pool
+ausgelastet ist. Hängt ein Renderprozess, wird der Pool ersetzt wie im
+``Auswertungspool``; der neue startet im Hintergrund (``Poolstart``), ohne
+Aufrufer und ``statistik`` zu blockieren.
+
+Für jeden Auftrag werden Wartezeit und Renderzeit festgehalten (``statistik``).
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import BrokenExecutor, Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from parabel.auswertung import Poolstart, prozesspool_starten, vorbereiten
+
+log = logging.getLogger(__name__)
+
+
+class Besetzt(Exception):
+    """Innerhalb von ``timeout`` Sekunden war kein Bild zu bekommen; später noch einmal versuchen."""
+
+
+def _mit_zeit(funktion, *args):
+    start = time.perf_counter()
+    ergebnis = funktion(*args)
+    return ergebnis, time.perf_counter() - start
+
+
+class Renderpool:
+    def __init__(self, prozesse=None, max_auftraege=None, vorladen=(), aufwaermen=None, timeout=10.0):
+        # prozesse=0: im aufrufenden Thread rendern (z.B. zum Debuggen)
+        self.prozesse = (os.cpu_count() or 1) if prozesse is None else prozesse
+        self.max_auftraege = max_auftraege or 4 * max(self.prozesse, 1)
+        self.vorladen = tuple(vorladen)
+        # "modul:funktion", wird in jedem Renderprozess nach dem Vorladen aufgerufen
+        self.aufwaermen = aufwaermen
+        self.timeout = timeout
+        self._plaetze = threading.BoundedSemaphore(self.max_auftraege)
+        self._laufend = {}
+        self._poolstart = Poolstart("parabel-renderpool", self._pool_starten)
+        self._lock = threading.Lock()
+        self._zaehler = dict.fromkeys(("auftraege", "zusammengelegt", "neustarts", "timeouts", "besetzt", "lokal"), 0)
+        self._offen = 0
+        self._max_offen = 0
+        self._zeiten = deque(maxlen=200)
+
+    def ausfuehren(self, key, funktion, *args):
+        """Ergebnis von ``funktion(*args)`` aus dem Pool; gleiche ``key``s werden zusammengelegt.
+
+        ``funktion`` muss auf Modulebene definiert sein (wird per Name an den Prozess übergeben).
+        Wirft ``Besetzt``.
+        """
+        ergebnis = Future()
+        with self._lock:
+            laufend = self._laufend.get(key)
+            if laufend is not None:
+                self._zaehler["zusammengelegt"] += 1
+            else:
+                self._laufend[key] = ergebnis
+                self._zaehler["auftraege"] += 1
+                self._offen += 1
+                self._max_offen = max(self._max_offen, self._offen)
+        if laufend is not None:
+            try:
+                return laufend.result(timeout=self.timeout)
+            except FutureTimeoutError:
+                raise self._besetzt("%s: zusammengelegter Auftrag nach %.1f s nicht fertig",
+                                    key, self.timeout) from None
+
+        start = time.perf_counter()
+        try:
+            if self._plaetze.acquire(timeout=self.timeout):
+                try:
+                    daten, renderzeit = self._im_pool(funktion, args)
+                finally:
+                    self._plaetze.release()
+            else:
+                raise self._besetzt("%s: nach %.1f s kein Platz im Renderpool", key, self.timeout)
+            ergebnis.set_result(daten)
+        except BaseException as fehler:
+            ergebnis.set_exception(fehler)
+            raise
+        finally:
+            with self._lock:
+                del self._laufend[key]
+                self._offen -= 1
+        gesamt = time.perf_counter() - start
+        self._zeiten.append({"key": key, "warten_ms": (gesamt - renderzeit) * 1000,
+                             "rendern_ms": renderzeit * 1000})
+        log.debug("%s: %.0f ms gewartet, %.0f ms gerendert", key, (gesamt - renderzeit) * 1000,
+                  renderzeit * 1000)
+        return daten
+
+    def _im_pool(self, funktion, args, versuche=2):
+        try:
+            pool = self._laufender_pool(self.timeout)
+        except FutureTimeoutError:
+            raise self._besetzt("Renderpool nach %.1f s noch nicht gestartet", self.timeout) from None
+        if pool is None:
+            return self._lokal(funktion, args)
+        try:
+            return pool.submit(_mit_zeit, funktion, *args).result(timeout=self.timeout)
+        except FutureTimeoutError:
+            # Ein hängender Prozess blockiert sonst jeden, der auf dasselbe Bild wartet
+            with self._lock:
+                self._zaehler["timeouts"] += 1
+            self._ersetzen(pool)
+            raise self._besetzt("Renderauftrag nach %.1f s abgebrochen, Pool ersetzt", self.timeout) from None
+        except BrokenExecutor:
+            # Ein Prozess ist abgestürzt: Pool ersetzen und einmal neu versuchen
+            self._ersetzen(pool)
+            if versuche > 1:
+                return self._im_pool(funktion, args, versuche - 1)
+            raise self._besetzt("Renderpool auch nach Neustart defekt") from None
+
+    def _besetzt(self, meldung, *args):
+        log.warning(meldung, *args)
+        with self._lock:
+            self._zaehler["besetzt"] += 1
+        return Besetzt()
+
+    def _lokal(self, funktion, args):
+        with self._lock:
+            self._zaehler["lokal"] += 1
+        return _mit_zeit(funktion, *args)
+
+    def _laufender_pool(self, timeout=None):
+        """Der laufende Pool, ``None`` beim Rendern im eigenen Thread.
+
+        Wirft ``TimeoutError`` (``concurrent.futures``), wenn er nach ``timeout``
+        Sekunden noch startet.
+        """
+        if not self.prozesse:
+            return None
+        pool = self._poolstart.pool(timeout)
+        if pool is None:
+            # Ohne lauffähige Prozesse weiter im eigenen Thread rendern
+            self.prozesse = 0
+        return pool
+
+    def _pool_starten(self):
+        return prozesspool_starten(self.prozesse, vorbereiten, (self.vorladen, self.aufwaermen))
+
+    def starten(self):
+        """Startet die Renderprozesse jetzt statt beim ersten Auftrag; wahr, wenn sie laufen."""
+        return self._laufender_pool() is not None
+
+    def _ersetzen(self, pool):
+        if self._poolstart.ersetzen(pool):
+            with self._lock:
+                self._zaehler["neustarts"] += 1
+
+    def statistik(self):
+        with self._lock:
+            zeiten = list(self._zeiten)
+            statistik = {
+                **self._zaehler,
+                "prozesse": self.prozesse,
+                "in_arbeit": self._offen,
+                "max_in_arbeit": self._max_offen,
+            }
+        for art in ("warten_ms", "rendern_ms"):
+            werte = [zeit[art] for zeit in zeiten]
+            statistik[f"{art}_mittel"] = sum(werte) / len(werte) if werte else 0.0
+            statistik[f"{art}_max"] = max(werte, default=0.0)
+        return statistik
+
+    def letzte_auftraege(self):
+        """Wartezeit und Renderzeit der letzten (bis zu 200) Aufträge, neueste zuletzt."""
+        with self._lock:
+            return list(self._zeiten)
@@ -0,0 +1,52 @@
+"""Was jede Seite am Anfang und am Ende eines Reruns tut: Profil und Messwerte.
+
+Einzige Stelle im Paket mit Streamlit-Code; die Seiten rufen::
+
+    seite.einrichten("Name der Seite")   # direkt nach st.set_page_config
+    ...
+    seite.abschliessen()                 # letzte Zeile der Seite
+
+``einrichten`` startet cProfile, falls per URL angefordert (``parabel.profil``),
+und die Zeitmessung des Reruns (``parabel.messung``). ``abschliessen`` beendet
+beides und zeigt in der Seitenleiste das Profil (``?profile=1&token=...``) und
+das Debug-Panel mit den Zeiten des Reruns und den Zählern von Caches und Pools
+(``?debug=1``).
+"""
+
+import streamlit as st
+
+from parabel import messung, profil
+
+
+def einrichten(name=None):
+    """Profil und Messung starten; ohne ``name`` startet die Seite die Messung selbst (``messung.starten``)."""
+    profil.starten(st.query_params)
+    if name is not None:
+        messung.starten(name)
+
+
+def abschliessen():
+    """Profil und Messung beenden und, falls angefordert, in der Seitenleiste zeigen."""
+    stats = profil.beenden()
+    if stats is not None:
+        with st.sidebar.expander("🔬 Profil dieses Reruns", expanded=True):
+            st.dataframe(profil.tabelle(stats), hide_index=True)
+            st.download_button("Profil herunterladen (.prof)", profil.als_datei(stats), file_name="rerun.prof")
+
+    bericht = messung.beenden()
+    if st.query_params.get("debug") == "1":
+        with st.sidebar.expander("⏱️ Messwerte", expanded=True):
+            st.caption(f"Rerun: {bericht['gesamt_ms']:.0f} ms, Bilder: {bericht['bytes'] / 1024:.0f} KiB")
+            st.dataframe(messung.tabelle(bericht), hide_index=True)
+            st.json(statistik(), expanded=False)
+
+
+def statistik():
+    """Zähler von Bild-Cache, Renderpool, Text-Cache, Abtastung und Antwortprüfung."""
+    # Erst hier importieren: Seiten ohne Plots und Antworten laden render und antworten sonst gar nicht
+    from parabel import antworten
+    from parabel.render import CACHE, RENDERPOOL, abtastung_statistik, textcache_statistik
+
+    return {"Bild-Cache": CACHE.statistik(), "Renderpool": RENDERPOOL.statistik(),
+            "Text-Cache": textcache_statistik(), "Abtastung": abtastung_statistik(),
+            "Antworten": antworten.statistik()}
@@ -0,0 +1,105 @@
+"""Prozessweiter Cache für gesetzte Beschriftungen in matplotlib.
+
+Beim Zeichnen misst matplotlib jeden Text (Ticks, Titel, Legende) und setzt
+Mathtext wie ``$f(x) = 1.0(x-(2.0))^2 + (0.0)$`` neu. Seine eigenen Caches
+dafür hängen am Renderer bzw. am Mathtext-Parser des Renderers, und
+``savefig(bbox_inches="tight")`` legt für das Vermessen der Figure bei jedem
+Aufruf einen neuen Renderer an. Außerdem behält matplotlib nur 50 gesetzte
+Mathtext-Ausdrücke. Fast alles wird also bei jedem Bild neu berechnet, obwohl
+sich zwischen zwei Slider-Stellungen nur ein, zwei Beschriftungen ändern.
+
+``installieren()`` ersetzt beide Caches durch je einen ``TextCache``, dessen
+Schlüssel nur aus Text, Schrifteigenschaften, dpi und Renderer-Art besteht. Er
+wird damit von allen Renderern, Figures und Plot-Slots des Prozesses (und so
+von allen Sitzungen) geteilt:
+
+* ``MASSE``: Breite, Höhe und Unterlänge eines Textes
+* ``MATHTEXT``: der gesetzte und gerasterte Mathtext-Ausdruck
+
+``parabel.plots`` installiert den Cache beim Import, also in jedem
+Renderprozess. ``statistik()`` liefert die Zähler dieses Prozesses.
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+log = logging.getLogger(__name__)
+
+
+class TextCache:
+    def __init__(self, max_eintraege):
+        self.max_eintraege = max_eintraege
+        self.hits = 0
+        self.misses = 0
+        self._daten = OrderedDict()
+        self._lock = threading.Lock()
+
+    def holen(self, key, berechnen):
+        """Wert zu ``key`` aus dem Cache, sonst ``berechnen()`` (außerhalb des Locks)."""
+        with self._lock:
+            if key in self._daten:
+                self._daten.move_to_end(key)
+                self.hits += 1
+                return self._daten[key]
+            self.misses += 1
+        wert = berechnen()
+        with self._lock:
+            self._daten[key] = wert
+            while len(self._daten) > self.max_eintraege:
+                self._daten.popitem(last=False)
+        return wert
+
+    def statistik(self):
+        with self._lock:
+            anfragen = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / anfragen if anfragen else 0.0,
+                "eintraege": len(self._daten),
+            }
+
+
+MASSE = TextCache(max_eintraege=8192)
+# Ein gerasterter Legendeneintrag hat bei 200 dpi einige 10 kB
+MATHTEXT = TextCache(max_eintraege=512)
+
+_installiert = False
+
+
+def installieren():
+    """Leitet die Text-Caches von matplotlib auf ``MASSE`` und ``MATHTEXT`` um."""
+    global _installiert
+    if _installiert:
+        return
+    import matplotlib
+    from matplotlib import mathtext, text
+
+    mathtext_ohne_cache = getattr(getattr(mathtext.MathTextParser, "_parse_cached", None), "__wrapped__", None)
+    if mathtext_ohne_cache is None or not hasattr(text, "_get_text_metrics_with_cache"):
+        # Andere matplotlib-Version: dann eben mit deren eigenen Caches
+        log.warning("Text-Cache nicht installiert: matplotlib %s hat andere Interna", matplotlib.__version__)
+        return
+
+    def masse(renderer, s, fontprop, ismath, dpi):
+        # Kopie, damit spätere Änderungen an fontprop den Schlüssel nicht verfälschen
+        fontprop = fontprop.copy()
+        key = (type(renderer), getattr(renderer, "dpi", None), s, fontprop, ismath, dpi)
+        return MASSE.holen(key, lambda: renderer.get_text_width_height_descent(s, fontprop, ismath))
+
+    def mathtext_setzen(parser, s, dpi, prop, antialiased, load_glyph_flags):
+        # prop ist hier schon eine Kopie (MathTextParser.parse), also als Schlüssel sicher
+        key = (parser._output_type, s, dpi, prop, antialiased, load_glyph_flags)
+        return MATHTEXT.holen(
+            key, lambda: mathtext_ohne_cache(parser, s, dpi, prop, antialiased, load_glyph_flags))
+
+    text._get_text_metrics_with_cache = masse
+    mathtext.MathTextParser._parse_cached = mathtext_setzen
+    _installiert = True
+
+
+def statistik():
+    """Zähler beider Caches in diesem Prozess."""
+    return {"prozess": os.getpid(), "masse": MASSE.statistik(), "mathtext": MATHTEXT.statistik()}
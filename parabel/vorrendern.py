@@ -0,0 +1,82 @@
+"""Rendert alle Stellungen der diskreten Slider-Plots vorab als Bilddateien.
+
+Aufruf im Wurzelverzeichnis des Repos (z.B. beim Deployment)::
+
+    python -m parabel.vorrendern
+
+Die Slider ``slider_1`` bis ``slider_3`` (je 101 Stellungen) und
+``ziel_verbrauch`` (51 Stellungen) haben kleine, endliche Wertebereiche. Jede
+Stellung wird genau einmal im Standard-Bildformat des Deployments
+(``parabel.bildformat.STANDARD``) gerendert und unter ``parabel/vorgerendert/``
+abgelegt; ``manifest.json`` ordnet jedem Cache-Schlüssel seine Datei zu.
+Zur Laufzeit liefert ``parabel.render`` diese Dateien aus, ohne matplotlib
+aufzurufen. Offene Eingaben wie ``a_user``/``b_user``/``c_user`` werden
+weiterhin live gerendert.
+"""
+
+import argparse
+import hashlib
+import json
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from parabel.aufgaben import AUFGABEN
+from parabel.bildformat import STANDARD
+from parabel.cache import schluessel
+from parabel.render import EINSTELLUNGEN, VORGERENDERT, _render, manifest_name
+
+# (Plot-Art, statische Parameter, Slider-Parameter, Minimum, Maximum, Schrittweite)
+ZUSTANDSRAEUME = [
+    ("kraftstoff", {}, "ziel", 4.0, 9.0, 0.1),
+    ("aufgabe", AUFGABEN[1], "ziel", -2.0, 8.0, 0.1),
+    ("aufgabe", AUFGABEN[2], "ziel", -2.0, 8.0, 0.1),
+    ("aufgabe", AUFGABEN[3], "ziel", -2.0, 8.0, 0.1),
+]
+
+
+def slider_werte(minimum, maximum, schritt):
+    anzahl = round((maximum - minimum) / schritt) + 1
+    return [round(minimum + i * schritt, 6) for i in range(anzahl)]
+
+
+def alle_schluessel():
+    for art, statisch, name, minimum, maximum, schritt in ZUSTANDSRAEUME:
+        for wert in slider_werte(minimum, maximum, schritt):
+            yield schluessel(art, {**statisch, name: wert})
+
+
+def _rendere(key):
+    art, params = key
+    return key, _render(art, dict(params))
+
+
+def vorrendern(ziel=VORGERENDERT, prozesse=None):
+    ziel = Path(ziel)
+    ziel.mkdir(parents=True, exist_ok=True)
+
+    bilder = {}
+    with ProcessPoolExecutor(max_workers=prozesse) as pool:
+        for key, daten in pool.map(_rendere, alle_schluessel(), chunksize=8):
+            name = manifest_name(key)
+            datei = hashlib.sha256(name.encode("utf-8")).hexdigest()[:20] + "." + STANDARD.format
+            (ziel / datei).write_bytes(daten)
+            bilder[name] = datei
+
+    manifest = {"einstellungen": EINSTELLUNGEN, "bilder": bilder}
+    (ziel / "manifest.json").write_text(json.dumps(manifest, ensure_ascii=False, indent=1),
+                                        encoding="utf-8")
+    return len(bilder)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ziel", default=VORGERENDERT, help="Asset-Verzeichnis (Standard: %(default)s)")
+    parser.add_argument("--prozesse", type=int, default=None, help="Anzahl Render-Prozesse")
+    args = parser.parse_args()
+
+    anzahl = vorrendern(args.ziel, args.prozesse)
+    print(f"{anzahl} Bilder nach {args.ziel} geschrieben")
+
+
+if __name__ == "__main__":
+    main()
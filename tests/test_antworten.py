@@ -0,0 +1,35 @@
+import pytest
+
+from parabel.antworten import _KANONISCH, bereinigen, loesungen_kanonisch, zu_komplex
+from parabel.aufgaben import ANTWORT_ARTEN, RICHTIGE_ANTWORTEN
+
+
+@pytest.mark.parametrize("aufgabe, richtig", [(aufgabe, richtig) for aufgabe, antworten in RICHTIGE_ANTWORTEN.items()
+                                              for richtig in antworten])
+def test_richtige_antworten_kanonisch(aufgabe, richtig):
+    assert _KANONISCH[ANTWORT_ARTEN[aufgabe]](bereinigen(richtig)) is not None
+
+
+@pytest.mark.parametrize("antwort", ["2=x", "2 = x", "x=2", "x = 2,0"])
+def test_variable_auf_beiden_seiten(antwort):
+    assert loesungen_kanonisch(bereinigen(antwort)) == frozenset({2.0})
+
+
+def test_komma_trennt_loesungen():
+    assert loesungen_kanonisch(bereinigen("x=5, x=2")) == frozenset({5.0, 2.0})
+    assert loesungen_kanonisch(bereinigen("x=0,27, x=3,73")) == frozenset({0.27, 3.73})
+
+
+@pytest.mark.parametrize("antwort", ["2", "x=2=3", "5=2", "x=y"])
+def test_keine_zuweisung(antwort):
+    assert loesungen_kanonisch(bereinigen(antwort)) is None
+
+
+@pytest.mark.parametrize("text", ["0.002(v^2)-0.18v+8.55=7", "x^(2)=4", "(x^2)^1=4", "x^-1=2"])
+def test_einfache_potenzen(text):
+    assert not zu_komplex(bereinigen(text))
+
+
+@pytest.mark.parametrize("text", ["9^9^9", "x^(2=4", "x^(x)=1", "x^11=1", "x^(2)^3=1"])
+def test_zu_komplexe_potenzen(text):
+    assert zu_komplex(bereinigen(text))
@@ -0,0 +1,51 @@
+import threading
+import time
+
+import pytest
+
+from parabel.auswertung import Ausgefallen, Auswertungspool, Zeitueberschreitung
+
+TIMEOUT = 0.5
+
+
+def haengen():
+    time.sleep(60)
+
+
+def verdoppeln(x):
+    return 2 * x
+
+
+def langsam_starten():
+    # Länger als TIMEOUT: so lange braucht der neue Pool nach dem Ersetzen
+    time.sleep(4 * TIMEOUT)
+
+
+@pytest.fixture
+def pool():
+    pool = Auswertungspool(prozesse=2, timeout=TIMEOUT, aufwaermen=f"{__name__}:langsam_starten")
+    assert pool.starten()
+    yield pool
+    pool._ersetzen(pool._poolstart.pool())
+
+
+def test_haengender_ausdruck_blockiert_keine_andere_antwort(pool):
+    haenger = threading.Thread(target=lambda: pytest.raises(Zeitueberschreitung, pool.auswerten, haengen))
+    haenger.start()
+
+    wartezeiten = []
+    ende = time.perf_counter() + 6 * TIMEOUT
+    while time.perf_counter() < ende:
+        start = time.perf_counter()
+        try:
+            assert pool.auswerten(verdoppeln, 21) == 42
+        except Ausgefallen:
+            pass  # Pool startet gerade neu: nicht geprüft, aber nicht blockiert
+        wartezeiten.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        pool.statistik()
+        assert time.perf_counter() - start < 0.1
+    haenger.join()
+
+    assert pool.statistik()["neustarts"] == 1
+    assert max(wartezeiten) < TIMEOUT + 0.5
@@ -0,0 +1,48 @@
+from unittest import mock
+
+from tornado.testing import AsyncHTTPTestCase
+
+from parabel import bildserver, render
+from parabel.bildformat import STANDARD
+
+# Wie die Zahlenfelder auf Seite 1 (ganze Zahlen)
+SEITE = {"a": 1, "b": -2, "c": 3, "ziel": 4}
+
+
+class BildserverTest(AsyncHTTPTestCase):
+    def get_app(self):
+        return bildserver.anwendung()
+
+    def setUp(self):
+        super().setUp()
+        # Im eigenen Thread rendern: gleiche Bytes wie im Pool, aber ohne Prozesse zu starten
+        patch = mock.patch.object(render.RENDERPOOL, "prozesse", 0)
+        patch.start()
+        self.addCleanup(patch.stop)
+        render.CACHE.leeren()
+        self.addCleanup(render.CACHE.leeren)
+
+    def _vom_server(self, params):
+        antwort = self.fetch(bildserver.url("", "nutzer", STANDARD, params))
+        self.assertEqual(antwort.code, 200)
+        return antwort.body
+
+    def test_gleiche_bytes_egal_wer_zuerst_rendert(self):
+        seite_zuerst = render.bild_bytes("nutzer", STANDARD, **SEITE)
+        self.assertEqual(self._vom_server(SEITE), seite_zuerst)
+
+        render.CACHE.leeren()
+        server_zuerst = self._vom_server(SEITE)
+        self.assertEqual(render.bild_bytes("nutzer", STANDARD, **SEITE), server_zuerst)
+        self.assertEqual(server_zuerst, seite_zuerst)
+
+    def test_ganze_und_fliesskommazahlen_getrennt(self):
+        # Beschriftet als "1x²" bzw. "1.0x²": dürfen sich keinen Cache-Eintrag teilen
+        ganz = self._vom_server(SEITE)
+        fliesskomma = {name: float(wert) for name, wert in SEITE.items()}
+        self.assertEqual(self._vom_server(fliesskomma), render.bild_bytes("nutzer", STANDARD, **fliesskomma))
+        self.assertNotEqual(self._vom_server(fliesskomma), ganz)
+
+    def test_ausserhalb_der_grenze(self):
+        antwort = self.fetch(bildserver.url("", "nutzer", STANDARD, {**SEITE, "a": render.GRENZE + 1}))
+        self.assertEqual(antwort.code, 400)
@@ -0,0 +1,17 @@
+from parabel.nebenlaeufigkeit import ZUFALLSPARAMETER, pruefen, speicher
+from parabel.plots import MAX_HINTERGRUND_BYTES, PLOTS
+
+
+def test_jede_plot_art_wird_geprueft():
+    assert set(ZUFALLSPARAMETER) == set(PLOTS)
+
+
+def test_parallel_wie_nacheinander():
+    abweichend, _, _ = pruefen(sitzungen=4, anzahl=2 * len(PLOTS))
+    assert abweichend == []
+
+
+def test_hintergruende_bleiben_im_budget():
+    pruefen(sitzungen=4, anzahl=len(PLOTS))
+    _, hintergruende = speicher()
+    assert 0 < hintergruende["bytes"] <= MAX_HINTERGRUND_BYTES
@@ -0,0 +1,280 @@
+"""Benchmark aller Seiten und der Rechen-/Zeichenpfade, mit Vergleich gegen eine Basis.
+
+Aufruf im Wurzelverzeichnis des Repos::
+
+    python werkzeuge/benchmark.py --json basis.json            # Basis festhalten
+    python werkzeuge/benchmark.py --vergleich basis.json       # nach einer Änderung
+
+Gemessen wird (alle Werte in Millisekunden):
+
+* ``seite/<Datei>/import_streamlit_ms``: ``import streamlit`` in einem frischen Interpreter
+* ``seite/<Datei>/import_seite_ms``: danach die übrigen Import-Anweisungen der
+  Seite (bei Abschnitten: von ``app.py`` und Abschnitt)
+* ``seite/<Datei>/erster_rerun_ms``: erster Lauf mit ``AppTest`` im selben
+  Prozess, also mit leerem Bild-Cache und startenden Pools
+* ``seite/<Datei>/rerun_ms``: Median weiterer Läufe ohne Änderung (alles im Cache)
+
+Das gilt für ``Home.py``, jede Datei in ``Quadratiche-Gleichungen/pages/`` und
+jeden Abschnitt von ``Darstellungsarten-quadratischer-Funktionen/app.py``. Jede
+Seite läuft in einem eigenen Prozess, damit sich Caches nicht gegenseitig
+aufwärmen; von ``--kaltstarts`` (Standard 3) solchen Prozessen zählt
+jeweils der beste Wert, weil ein einzelner Kaltstart stark von Festplatten-
+und Betriebssystem-Caches abhängt. Dazu kommen Micro-Benchmarks (``mikro/...``, bester von
+``--wiederholungen`` Durchläufen):
+
+* ``parabel.loeser.loesen`` für eine und für 100 000 Gleichungen
+* ``_render`` jeder Plot-Art am Cache vorbei (Slot aufgewärmt, zufällige Slider-Werte)
+* ``schluessel`` und ``RenderCache.get`` (Weg eines Cache-Treffers)
+* ``gleichung_kanonisch``/``loesungen_kanonisch`` (sympy, ohne Pool und Cache)
+
+Mit ``--vergleich`` endet das Skript mit Exit-Code 1, wenn ein Wert um mehr als
+``--schwelle`` (Anteil, Standard 0.25) *und* mehr als ``--min-ms`` (Standard
+5) langsamer ist als in der Basis. Die absolute Untergrenze verhindert
+Fehlalarme durch Rauschen bei sehr kleinen Werten; Importzeiten schwanken
+zwischen zwei Kaltstarts um einige Millisekunden. Basis und Vergleich sollten auf derselben
+Maschine entstehen; die JSON-Datei enthält dazu die Umgebung.
+
+Import-Budget: Beim Import einer Seite darf keine der Bibliotheken in
+``SCHWER`` geladen werden (sie gehören in die Funktionen, die sie wirklich
+brauchen, oder in die Pool-Prozesse), und ``import_seite_ms`` darf
+``IMPORT_BUDGET_MS`` nicht überschreiten. Verstöße werden immer geprüft,
+wenn Seiten gemessen werden, und führen ebenfalls zu Exit-Code 1.
+
+Vorgerenderte Bilder (``parabel/vorgerendert/``) verkürzen den ersten Rerun.
+Ob es sie gab, steht ebenfalls in der JSON-Datei.
+"""
+
+import argparse
+import ast
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+GLEICHUNGEN = ROOT / "Quadratiche-Gleichungen"
+DARSTELLUNGSARTEN = ROOT / "Darstellungsarten-quadratischer-Funktionen"
+
+# Eintrag -> (Skript für AppTest, Abschnitt für switch_page oder None)
+SEITEN = {
+    "Home.py": (GLEICHUNGEN / "Home.py", None),
+    **{f"pages/{datei.name}": (datei, None) for datei in sorted((GLEICHUNGEN / "pages").glob("*.py"))},
+    **{f"app.py/{datei.stem}": (DARSTELLUNGSARTEN / "app.py", f"abschnitte/{datei.name}")
+       for datei in sorted((DARSTELLUNGSARTEN / "abschnitte").glob("*.py"))},
+}
+
+TIMEOUT = 180
+
+# Import-Budget pro Seite, ohne streamlit selbst
+SCHWER = ("numpy", "matplotlib", "sympy", "altair", "pandas", "PIL")
+IMPORT_BUDGET_MS = 150
+
+
+def _importe_messen(skript):
+    """Dauer der Import-Anweisungen auf oberster Ebene von ``skript``."""
+    baum = ast.parse(skript.read_text(encoding="utf-8"))
+    importe = ast.Module([knoten for knoten in baum.body if isinstance(knoten, (ast.Import, ast.ImportFrom))],
+                         type_ignores=[])
+    code = compile(importe, str(skript), "exec")
+    start = time.perf_counter()
+    exec(code, {"__name__": "__benchmark__", "__file__": str(skript)})
+    return time.perf_counter() - start
+
+
+def seite_messen(name, laeufe):
+    """Läuft im eigenen Prozess (``--seite``): Import, erster und weitere Reruns einer Seite."""
+    skript, abschnitt = SEITEN[name]
+    start = time.perf_counter()
+    import streamlit  # noqa: F401
+    werte = {"import_streamlit_ms": (time.perf_counter() - start) * 1000}
+
+    importe = _importe_messen(skript)
+    if abschnitt:
+        importe += _importe_messen(skript.parent / abschnitt)
+    werte["import_seite_ms"] = importe * 1000
+    schwer = [modul for modul in SCHWER if modul in sys.modules]
+
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(skript), default_timeout=TIMEOUT)
+    start = time.perf_counter()
+    at.run()
+    if abschnitt:
+        # Vom Einstieg in den Abschnitt wechseln, wie im Browser
+        at.switch_page(abschnitt).run()
+    werte["erster_rerun_ms"] = (time.perf_counter() - start) * 1000
+    if at.exception:
+        raise RuntimeError(f"{name}: {at.exception[0].message}")
+
+    zeiten = []
+    for _ in range(laeufe):
+        start = time.perf_counter()
+        at.run()
+        zeiten.append(time.perf_counter() - start)
+    werte["rerun_ms"] = statistics.median(zeiten) * 1000
+    return werte, schwer
+
+
+def seiten_messen(laeufe, kaltstarts):
+    """Alle Seiten je in eigenen Prozessen; liefert (Messwerte, Verstöße gegen das Import-Budget)."""
+    ergebnisse = {}
+    verstoesse = []
+    umgebung = dict(os.environ, PARABEL_MESSUNG_LOG="WARNING")
+    for name in SEITEN:
+        messungen = []
+        for _ in range(kaltstarts):
+            ausgabe = subprocess.run([sys.executable, __file__, "--seite", name, "--laeufe", str(laeufe)],
+                                     capture_output=True, text=True, env=umgebung, cwd=ROOT,
+                                     timeout=10 * TIMEOUT)
+            if ausgabe.returncode:
+                raise RuntimeError(f"{name} fehlgeschlagen:\n{ausgabe.stderr}")
+            messungen.append(json.loads(ausgabe.stdout.splitlines()[-1]))
+        # Bester Kaltstart je Messwert: Ausreißer durch andere Last auf der Maschine fallen weg
+        werte = {wert: min(werte[wert] for werte, _ in messungen) for wert in messungen[0][0]}
+        schwer = sorted({modul for _, schwer in messungen for modul in schwer})
+        for wert, ms in werte.items():
+            ergebnisse[f"seite/{name}/{wert}"] = ms
+        if schwer:
+            verstoesse.append(f"{name} lädt beim Import {', '.join(schwer)}")
+        if werte["import_seite_ms"] > IMPORT_BUDGET_MS:
+            verstoesse.append(f"{name} braucht {werte['import_seite_ms']:.0f} ms für den Import "
+                              f"(Budget {IMPORT_BUDGET_MS} ms)")
+        print(f"  {name}", file=sys.stderr)
+    return ergebnisse, verstoesse
+
+
+def _bester(funktion, wiederholungen):
+    """Beste Zeit pro Aufruf in ms, über ``wiederholungen`` automatisch bemessene Durchläufe."""
+    timer = timeit.Timer(funktion)
+    anzahl, _ = timer.autorange()
+    return min(timer.repeat(repeat=wiederholungen, number=anzahl)) / anzahl * 1000
+
+
+def mikro_messen(wiederholungen):
+    import numpy as np
+
+    from parabel.antworten import bereinigen, gleichung_kanonisch, loesungen_kanonisch
+    from parabel.cache import RenderCache, schluessel
+    from parabel.loeser import loesen
+    from parabel.nebenlaeufigkeit import ZUFALLSPARAMETER
+    from parabel.render import _render
+
+    ergebnisse = {}
+    zufall = np.random.default_rng(0)
+    a, b, c = zufall.uniform(-10, 10, (3, 100_000))
+    ergebnisse["mikro/loesen/einzeln_ms"] = _bester(lambda: loesen(1.0, -4.0, 3.0), wiederholungen)
+    ergebnisse["mikro/loesen/100000_ms"] = _bester(lambda: loesen(a, b, c), wiederholungen)
+
+    for art, parameter in ZUFALLSPARAMETER.items():
+        slider = random.Random(0)
+        _render(art, parameter(slider))  # Slot aufbauen
+        ergebnisse[f"mikro/render/{art}_ms"] = _bester(lambda: _render(art, parameter(slider)), wiederholungen)
+
+    cache = RenderCache()
+    params = {"ziel": 7.000000000001}
+    cache.put(schluessel("kraftstoff", params), b"png")
+    ergebnisse["mikro/cache/treffer_ms"] = _bester(lambda: cache.get(schluessel("kraftstoff", params)),
+                                                   wiederholungen)
+
+    gleichung = bereinigen("0,002v²-0,18v+8,55=7")
+    loesungen = bereinigen("x=2±√3")
+    ergebnisse["mikro/antwort/gleichung_ms"] = _bester(lambda: gleichung_kanonisch(gleichung), wiederholungen)
+    ergebnisse["mikro/antwort/loesungen_ms"] = _bester(lambda: loesungen_kanonisch(loesungen), wiederholungen)
+    return ergebnisse
+
+
+def umgebung():
+    return {
+        "zeit": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "plattform": platform.platform(),
+        "prozessor": platform.processor() or platform.machine(),
+        "kerne": os.cpu_count(),
+        "vorgerendert": (ROOT / "parabel" / "vorgerendert" / "manifest.json").exists(),
+    }
+
+
+def vergleichen(basis, aktuell, schwelle, min_ms):
+    """Tabelle der Änderungen gegenüber ``basis``; liefert die Namen der Verschlechterungen."""
+    schlechter = []
+    print(f"{'Messwert':<52}{'Basis':>10}{'Jetzt':>10}{'Änderung':>10}")
+    for name in sorted(aktuell.keys() & basis.keys()):
+        alt, neu = basis[name], aktuell[name]
+        aenderung = (neu - alt) / alt if alt else 0.0
+        markierung = ""
+        if aenderung > schwelle and neu - alt > min_ms:
+            schlechter.append(name)
+            markierung = "  ← langsamer"
+        print(f"{name:<52}{alt:>10.3f}{neu:>10.3f}{aenderung:>+10.0%}{markierung}")
+    gemessen = {name.split("/")[0] for name in aktuell}
+    for name in sorted(basis.keys() - aktuell.keys()):
+        if name.split("/")[0] not in gemessen:
+            continue  # z.B. mit --nur seiten nicht gemessen
+        print(f"{name:<52}  fehlt in der aktuellen Messung")
+    return schlechter
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nur", choices=("seiten", "mikro"), help="Nur einen Teil messen")
+    parser.add_argument("--laeufe", type=int, default=5, help="Reruns pro Seite nach dem ersten")
+    parser.add_argument("--kaltstarts", type=int, default=3, help="Frische Prozesse pro Seite")
+    parser.add_argument("--wiederholungen", type=int, default=5, help="Durchläufe pro Micro-Benchmark")
+    parser.add_argument("--json", help="Ergebnisse als JSON in diese Datei schreiben")
+    parser.add_argument("--vergleich", help="JSON-Datei einer früheren Messung als Basis")
+    parser.add_argument("--schwelle", type=float, default=0.25,
+                        help="Erlaubte Verschlechterung als Anteil (0.25 = 25 %%)")
+    parser.add_argument("--min-ms", type=float, default=5.0,
+                        help="Verschlechterungen unter so vielen ms gelten als Rauschen")
+    parser.add_argument("--seite", help=argparse.SUPPRESS)  # intern: eine Seite im eigenen Prozess
+    args = parser.parse_args()
+
+    if args.seite:
+        print(json.dumps(seite_messen(args.seite, args.laeufe)))
+        return
+
+    werte = {}
+    verstoesse = []
+    if args.nur != "mikro":
+        print("Seiten:", file=sys.stderr)
+        seiten, verstoesse = seiten_messen(args.laeufe, args.kaltstarts)
+        werte.update(seiten)
+    if args.nur != "seiten":
+        print("Micro-Benchmarks ...", file=sys.stderr)
+        werte.update(mikro_messen(args.wiederholungen))
+    ergebnis = {"umgebung": umgebung(), "werte": werte, "import_budget": verstoesse}
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(ergebnis, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    for verstoss in verstoesse:
+        print(f"Import-Budget: {verstoss}")
+
+    if not args.vergleich:
+        for name, ms in werte.items():
+            print(f"{name:<52}{ms:>10.3f} ms")
+        sys.exit(1 if verstoesse else 0)
+
+    basis = json.loads(Path(args.vergleich).read_text(encoding="utf-8"))
+    if basis["umgebung"]["plattform"] != ergebnis["umgebung"]["plattform"]:
+        print("Achtung: Basis stammt von einer anderen Plattform", file=sys.stderr)
+    schlechter = vergleichen(basis["werte"], werte, args.schwelle, args.min_ms)
+    if schlechter:
+        print(f"\n{len(schlechter)} Messwerte mehr als {args.schwelle:.0%} langsamer als die Basis")
+    else:
+        print("\nkeine Verschlechterung gegenüber der Basis")
+    sys.exit(1 if schlechter or verstoesse else 0)
+
+
+if __name__ == "__main__":
+    main()
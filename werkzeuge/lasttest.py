@@ -0,0 +1,345 @@
+"""Lasttest: Wie viele Schüler*innen verkraftet eine Instanz der Apps?
+
+Aufruf im Wurzelverzeichnis des Repos::
+
+    python werkzeuge/lasttest.py [--stufen 1 2 4 8 16] [--dauer 30] [--denkzeit 1.0]
+
+Das Skript startet beide Apps mit ``streamlit run`` und verbindet sich mit
+vielen Sitzungen gleichzeitig über dieselbe WebSocket-Schnittstelle wie der
+Browser (``/_stcore/stream``, Protobuf-Nachrichten). Der Server arbeitet also
+genau wie im Unterricht: Render-Cache, Plot-Slots und Pools werden von allen
+Sitzungen geteilt, Fragmente werden einzeln neu ausgeführt, und die Bilder
+werden wie vom Browser über ``/media/...`` abgeholt. (``AppTest`` eignet sich
+dafür nicht: Es setzt bei jedem Lauf globalen Zustand und kann nicht mehrere
+Sitzungen gleichzeitig ausführen.)
+
+Jede Sitzung spielt immer wieder ein typisches Szenario durch, mit
+``--denkzeit`` Sekunden (±50 %) Pause zwischen zwei Aktionen:
+
+* ``gleichungen``: Seite „Grafisches Lösungsverfahren“ öffnen, ``slider_1`` bis
+  ``slider_3`` ziehen, Antworten in ``input2`` bis ``input4`` tippen und
+  „Überprüfen“ drücken
+* ``darstellungsarten``: App öffnen, Abschnitt Polynomform wählen und
+  ``a_poly``/``b_poly``/``c_poly`` verschieben
+
+Für jede Stufe (Anzahl gleichzeitiger Sitzungen) werden p50/p95/p99 der
+Rerun-Latenz (Aktion bis ``script_finished`` plus Laden neuer Bilder), Reruns
+pro Sekunde, die CPU-Auslastung der Server samt Pool-Prozessen (in Kernen) und
+ihr höchster Speicherverbrauch (RSS) ausgegeben. Der Lastgenerator selbst
+braucht auch CPU; für belastbare Zahlen auf einer Maschine mit wenigen Kernen
+``--denkzeit`` nicht zu klein wählen.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urljoin
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from tornado.httpclient import AsyncHTTPClient
+from tornado.websocket import websocket_connect
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from parabel.vorrendern import slider_werte
+
+APPS = {
+    "gleichungen": ROOT / "Quadratiche-Gleichungen" / "Home.py",
+    "darstellungsarten": ROOT / "Darstellungsarten-quadratischer-Funktionen" / "app.py",
+}
+
+# Slider-Züge pro Slider und Durchlauf
+ZUEGE = 5
+
+# Typische Antworten, richtige und falsche
+ANTWORTEN = {
+    2: ["x=2", "x = 2", "x=1", "2", "x=3"],
+    3: ["x=0,27 oder x=3,73", "x=3.73 oder x=0.27", "x=0,3 oder x=3,7", "x=1 oder x=3", "x=2±√3"],
+    4: ["nicht lösbar", "'nicht lösbar'", "x=-2", "keine Lösung", "x=2"],
+}
+
+TIMEOUT = 120
+
+_FERTIG = {ForwardMsg.FINISHED_SUCCESSFULLY, ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY}
+
+
+class Sitzung:
+    """Eine Browser-Sitzung: hält Widget-Zustände und führt Reruns über den WebSocket aus."""
+
+    def __init__(self, basis, messen):
+        self.basis = basis
+        self.messen = messen
+        self.verbindung = None
+        self.zustaende = {}   # Widget-ID -> WidgetState (wie der Browser sie mitschickt)
+        self.widgets = {}     # Key -> (Widget-ID, Element-Typ, Fragment-ID)
+        self.seiten = {}      # url_pathname -> page_script_hash
+        self.seite = ""
+        self.bilder = set()
+        self.http = AsyncHTTPClient()
+
+    async def oeffnen(self, seite=None):
+        ws_basis = self.basis.replace("http", "ws", 1)
+        self.verbindung = await websocket_connect(urljoin(ws_basis, "_stcore/stream"),
+                                                  subprotocols=["streamlit"])
+        await self.rerun("öffnen")
+        if seite is not None:
+            self.seite = next(h for pfad, h in self.seiten.items() if seite in pfad)
+            await self.rerun("seite")
+
+    def schliessen(self):
+        if self.verbindung is not None:
+            self.verbindung.close()
+
+    async def setzen(self, key, wert):
+        widget_id, typ, fragment = self.widgets[key]
+        zustand = self.zustaende.setdefault(widget_id, WidgetState(id=widget_id))
+        if typ == "slider":
+            zustand.double_array_value.data[:] = [wert]
+        elif typ == "number_input":
+            zustand.int_value = wert
+        else:
+            zustand.string_value = wert
+        await self.rerun(typ, fragment)
+
+    async def klicken(self, key):
+        widget_id, _, fragment = self.widgets[key]
+        ausloeser = WidgetState(id=widget_id, trigger_value=True)
+        await self.rerun("klick", fragment, ausloeser)
+
+    async def rerun(self, schritt, fragment="", ausloeser=None):
+        nachricht = BackMsg()
+        zustand = nachricht.rerun_script
+        zustand.page_script_hash = self.seite
+        zustand.fragment_id = fragment
+        zustand.widget_states.widgets.extend(self.zustaende.values())
+        if ausloeser is not None:
+            zustand.widget_states.widgets.append(ausloeser)
+
+        start = time.perf_counter()
+        await self.verbindung.write_message(nachricht.SerializeToString(), binary=True)
+        neue_bilder, fehler = await asyncio.wait_for(self._bis_fertig(), TIMEOUT)
+        # Wie der Browser: neue Bilder abholen, bevor die Schüler*in etwas sieht
+        await asyncio.gather(*(self.http.fetch(urljoin(self.basis, url)) for url in neue_bilder))
+        self.messen(schritt, time.perf_counter() - start, fehler)
+
+    async def _bis_fertig(self):
+        neue_bilder = []
+        fehler = []
+        while True:
+            daten = await self.verbindung.read_message()
+            if daten is None:
+                raise ConnectionError("WebSocket geschlossen")
+            msg = ForwardMsg.FromString(daten)
+            art = msg.WhichOneof("type")
+            if art == "script_finished":
+                if msg.script_finished in _FERTIG:
+                    return neue_bilder, fehler
+                if msg.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                    fehler.append("Compile-Fehler")
+                    return neue_bilder, fehler
+            elif art == "navigation":
+                self.seiten = {seite.url_pathname: seite.page_script_hash for seite in msg.navigation.app_pages}
+            elif art == "delta" and msg.delta.WhichOneof("type") == "new_element":
+                self._element(msg.delta.new_element, msg.delta.fragment_id, neue_bilder, fehler)
+
+    def _element(self, element, fragment, neue_bilder, fehler):
+        typ = element.WhichOneof("type")
+        if typ in ("slider", "text_input", "number_input", "button"):
+            widget_id = getattr(element, typ).id
+            self.widgets[widget_id.rsplit("-", 1)[-1]] = (widget_id, typ, fragment)
+        elif typ == "imgs":
+            for bild in element.imgs.imgs:
+                # WebP und SVG stecken als data:-URL schon in der Nachricht (parabel.bildformat)
+                if bild.url not in self.bilder and not bild.url.startswith("data:"):
+                    self.bilder.add(bild.url)
+                    neue_bilder.append(bild.url)
+        elif typ == "exception":
+            fehler.append(element.exception.message)
+
+
+async def gleichungen(sitzung, zufall, denken):
+    await sitzung.oeffnen("Graphisches_Loesungsverfahren")
+    for nr in (1, 2, 3):
+        for wert in zufall.sample(slider_werte(-2.0, 8.0, 0.1), ZUEGE):
+            await denken()
+            await sitzung.setzen(f"slider_{nr}", wert)
+        await denken()
+        await sitzung.setzen(f"input{nr + 1}", zufall.choice(ANTWORTEN[nr + 1]))
+        await denken()
+        await sitzung.klicken(f"button{nr + 1}")
+
+
+async def darstellungsarten(sitzung, zufall, denken):
+    await sitzung.oeffnen("Polynomform")
+    for key, werte in [("a_poly", slider_werte(-3.0, 3.0, 0.1)),
+                       ("b_poly", slider_werte(-10.0, 10.0, 0.5)),
+                       ("c_poly", slider_werte(-10.0, 10.0, 0.5))]:
+        for wert in zufall.sample(werte, ZUEGE):
+            await denken()
+            await sitzung.setzen(key, wert)
+
+
+SZENARIEN = {"gleichungen": gleichungen, "darstellungsarten": darstellungsarten}
+
+
+def _freier_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def server_starten(app):
+    port = _freier_port()
+    prozess = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", str(app), "--server.headless", "true",
+         "--server.port", str(port), "--server.fileWatcherType", "none",
+         "--browser.gatherUsageStats", "false"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    basis = f"http://127.0.0.1:{port}/"
+    for _ in range(300):
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=1):
+                return prozess, basis
+        except OSError:
+            time.sleep(0.1)
+    prozess.kill()
+    raise RuntimeError(f"Server für {app} startet nicht")
+
+
+def _prozessbaum(pid):
+    """PID und alle (Enkel-)Kinder, über /proc (nur Linux)."""
+    pids = [pid]
+    for task in Path(f"/proc/{pid}/task").glob("*/children"):
+        for kind in task.read_text().split():
+            pids += _prozessbaum(int(kind))
+    return pids
+
+
+def _cpu_und_rss(server):
+    takt, seite = os.sysconf("SC_CLK_TCK"), os.sysconf("SC_PAGE_SIZE")
+    cpu, rss = 0.0, 0
+    for prozess in server:
+        for pid in _prozessbaum(prozess.pid):
+            try:
+                felder = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()
+                rss += int(Path(f"/proc/{pid}/statm").read_text().split()[1]) * seite
+            except OSError:
+                continue  # Prozess gerade beendet
+            cpu += (int(felder[11]) + int(felder[12])) / takt  # utime, stime
+    return cpu, rss
+
+
+async def stufe(sitzungen, dauer, szenarien, denkzeit, server, seed=0):
+    """Lässt ``sitzungen`` Sitzungen ``dauer`` Sekunden lang Szenarien abspielen."""
+    latenzen = []
+    fehler = []
+    ende = time.monotonic() + dauer
+
+    def messen(schritt, sekunden, meldungen):
+        latenzen.append(sekunden)
+        fehler.extend(f"{schritt}: {meldung}" for meldung in meldungen)
+
+    async def sitzung(nr):
+        zufall = random.Random(seed + nr)
+
+        async def denken():
+            await asyncio.sleep(denkzeit * zufall.uniform(0.5, 1.5))
+
+        # Sitzungen nicht alle im selben Moment starten
+        await asyncio.sleep(zufall.uniform(0, denkzeit))
+        while time.monotonic() < ende:
+            szenario = zufall.choice(szenarien)
+            verbindung = Sitzung(server[szenario][1], messen)
+            try:
+                await SZENARIEN[szenario](verbindung, zufall, denken)
+            except Exception as ausnahme:
+                fehler.append(repr(ausnahme))
+            finally:
+                verbindung.schliessen()
+
+    rss_max = [_cpu_und_rss(p for p, _ in server.values())[1]]
+
+    async def speicher_beobachten():
+        while True:
+            await asyncio.sleep(0.5)
+            rss_max[0] = max(rss_max[0], _cpu_und_rss(p for p, _ in server.values())[1])
+
+    beobachter = asyncio.ensure_future(speicher_beobachten())
+    cpu_start, start = _cpu_und_rss(p for p, _ in server.values())[0], time.perf_counter()
+    await asyncio.gather(*(sitzung(nr) for nr in range(sitzungen)))
+    gesamt = time.perf_counter() - start
+    cpu = _cpu_und_rss(p for p, _ in server.values())[0] - cpu_start
+    beobachter.cancel()
+
+    ergebnis = {
+        "sitzungen": sitzungen,
+        "reruns": len(latenzen),
+        "reruns_pro_s": len(latenzen) / gesamt,
+        "cpu_kerne": cpu / gesamt,
+        "rss_max_mb": rss_max[0] / 1024**2,
+        "fehler": len(fehler),
+    }
+    if len(latenzen) >= 2:
+        perzentile = statistics.quantiles(latenzen, n=100, method="inclusive")
+        ergebnis.update(p50_ms=perzentile[49] * 1000, p95_ms=perzentile[94] * 1000,
+                        p99_ms=perzentile[98] * 1000)
+    if fehler:
+        print(f"  {len(fehler)} Fehler, z.B. {fehler[0]}", file=sys.stderr)
+    return ergebnis
+
+
+async def lasttest(args, server):
+    # Einmal jedes Szenario ohne Pause, damit die erste Stufe nicht den Kaltstart misst
+    await stufe(len(args.szenario), 0.1, args.szenario, 0, server)
+
+    print(f"{'Sitzungen':>9} {'Reruns':>7} {'Reruns/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'CPU Kerne':>9} {'RSS MB':>8} {'Fehler':>6}")
+    ergebnisse = []
+    for sitzungen in args.stufen:
+        ergebnis = await stufe(sitzungen, args.dauer, args.szenario, args.denkzeit, server)
+        ergebnisse.append(ergebnis)
+        print(f"{sitzungen:>9} {ergebnis['reruns']:>7} {ergebnis['reruns_pro_s']:>9.1f} "
+              f"{ergebnis.get('p50_ms', 0):>8.0f} {ergebnis.get('p95_ms', 0):>8.0f} "
+              f"{ergebnis.get('p99_ms', 0):>8.0f} {ergebnis['cpu_kerne']:>9.2f} "
+              f"{ergebnis['rss_max_mb']:>8.0f} {ergebnis['fehler']:>6}", flush=True)
+    return ergebnisse
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stufen", type=int, nargs="+", default=[1, 2, 4, 8, 16],
+                        help="Anzahl gleichzeitiger Sitzungen je Stufe")
+    parser.add_argument("--dauer", type=float, default=30, help="Sekunden pro Stufe")
+    parser.add_argument("--denkzeit", type=float, default=1.0,
+                        help="mittlere Pause zwischen zwei Aktionen einer Sitzung in Sekunden")
+    parser.add_argument("--szenario", nargs="+", choices=list(SZENARIEN), default=list(SZENARIEN))
+    parser.add_argument("--json", help="Ergebnisse zusätzlich als JSON in diese Datei schreiben")
+    args = parser.parse_args()
+
+    server = {szenario: server_starten(APPS[szenario]) for szenario in args.szenario}
+    try:
+        ergebnisse = asyncio.run(lasttest(args, server))
+    finally:
+        for prozess, _ in server.values():
+            prozess.terminate()
+            prozess.wait()
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(ergebnisse, indent=1), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Startet eine App erst nach der Aufwärmphase.
+
+Aufruf im Wurzelverzeichnis des Repos, statt ``streamlit run``::
+
+    python werkzeuge/start.py Quadratiche-Gleichungen/Home.py [Optionen von streamlit run]
+
+Das Skript führt ``parabel.aufwaermen.aufwaermen()`` aus und startet danach im
+selben Prozess ``streamlit run`` mit den übrigen Argumenten. Pools, Plot-Slots
+und Caches sind damit schon warm, wenn der erste Besucher kommt. Streamlit
+kennt keinen eigenen Start-Hook; weil der Server erst nach dem Aufwärmen
+lauscht, meldet auch ``/_stcore/health`` erst dann Bereitschaft. Ein
+Load-Balancer schickt bei einem rollierenden Neustart also keinen Besucher zu
+einer kalten Instanz.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+def main():
+    if len(sys.argv) < 2:
+        sys.exit(__doc__)
+
+    from parabel.aufwaermen import aufwaermen
+
+    print("Aufgewärmt in Sekunden:", json.dumps(aufwaermen()), file=sys.stderr)
+
+    from streamlit.web import cli
+
+    sys.argv = ["streamlit", "run", *sys.argv[1:]]
+    sys.exit(cli.main())
+
+
+if __name__ == "__main__":
+    main()